@@ -1,17 +1,76 @@
+from bisect import bisect_left
 
+# batches against tables at least this large are searched in sorted query order, which keeps
+# consecutive probes close together in memory; smaller tables stay in cache either way
+SORT_QUERIES_THRESHOLD = 1 << 16
 
-def binary_search(list, item):
+
+def binary_search(list, item, key=None, reverse=False):
+    # with key, list is sorted by key(element) and item is a key, as in bisect
+    # with reverse, list is sorted in descending order
     low = 0
     high = len(list) - 1
 
     while low <= high:
         mid = (low + high) // 2
-        guess = list[mid]
+        guess = list[mid] if key is None else key(list[mid])
 
         if guess == item:
             return mid
-        if guess < item:
+        if (guess < item) != reverse:
             low = mid + 1
         else:
             high = mid - 1
-    return None
\ No newline at end of file
+    return None
+
+
+def batch_search(sorted_seq, queries):
+    """Look up many items at once, returning the index of each query in sorted_seq or None.
+
+    The queries are visited in sorted order, so each search only has to look at the part of
+    sorted_seq after the previous hit, like one pass of a merge. For duplicate keys the
+    leftmost index is returned. If sorted_seq is a NumPy array the whole batch is answered
+    with searchsorted and the result is an int64 array with -1 for the misses.
+    """
+    if hasattr(sorted_seq, "searchsorted"):
+        return batch_search_numpy(sorted_seq, queries)
+
+    n = len(sorted_seq)
+    results = [None] * len(queries)
+    order = sorted(range(len(queries)), key=queries.__getitem__)
+
+    low = 0
+    for query_index in order:
+        item = queries[query_index]
+        low = bisect_left(sorted_seq, item, low)
+        if low < n and sorted_seq[low] == item:
+            results[query_index] = low
+    return results
+
+
+def batch_search_numpy(sorted_seq, queries):
+    import numpy as np
+
+    queries = np.asarray(queries)
+    n = len(sorted_seq)
+    if n == 0:
+        return np.full(len(queries), -1, dtype=np.int64)
+
+    positions = searchsorted_batch(sorted_seq, queries, "left")
+    clipped = np.minimum(positions, n - 1)
+    found = (positions < n) & (sorted_seq[clipped] == queries)
+    return np.where(found, positions, -1).astype(np.int64)
+
+
+def searchsorted_batch(sorted_seq, queries, side="left"):
+    """np.searchsorted over the queries, visiting them in sorted order when the table is large."""
+    import numpy as np
+
+    queries = np.asarray(queries)
+    if len(sorted_seq) < SORT_QUERIES_THRESHOLD:
+        return np.searchsorted(sorted_seq, queries, side=side).astype(np.int64)
+
+    order = np.argsort(queries, kind="stable")
+    positions = np.empty(len(queries), dtype=np.int64)
+    positions[order] = np.searchsorted(sorted_seq, queries[order], side=side)
+    return positions
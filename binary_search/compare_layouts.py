@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Script to compare binary_search on a sorted list against the Eytzinger layout index
+for table sizes from L1-cache resident to far larger than the last-level cache.
+"""
+
+import argparse
+import random
+import time
+from typing import Dict
+from binary_search import binary_search, batch_search
+from eytzinger import EytzingerIndex
+
+def time_per_lookup(lookup, queries, repeats: int = 3) -> float:
+    """Return the best time per query, in nanoseconds, out of `repeats` runs of lookup(queries)."""
+    best = float("inf")
+    for _ in range(repeats):
+        start_time = time.perf_counter_ns()
+        lookup(queries)
+        best = min(best, time.perf_counter_ns() - start_time)
+    return best / len(queries)
+
+def compare_layouts(table_size: int, num_queries: int, repeats: int = 3) -> Dict[str, float]:
+    """Time single and batched lookups on the sorted layout and the Eytzinger layout.
+    
+    Args:
+        table_size: Number of int64 keys in the table (8 bytes each)
+        num_queries: Number of random queries, about half of them hits
+        repeats: Number of runs per method, the best one is reported
+        
+    Returns:
+        Dict mapping method names to nanoseconds per lookup
+    """
+    table = list(range(0, 2 * table_size, 2))
+    queries = [random.randrange(2 * table_size) for _ in range(num_queries)]
+    index = EytzingerIndex(table)
+    
+    results = {
+        "binary_search": time_per_lookup(lambda qs: [binary_search(table, q) for q in qs], queries, repeats),
+        "EytzingerIndex.search": time_per_lookup(lambda qs: [index.search(q) for q in qs], queries, repeats),
+    }
+    
+    try:
+        import numpy as np
+    except ImportError:
+        return results
+    
+    np_table = np.array(table, dtype=np.int64)
+    np_queries = np.array(queries, dtype=np.int64)
+    np_index = EytzingerIndex(np_table)
+    results["batch_search (numpy)"] = time_per_lookup(lambda qs: batch_search(np_table, qs), np_queries, repeats)
+    results["EytzingerIndex.batch_search"] = time_per_lookup(np_index.batch_search, np_queries, repeats)
+    return results
+
+def main():
+    """Compare the sorted and Eytzinger layouts across table sizes."""
+    parser = argparse.ArgumentParser(description="Compare binary_search against the Eytzinger layout index.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1 << 10, 1 << 14, 1 << 18, 1 << 22],
+                        help="List of table sizes to test (default: 1024 16384 262144 4194304, 8 KiB to 32 MiB of keys)")
+    parser.add_argument("--queries", type=int, default=100000, help="Number of queries per run (default: 100000)")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per method, the best is reported (default: 3)")
+    args = parser.parse_args()
+    
+    for size in args.sizes:
+        print(f"\nTable size: {size} keys ({size * 8 // 1024} KiB)")
+        for name, ns in compare_layouts(size, args.queries, args.repeats).items():
+            print(f"  {name:<30} {ns:8.1f} ns/lookup")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Script to compare a per-query binary_search loop against the batched search paths.
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, Dict, List
+from binary_search import binary_search, batch_search
+
+def per_query_loop(table, queries):
+    return [binary_search(table, item) for item in queries]
+
+def time_search(search_func: Callable, table, queries, repeats: int = 3) -> float:
+    """Return the best time out of `repeats` runs of search_func(table, queries)."""
+    best = float("inf")
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        search_func(table, queries)
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+def search_methods(table: List[int], queries: List[int]) -> Dict[str, tuple]:
+    """Map method names to (search function, table, queries) in the representation each one expects."""
+    methods = {
+        "binary_search loop": (per_query_loop, table, queries),
+        "batch_search (list)": (batch_search, table, queries),
+    }
+    try:
+        import numpy as np
+    except ImportError:
+        return methods
+    methods["batch_search (numpy)"] = (batch_search, np.array(table), np.array(queries))
+    return methods
+
+def compare_search(table_size: int, num_queries: int, hit_ratio: float = 0.5, repeats: int = 3) -> Dict[str, float]:
+    """Time every search method on the same sorted table and queries.
+    
+    Args:
+        table_size: Number of keys in the sorted table
+        num_queries: Number of queries in the batch
+        hit_ratio: Fraction of queries that are present in the table
+        repeats: Number of runs per method, the best one is reported
+        
+    Returns:
+        Dict mapping method names to times in seconds
+    """
+    table = sorted(random.sample(range(table_size * 10), table_size))
+    queries = [random.choice(table) if random.random() < hit_ratio else random.randrange(table_size * 10)
+               for _ in range(num_queries)]
+    
+    results = {}
+    for name, (search_func, method_table, method_queries) in search_methods(table, queries).items():
+        results[name] = time_search(search_func, method_table, method_queries, repeats)
+    return results
+
+def main():
+    """Compare the per-query and batched binary search paths."""
+    parser = argparse.ArgumentParser(description="Compare per-query binary search against batched search.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000],
+                        help="List of table sizes to test (default: 1000 100000 1000000)")
+    parser.add_argument("--queries", type=int, default=100000, help="Number of queries per batch (default: 100000)")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per method, the best is reported (default: 3)")
+    args = parser.parse_args()
+    
+    for size in args.sizes:
+        print(f"\nTable size: {size}, queries: {args.queries}")
+        results = compare_search(size, args.queries, repeats=args.repeats)
+        baseline = results["binary_search loop"]
+        for name, seconds in results.items():
+            print(f"  {name:<24} {seconds:.6f} seconds  {baseline / seconds:6.1f}x")
+
+if __name__ == "__main__":
+    main()
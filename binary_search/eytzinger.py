@@ -0,0 +1,152 @@
+from array import array
+
+
+class EytzingerIndex:
+    """A static search index that stores a sorted table in Eytzinger (BFS) order.
+
+    The table is laid out like an implicit binary heap: the root is at position 1 and the
+    children of position k are at 2k and 2k+1. The first few levels of the tree, which
+    every search touches, sit next to each other in memory, and the descent
+    k = 2k + (layout[k] < item) has no data-dependent branch. A search over a classic
+    sorted array instead jumps between distant midpoints, missing the cache on almost
+    every step once the table no longer fits in it.
+
+    Keys are stored in a compact typed buffer: an ndarray if the table is one, an `array`
+    of int64 or double if every key fits, otherwise a list.
+    """
+
+    def __init__(self, sorted_seq):
+        n = len(sorted_seq)
+        self.n = n
+        self.depth = n.bit_length()
+
+        # ranks[k] is the index in sorted_seq of the key stored at position k
+        ranks = eytzinger_ranks(n)
+
+        if hasattr(sorted_seq, "searchsorted"):
+            import numpy as np
+            self.ranks = np.frombuffer(ranks, dtype=np.int64)
+            self.layout = np.empty(n + 1, dtype=sorted_seq.dtype)
+            self.layout[1:] = sorted_seq[self.ranks[1:]]
+            self.layout[:1] = sorted_seq[:1] if n else 0
+        else:
+            self.ranks = ranks
+            typecode = layout_typecode(sorted_seq)
+            keys = [sorted_seq[0] if n else 0] + [sorted_seq[ranks[k]] for k in range(1, n + 1)]
+            self.layout = array(typecode, keys) if typecode else keys
+
+    def __len__(self):
+        return self.n
+
+    def __contains__(self, item):
+        return self.search(item) is not None
+
+    def descend(self, item, strict):
+        # position of the first key >= item (strict) or > item (not strict), or 0 if there is none
+        layout = self.layout
+        n = self.n
+        k = 1
+        if strict:
+            while k <= n:
+                k = 2 * k + (layout[k] < item)
+        else:
+            while k <= n:
+                k = 2 * k + (not item < layout[k])
+
+        # undo the trailing right turns (ones) and the last left turn (zero)
+        k = int(k)
+        return k >> (~k & (k + 1)).bit_length()
+
+    def lower_bound(self, item):
+        """Index in the sorted table of the first key >= item, len(table) if there is none."""
+        k = self.descend(item, True)
+        return int(self.ranks[k]) if k else self.n
+
+    def upper_bound(self, item):
+        """Index in the sorted table of the first key > item, len(table) if there is none."""
+        k = self.descend(item, False)
+        return int(self.ranks[k]) if k else self.n
+
+    def search(self, item):
+        """Index of item in the sorted table, or None, like binary_search (leftmost for duplicates)."""
+        k = self.descend(item, True)
+        if k and self.layout[k] == item:
+            return int(self.ranks[k])
+        return None
+
+    def batch_lower_bound(self, queries):
+        return self.batch_descend(queries, "left")
+
+    def batch_upper_bound(self, queries):
+        return self.batch_descend(queries, "right")
+
+    def batch_search(self, queries):
+        """Index of every query in the sorted table, or -1 when it is missing."""
+        import numpy as np
+
+        queries = np.asarray(queries)
+        layout, ranks = self.numpy_buffers()
+        positions = self.batch_positions(queries, "left")
+        found = (positions > 0) & (layout[positions] == queries)
+        return np.where(found, ranks[positions], -1)
+
+    def batch_descend(self, queries, side):
+        import numpy as np
+
+        _, ranks = self.numpy_buffers()
+        positions = self.batch_positions(np.asarray(queries), side)
+        return np.where(positions > 0, ranks[positions], self.n)
+
+    def numpy_buffers(self):
+        # ndarray views of the layout and ranks, without copying when they are typed buffers
+        import numpy as np
+
+        if not hasattr(self.layout, "searchsorted"):
+            self.layout = np.asarray(self.layout)
+            self.ranks = np.frombuffer(self.ranks, dtype=np.int64)
+        return self.layout, self.ranks
+
+    def batch_positions(self, queries, side):
+        """Descend the tree for all queries at once, one level per step (requires NumPy)."""
+        import numpy as np
+
+        layout, _ = self.numpy_buffers()
+        n = self.n
+        k = np.ones(len(queries), dtype=np.int64)
+        for _ in range(self.depth):
+            active = k <= n
+            probe = layout[np.where(active, k, 0)]
+            go_right = probe < queries if side == "left" else probe <= queries
+            k = np.where(active, 2 * k + go_right, k)
+
+        # k >> ffs(~k): the lowest zero bit of k marks the last left turn
+        lowest_zero = ~k & (k + 1)
+        shift = np.log2(lowest_zero).astype(np.int64) + 1
+        return k >> shift
+
+
+def eytzinger_ranks(n):
+    """Return an int64 array mapping each Eytzinger position 1..n to its index in sorted order."""
+    ranks = array("q", bytes(8 * (n + 1)))
+    stack = []
+    k = 1
+    i = 0
+
+    # an in-order walk of the implicit tree visits the positions in sorted order
+    while stack or k <= n:
+        while k <= n:
+            stack.append(k)
+            k *= 2
+        k = stack.pop()
+        ranks[k] = i
+        i += 1
+        k = 2 * k + 1
+    return ranks
+
+
+def layout_typecode(seq):
+    if all(type(x) is int and -(1 << 63) <= x < (1 << 63) for x in seq):
+        return "q"
+    if all(type(x) is float for x in seq):
+        return "d"
+    return None
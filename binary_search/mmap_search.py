@@ -0,0 +1,120 @@
+import mmap
+import struct
+from bisect import bisect_left, bisect_right
+
+
+class MappedSortedFile:
+    """Binary search over a file of fixed-width records sorted by key, without loading it.
+
+    The file is memory-mapped and only the records that a search probes are decoded, with
+    struct.unpack_from on a memoryview of the map. Opening the file is O(1): nothing is read
+    until the first search, and the pages that stay resident are the ones the searches touch.
+
+    If fence_every is set, every fence_every-th key is read once into a small in-memory list.
+    A search first bisects the fences and then only probes the file inside one block, which
+    saves the page faults of the first log2(n / fence_every) probes.
+
+    Args:
+        path: File of records sorted by key
+        key_format: struct format of the key, e.g. "<q" for little-endian int64
+        record_size: Size of each record in bytes (default: the size of the key)
+        key_offset: Offset of the key inside each record
+        fence_every: Keep every k-th key in memory (default: no fence index)
+    """
+
+    def __init__(self, path, key_format="<q", record_size=None, key_offset=0, fence_every=None):
+        self.key = struct.Struct(key_format)
+        self.record_size = record_size or self.key.size
+        self.key_offset = key_offset
+        if key_offset + self.key.size > self.record_size:
+            raise ValueError("Key does not fit inside the record")
+
+        self.file = open(path, "rb")
+        size = self.file.seek(0, 2)
+        if size % self.record_size:
+            self.file.close()
+            raise ValueError(f"File size {size} is not a multiple of the record size {self.record_size}")
+        self.n = size // self.record_size
+
+        # mmap can't map an empty file
+        self.map = None
+        self.view = memoryview(b"")
+        if size:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(self.map, "madvise") and hasattr(mmap, "MADV_RANDOM"):
+                self.map.madvise(mmap.MADV_RANDOM)  # bisection doesn't benefit from read-ahead
+            self.view = memoryview(self.map)
+
+        self.fence_every = fence_every
+        self.fences = None
+        if fence_every:
+            self.fences = [self.key_at(i) for i in range(0, self.n, fence_every)]
+
+    def __len__(self):
+        return self.n
+
+    def __contains__(self, item):
+        return self.search(item) is not None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.view.release()
+        if self.map is not None:
+            self.map.close()
+        self.file.close()
+
+    def key_at(self, i):
+        return self.key.unpack_from(self.view, i * self.record_size + self.key_offset)[0]
+
+    def record(self, i):
+        """The raw bytes of record i."""
+        start = i * self.record_size
+        return bytes(self.view[start:start + self.record_size])
+
+    def search(self, item):
+        """Index of the record with this key, or None, like binary_search (leftmost for duplicates)."""
+        i = self.lower_bound(item)
+        if i < self.n and self.key_at(i) == item:
+            return i
+        return None
+
+    def lower_bound(self, item):
+        """Index of the first record whose key is >= item, len(self) if there is none."""
+        low, high = self.block_bounds(bisect_left, item)
+        while low < high:
+            mid = (low + high) // 2
+            if self.key_at(mid) < item:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def upper_bound(self, item):
+        """Index of the first record whose key is > item, len(self) if there is none."""
+        low, high = self.block_bounds(bisect_right, item)
+        while low < high:
+            mid = (low + high) // 2
+            if item < self.key_at(mid):
+                high = mid
+            else:
+                low = mid + 1
+        return low
+
+    def count_range(self, low, high):
+        """Number of records with low <= key <= high."""
+        return max(0, self.upper_bound(high) - self.lower_bound(low))
+
+    def block_bounds(self, bisect, item):
+        # Range of record indexes that can hold the answer. With fences, the answer lies
+        # after fence j-1 and at or before fence j, where j is the fence bisection result.
+        if self.fences is None:
+            return 0, self.n
+        j = bisect(self.fences, item)
+        low = (j - 1) * self.fence_every + 1 if j else 0
+        high = min(j * self.fence_every, self.n)
+        return low, high
@@ -0,0 +1,88 @@
+from bisect import bisect_left, bisect_right
+
+from binary_search import batch_search, searchsorted_batch
+
+
+class SortedIndex:
+    """A sorted table that is built once and then queried many times.
+
+    Single queries use the C bisect module. Batch queries take any sequence of queries and
+    answer them in one call, with NumPy's searchsorted when the index holds an ndarray.
+    """
+
+    def __init__(self, values, presorted=False):
+        if hasattr(values, "searchsorted"):
+            self.keys = values if presorted else values.copy()
+            if not presorted:
+                self.keys.sort()
+        else:
+            self.keys = list(values) if presorted else sorted(values)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, item):
+        return self.find(item) is not None
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def bisect_left(self, item):
+        """Number of keys strictly less than item."""
+        return bisect_left(self.keys, item)
+
+    def bisect_right(self, item):
+        """Number of keys less than or equal to item."""
+        return bisect_right(self.keys, item)
+
+    def find(self, item):
+        """Index of the leftmost key equal to item, or None, like binary_search."""
+        i = bisect_left(self.keys, item)
+        if i < len(self.keys) and self.keys[i] == item:
+            return i
+        return None
+
+    def count(self, item):
+        return bisect_right(self.keys, item) - bisect_left(self.keys, item)
+
+    def count_range(self, low, high, inclusive=(True, True)):
+        """Number of keys between low and high, including the ends selected by inclusive."""
+        start = bisect_left(self.keys, low) if inclusive[0] else bisect_right(self.keys, low)
+        stop = bisect_right(self.keys, high) if inclusive[1] else bisect_left(self.keys, high)
+        return max(0, stop - start)
+
+    def range(self, low, high):
+        """Keys k with low <= k <= high."""
+        return self.keys[bisect_left(self.keys, low):bisect_right(self.keys, high)]
+
+    def batch_bisect_left(self, queries):
+        return self.batch_bisect(queries, "left")
+
+    def batch_bisect_right(self, queries):
+        return self.batch_bisect(queries, "right")
+
+    def batch_find(self, queries):
+        """Index of each query, or None (-1 for an ndarray index), see batch_search."""
+        return batch_search(self.keys, queries)
+
+    def batch_count_range(self, lows, highs):
+        """Number of keys in [lows[i], highs[i]] for every i."""
+        starts = self.batch_bisect_left(lows)
+        stops = self.batch_bisect_right(highs)
+        if hasattr(starts, "clip"):
+            return (stops - starts).clip(0)
+        return [max(0, stop - start) for start, stop in zip(starts, stops)]
+
+    def batch_bisect(self, queries, side):
+        if hasattr(self.keys, "searchsorted"):
+            return searchsorted_batch(self.keys, queries, side)
+
+        # visit the queries in sorted order so each search starts where the previous one ended
+        bisect = bisect_left if side == "left" else bisect_right
+        keys = self.keys
+        results = [0] * len(queries)
+        low = 0
+        for query_index in sorted(range(len(queries)), key=queries.__getitem__):
+            low = bisect(keys, queries[query_index], low)
+            results[query_index] = low
+        return results
@@ -1,5 +1,5 @@
 import pytest
-from binary_search import binary_search
+from binary_search import binary_search, batch_search
 
 def test_binary_search_found():
     array = [1, 3, 5, 7, 9]
@@ -24,4 +24,49 @@ def test_binary_search_single_element_found():
 def test_binary_search_single_element_not_found():
     array = [42]
     target = 13
-    assert binary_search(array, target) == None  # Single element mismatch
\ No newline at end of file
+    assert binary_search(array, target) == None  # Single element mismatch
+
+def test_batch_search_matches_binary_search():
+    array = [1, 3, 5, 7, 9]
+    queries = [9, 4, 1, 5, 10, 0, 7]
+    assert batch_search(array, queries) == [binary_search(array, q) for q in queries]  # Results in query order
+
+def test_batch_search_empty_inputs():
+    assert batch_search([], [1, 2]) == [None, None]  # Empty array
+    assert batch_search([1, 2], []) == []  # No queries
+
+def test_batch_search_duplicates():
+    array = [1, 2, 2, 2, 3]
+    assert batch_search(array, [2, 2]) == [1, 1]  # Leftmost index of a duplicate key
+
+def test_batch_search_random():
+    import random
+    random.seed(42)  # For reproducibility
+    array = sorted(random.sample(range(100000), 5000))
+    queries = [random.randrange(100000) for _ in range(2000)]
+    expected = [array.index(q) if q in set(array) else None for q in queries]
+    assert batch_search(array, queries) == expected
+
+def test_batch_search_numpy():
+    np = pytest.importorskip("numpy")
+    array = np.array([1, 3, 5, 7, 9])
+    result = batch_search(array, [9, 4, 1, 10, 0])
+    assert result.tolist() == [4, -1, 0, -1, -1]  # Misses are -1 in the NumPy path
+    assert batch_search(np.array([], dtype=np.int64), [1]).tolist() == [-1]
+
+def test_batch_search_numpy_large_table():
+    np = pytest.importorskip("numpy")
+    array = np.arange(0, 200000, 2)  # Large enough to search the queries in sorted order
+    queries = np.array([199998, 3, 0, 100000, 200000])
+    assert batch_search(array, queries).tolist() == [99999, -1, 0, 50000, -1]
+
+def test_binary_search_key():
+    records = [("a", 1), ("b", 3), ("c", 5), ("d", 7)]
+    assert binary_search(records, 5, key=lambda r: r[1]) == 2  # item is compared with key(element)
+    assert binary_search(records, 4, key=lambda r: r[1]) == None
+
+def test_binary_search_reverse():
+    array = [9, 7, 5, 3, 1]
+    assert binary_search(array, 3, reverse=True) == 3  # Descending array
+    assert binary_search(array, 9, reverse=True) == 0
+    assert binary_search(array, 4, reverse=True) == None
@@ -0,0 +1,59 @@
+import pytest
+from bisect import bisect_left, bisect_right
+from binary_search import binary_search
+from eytzinger import EytzingerIndex, eytzinger_ranks
+
+def test_eytzinger_ranks():
+    # positions 1..7 of a full tree hold sorted indexes 3, 1, 5, 0, 2, 4, 6
+    assert list(eytzinger_ranks(7))[1:] == [3, 1, 5, 0, 2, 4, 6]
+    assert list(eytzinger_ranks(0)) == [0]
+
+def test_eytzinger_search_found():
+    index = EytzingerIndex([1, 3, 5, 7, 9])
+    assert index.search(5) == 2  # Same index as binary_search
+    assert 9 in index
+
+def test_eytzinger_search_not_found():
+    index = EytzingerIndex([1, 3, 5, 7, 9])
+    assert index.search(4) == None
+    assert index.search(0) == None
+    assert index.search(10) == None
+
+def test_eytzinger_empty_and_single():
+    assert EytzingerIndex([]).search(1) == None
+    assert EytzingerIndex([]).lower_bound(1) == 0
+    assert EytzingerIndex([42]).search(42) == 0
+    assert EytzingerIndex([42]).search(13) == None
+
+def test_eytzinger_matches_binary_search_and_bisect():
+    import random
+    random.seed(42)  # For reproducibility
+    for size in (2, 3, 7, 8, 15, 16, 100, 1000):
+        table = sorted(random.sample(range(size * 4), size))
+        index = EytzingerIndex(table)
+        for item in range(-1, size * 4 + 1):
+            assert index.search(item) == binary_search(table, item)
+            assert index.lower_bound(item) == bisect_left(table, item)
+            assert index.upper_bound(item) == bisect_right(table, item)
+
+def test_eytzinger_duplicates():
+    table = [1, 2, 2, 2, 3]
+    index = EytzingerIndex(table)
+    assert index.search(2) == 1  # Leftmost of the duplicates
+    assert index.lower_bound(2) == 1
+    assert index.upper_bound(2) == 4
+
+def test_eytzinger_compact_storage():
+    from array import array
+    assert isinstance(EytzingerIndex([1, 2, 3]).layout, array)  # Ints are packed into an int64 array
+    assert isinstance(EytzingerIndex([1.5, 2.5]).layout, array)
+    assert isinstance(EytzingerIndex(["a", "b"]).layout, list)  # Anything else stays a list
+
+def test_eytzinger_batch_queries():
+    np = pytest.importorskip("numpy")
+    table = [1, 2, 2, 2, 3, 8]
+    queries = [8, 0, 2, 9, 3, 4]
+    for index in (EytzingerIndex(table), EytzingerIndex(np.array(table))):
+        assert index.batch_lower_bound(queries).tolist() == [bisect_left(table, q) for q in queries]
+        assert index.batch_upper_bound(queries).tolist() == [bisect_right(table, q) for q in queries]
+        assert index.batch_search(queries).tolist() == [5, -1, 1, -1, 4, -1]
@@ -0,0 +1,85 @@
+import pytest
+import struct
+from bisect import bisect_left, bisect_right
+from mmap_search import MappedSortedFile
+
+def write_records(path, keys, record_format="<q"):
+    with open(path, "wb") as f:
+        for key in keys:
+            if record_format == "<q":
+                f.write(struct.pack(record_format, key))
+            else:
+                f.write(struct.pack(record_format, b"data", key))
+
+def test_mapped_search_found(tmp_path):
+    write_records(tmp_path / "keys.bin", [1, 3, 5, 7, 9])
+    with MappedSortedFile(tmp_path / "keys.bin") as table:
+        assert table.search(5) == 2  # Same index as binary_search
+        assert 9 in table
+
+def test_mapped_search_not_found(tmp_path):
+    write_records(tmp_path / "keys.bin", [1, 3, 5, 7, 9])
+    with MappedSortedFile(tmp_path / "keys.bin") as table:
+        assert table.search(4) == None
+        assert table.search(10) == None
+
+def test_mapped_search_empty_file(tmp_path):
+    write_records(tmp_path / "keys.bin", [])
+    with MappedSortedFile(tmp_path / "keys.bin", fence_every=4) as table:
+        assert len(table) == 0
+        assert table.search(1) == None  # Empty file should return None
+        assert table.lower_bound(1) == 0
+
+def test_mapped_search_records_with_payload(tmp_path):
+    keys = [-20, -3, 0, 0, 0, 8, 100]
+    write_records(tmp_path / "records.bin", keys, "<4sq")
+    with MappedSortedFile(tmp_path / "records.bin", "<q", record_size=12, key_offset=4) as table:
+        assert len(table) == len(keys)
+        assert table.search(0) == 2  # Leftmost of the duplicates
+        assert table.count_range(-3, 8) == 5
+        assert table.record(5) == struct.pack("<4sq", b"data", 8)
+
+def test_mapped_search_big_endian_keys(tmp_path):
+    with open(tmp_path / "keys.bin", "wb") as f:
+        for key in (10, 20, 30):
+            f.write(struct.pack(">I", key))
+    with MappedSortedFile(tmp_path / "keys.bin", ">I") as table:
+        assert table.search(20) == 1
+
+@pytest.mark.parametrize("fence_every", [None, 1, 3, 16, 1000])
+def test_mapped_search_matches_bisect(tmp_path, fence_every):
+    import random
+    random.seed(42)  # For reproducibility
+    keys = sorted(random.randint(0, 300) for _ in range(500))
+    write_records(tmp_path / "keys.bin", keys)
+    with MappedSortedFile(tmp_path / "keys.bin", fence_every=fence_every) as table:
+        for item in range(-1, 302):
+            assert table.lower_bound(item) == bisect_left(keys, item)
+            assert table.upper_bound(item) == bisect_right(keys, item)
+
+def test_fence_index_reduces_probes(tmp_path):
+    write_records(tmp_path / "keys.bin", list(range(0, 20000, 2)))
+
+    class CountingFile(MappedSortedFile):
+        probes = 0
+
+        def key_at(self, i):
+            CountingFile.probes += 1
+            return super().key_at(i)
+
+    with CountingFile(tmp_path / "keys.bin") as table:
+        CountingFile.probes = 0
+        table.search(12346)
+        without_fences = CountingFile.probes
+    with CountingFile(tmp_path / "keys.bin", fence_every=64) as table:
+        CountingFile.probes = 0
+        table.search(12346)
+        with_fences = CountingFile.probes
+    assert with_fences < without_fences  # Only the probes inside one block touch the file
+
+def test_mapped_search_invalid_layout(tmp_path):
+    (tmp_path / "keys.bin").write_bytes(b"123")
+    with pytest.raises(ValueError):
+        MappedSortedFile(tmp_path / "keys.bin")  # Not a whole number of records
+    with pytest.raises(ValueError):
+        MappedSortedFile(tmp_path / "keys.bin", record_size=8, key_offset=4)  # Key overflows the record
@@ -0,0 +1,48 @@
+import pytest
+from sorted_index import SortedIndex
+
+def test_sorted_index_sorts_values():
+    index = SortedIndex([5, 1, 3])
+    assert list(index) == [1, 3, 5]
+    assert len(index) == 3
+
+def test_sorted_index_find():
+    index = SortedIndex([1, 3, 5, 7, 9], presorted=True)
+    assert index.find(5) == 2
+    assert index.find(4) == None  # Same result as binary_search for a miss
+    assert 7 in index
+    assert 8 not in index
+
+def test_sorted_index_bisect():
+    index = SortedIndex([1, 2, 2, 2, 3])
+    assert index.bisect_left(2) == 1
+    assert index.bisect_right(2) == 4
+    assert index.count(2) == 3
+    assert index.count(4) == 0
+
+def test_sorted_index_range_queries():
+    index = SortedIndex([1, 3, 5, 7, 9])
+    assert index.count_range(3, 7) == 3
+    assert index.count_range(3, 7, inclusive=(False, False)) == 1
+    assert index.count_range(7, 3) == 0  # Empty range
+    assert index.range(2, 8) == [3, 5, 7]
+
+def test_sorted_index_batch_queries():
+    index = SortedIndex([1, 2, 2, 2, 3, 8])
+    queries = [8, 0, 2, 9, 3]
+    assert index.batch_bisect_left(queries) == [index.bisect_left(q) for q in queries]
+    assert index.batch_bisect_right(queries) == [index.bisect_right(q) for q in queries]
+    assert index.batch_find(queries) == [5, None, 1, None, 4]
+    assert index.batch_count_range([0, 2, 4], [2, 3, 7]) == [4, 4, 0]
+
+def test_sorted_index_numpy():
+    np = pytest.importorskip("numpy")
+    values = np.array([9, 1, 5, 3, 7])
+    index = SortedIndex(values)
+    assert values.tolist() == [9, 1, 5, 3, 7]  # The caller's array is not modified
+    assert index.find(5) == 2
+    queries = np.array([8, 0, 5, 9])
+    assert index.batch_bisect_left(queries).tolist() == [4, 0, 2, 4]
+    assert index.batch_bisect_right(queries).tolist() == [4, 0, 3, 5]
+    assert index.batch_find(queries).tolist() == [-1, -1, 2, 4]
+    assert index.batch_count_range(np.array([0, 6]), np.array([5, 6])).tolist() == [3, 0]
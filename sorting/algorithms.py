@@ -0,0 +1,58 @@
+"""
+Registry of the sorting algorithms in this package.
+
+The registry lives outside of sorting_performance so that it can be imported
+without the plotting dependencies, e.g. from worker processes.
+"""
+
+from functools import partial
+from typing import Callable, Dict
+
+# Import sorting algorithms
+from sorting.insertion_sort.insertion_sort import insertion_sort
+from sorting.quick_sort.quick_sort import quick_sort, quick_sort_in_place
+from sorting.merge_sort.merge_sort import merge_sort, bottom_up_merge_sort
+from sorting.selection_sort.selection_sort import selection_sort
+from sorting.timsort.simplified_timsort import simplified_timsort
+from sorting.timsort.timsort import timsort
+from sorting.heap_sort.heap_sort import heap_sort
+from sorting.radix_sort.radix_sort import lsd_radix_sort, msd_radix_sort
+from sorting.counting_sort.counting_sort import counting_sort
+
+# Dictionary of sorting algorithms
+SORTING_ALGORITHMS: Dict[str, Callable] = {
+    "Insertion Sort": insertion_sort,
+    "Quick Sort": quick_sort,
+    "In-Place Quick Sort": quick_sort_in_place,
+    "Merge Sort": merge_sort,
+    "Bottom-Up Merge Sort": bottom_up_merge_sort,
+    "Selection Sort": selection_sort,
+    "Tim Sort": simplified_timsort,
+    "Full Tim Sort": timsort,
+    "Heap Sort": heap_sort,
+    "LSD Radix Sort": lsd_radix_sort,
+    "MSD Radix Sort": msd_radix_sort,
+    "Counting Sort": counting_sort,
+    # Add new sorting algorithms here as you implement them
+    # "Intro Sort": intro_sort,
+}
+
+# Algorithms that only sort integers (or integer keys); the others compare the elements
+INTEGER_SORTING_ALGORITHMS = ["LSD Radix Sort", "MSD Radix Sort", "Counting Sort"]
+
+# Algorithms that also have a vectorized backend="numpy" implementation (numpy is optional)
+NUMPY_SORTING_ALGORITHMS: Dict[str, Callable] = {
+    "Insertion Sort": partial(insertion_sort, backend="numpy"),
+    "Quick Sort": partial(quick_sort, backend="numpy"),
+    "Merge Sort": partial(merge_sort, backend="numpy"),
+    "Tim Sort": partial(simplified_timsort, backend="numpy"),
+}
+
+
+def resolve_algorithm(algorithm) -> Callable:
+    """Return the sort function for a name in SORTING_ALGORITHMS, or algorithm itself if it is callable."""
+    if callable(algorithm):
+        return algorithm
+    if algorithm not in SORTING_ALGORITHMS:
+        raise ValueError(f"Unknown sorting algorithm {algorithm!r}, expected one of {list(SORTING_ALGORITHMS)}")
+    return SORTING_ALGORITHMS[algorithm]
@@ -0,0 +1,293 @@
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import deque
+from itertools import chain
+
+# Add root directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from binary_search.binary_search import batch_search
+from sorting.algorithms import resolve_algorithm
+
+# seconds the first request of a batch waits for more requests to join it
+DEFAULT_WINDOW = 200e-6
+# a batch is run as soon as it holds this many requests
+DEFAULT_MAX_BATCH = 1024
+# latencies kept for the percentiles, the oldest are dropped first
+MAX_LATENCY_SAMPLES = 100_000
+
+
+def batch_sort(arrays, algorithm="Tim Sort"):
+    """Sort every list in arrays, returning new sorted lists in the same order.
+
+    With NumPy installed, a batch whose items are all ints that fit in int64 (or all fit
+    in uint64) is sorted in one call: the items of all lists are put in one array and
+    sorted with lexsort by (list, item), then cut back into lists. Any other batch,
+    including one that mixes ints with floats or bools, is sorted list by list with
+    `algorithm` (a name from SORTING_ALGORITHMS or a module-level function), so every
+    list comes back with its own items.
+    """
+    lengths = [len(arr) for arr in arrays]
+    flat = list(chain.from_iterable(arrays))
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    # bool is a subclass of int, and floats would turn the ints into floats
+    if np is not None and flat and all(type(item) is int for item in flat):
+        try:
+            values = np.array(flat)
+        except OverflowError:
+            values = None
+        if values is not None and values.dtype in (np.int64, np.uint64):
+            owners = np.repeat(np.arange(len(arrays)), lengths)
+            # lexsort is stable and sorts by the last key first
+            flat = values[np.lexsort((values, owners))].tolist()
+            results = []
+            start = 0
+            for length in lengths:
+                results.append(flat[start:start + length])
+                start += length
+            return results
+    sort_func = resolve_algorithm(algorithm)
+    return [sort_func(list(arr)) for arr in arrays]
+
+
+def batch_lookup(sorted_seq, queries):
+    """batch_search, with None for the misses of a NumPy table too, like binary_search."""
+    results = batch_search(sorted_seq, queries)
+    if hasattr(results, "tolist"):
+        return [None if position < 0 else position for position in results.tolist()]
+    return results
+
+
+class ServiceMetrics:
+    """Throughput, latency percentiles and batch sizes of the requests of one kind."""
+
+    def __init__(self, max_samples=MAX_LATENCY_SAMPLES):
+        self.latencies = deque(maxlen=max_samples)
+        self.requests = 0
+        self.batches = 0
+        self.started = None
+        self.finished = None
+
+    def record_batch(self, submitted, finished):
+        # submitted: perf_counter_ns of each request of the batch, finished: when its results were set
+        if self.started is None:
+            self.started = min(submitted)
+        self.finished = finished
+        self.requests += len(submitted)
+        self.batches += 1
+        self.latencies.extend(finished - t for t in submitted)
+
+    def percentile(self, p):
+        """Latency in seconds that p percent of the recent requests stayed below (nearest rank)."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        rank = max(1, -(-len(ordered) * p // 100))
+        return ordered[int(rank) - 1] / 1e9
+
+    def throughput(self):
+        """Requests per second from the first request to the last result."""
+        if self.started is None or self.finished == self.started:
+            return None
+        return self.requests / ((self.finished - self.started) / 1e9)
+
+    def summary(self):
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "mean_batch": self.requests / self.batches if self.batches else None,
+            "throughput": self.throughput(),
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+        }
+
+
+class MicroBatcher:
+    """Collects the requests that arrive within a window and answers them with one call.
+
+    The first request of a batch starts a timer of window seconds; requests submitted
+    before it fires join the batch, which is then passed to handler as one list. Each
+    awaiting coroutine gets its own item of the returned list. If the handler raises, the
+    requests are run one at a time, so only the ones that raise fail. A batch that
+    reaches max_batch requests runs right away. With window=0 a batch holds the requests
+    submitted during one pass of the event loop.
+
+    The event loop can't wait for less than about a millisecond when it is idle (epoll
+    takes whole milliseconds), so a window below that only shortens batches on a busy loop.
+    """
+
+    def __init__(self, handler, window=DEFAULT_WINDOW, max_batch=DEFAULT_MAX_BATCH, metrics=None):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.handler = handler
+        self.window = window
+        self.max_batch = max_batch
+        self.metrics = ServiceMetrics() if metrics is None else metrics
+        self.pending = []
+        self.timer = None
+
+    async def submit(self, request):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((request, future, time.perf_counter_ns()))
+        if len(self.pending) >= self.max_batch:
+            self.flush()
+        elif self.timer is None:
+            if self.window > 0:
+                self.timer = loop.call_later(self.window, self.flush)
+            else:
+                self.timer = loop.call_soon(self.flush)
+        return await future
+
+    def flush(self):
+        """Run the pending requests as one batch now."""
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        batch, self.pending = self.pending, []
+        if not batch:
+            return
+        try:
+            results = self.handler([request for request, _, _ in batch])
+        except Exception as error:
+            if len(batch) == 1:
+                self.answer(batch[0][1], error=error)
+            else:
+                # one bad request mustn't fail the others, so the batch is run one by one
+                for request, future, _ in batch:
+                    try:
+                        self.answer(future, self.handler([request])[0])
+                    except Exception as error:
+                        self.answer(future, error=error)
+        else:
+            for (_, future, _), result in zip(batch, results):
+                self.answer(future, result)
+        self.metrics.record_batch([submitted for _, _, submitted in batch], time.perf_counter_ns())
+
+    @staticmethod
+    def answer(future, result=None, error=None):
+        # a request whose caller was cancelled is answered but not delivered
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+class BatchService:
+    """Search and sort requests from many coroutines, answered in micro-batches.
+
+    search(item) looks item up in a sorted table with batch_search, sort(items) sorts a
+    list with batch_sort. Concurrent calls of the same kind that arrive within window
+    seconds are answered with one call, which saves the per-call overhead of the Python
+    functions, and lets batch_search visit the queries in sorted order and batch_sort
+    use NumPy. The batches run on the event loop, so a large batch delays other work
+    on the loop for as long as it takes.
+    """
+
+    def __init__(self, table=(), window=DEFAULT_WINDOW, max_batch=DEFAULT_MAX_BATCH, algorithm="Tim Sort"):
+        self.table = table
+        self.algorithm = algorithm
+        self.searches = MicroBatcher(lambda queries: batch_lookup(self.table, queries), window, max_batch)
+        self.sorts = MicroBatcher(lambda arrays: batch_sort(arrays, self.algorithm), window, max_batch)
+
+    async def search(self, item):
+        """Index of item in the table (the leftmost if it occurs more than once), or None."""
+        return await self.searches.submit(item)
+
+    async def sort(self, items):
+        """A new sorted list of items."""
+        return await self.sorts.submit(items)
+
+    def metrics(self):
+        """Summary of the metrics of the search and sort requests, see ServiceMetrics.summary."""
+        return {"search": self.searches.metrics.summary(), "sort": self.sorts.metrics.summary()}
+
+
+async def handle_connection(service, reader, writer):
+    # one JSON request per line: {"id": 1, "op": "search", "item": 5} or
+    # {"id": 2, "op": "sort", "items": [3, 1, 2]}. Requests are answered as they complete,
+    # with {"id": 1, "result": 4} or {"id": 1, "error": "..."}
+    async def answer(request):
+        try:
+            if request["op"] == "search":
+                response = {"id": request["id"], "result": await service.search(request["item"])}
+            elif request["op"] == "sort":
+                response = {"id": request["id"], "result": await service.sort(request["items"])}
+            else:
+                response = {"id": request["id"], "error": f"unknown op {request['op']!r}"}
+        except Exception as error:
+            response = {"id": request.get("id"), "error": str(error)}
+        writer.write(json.dumps(response).encode() + b"\n")
+
+    tasks = set()
+    try:
+        while line := await reader.readline():
+            task = asyncio.create_task(answer(json.loads(line)))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        await asyncio.gather(*tasks)
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def serve_unix(service, path):
+    """Serve the requests of local clients on a Unix socket at path, see BatchClient."""
+    return await asyncio.start_unix_server(lambda reader, writer: handle_connection(service, reader, writer), path)
+
+
+class BatchClient:
+    """Client of serve_unix. Requests from many coroutines share one connection."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.waiting = {}
+        self.next_id = 0
+        self.receiver = asyncio.create_task(self.receive())
+
+    @classmethod
+    async def connect(cls, path):
+        reader, writer = await asyncio.open_unix_connection(path)
+        return cls(reader, writer)
+
+    async def receive(self):
+        try:
+            while line := await self.reader.readline():
+                response = json.loads(line)
+                future = self.waiting.pop(response["id"])
+                if "error" in response:
+                    future.set_exception(RuntimeError(response["error"]))
+                else:
+                    future.set_result(response["result"])
+        finally:
+            for future in self.waiting.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("connection to the batch service closed"))
+
+    async def request(self, message):
+        self.next_id += 1
+        message["id"] = self.next_id
+        future = asyncio.get_running_loop().create_future()
+        self.waiting[self.next_id] = future
+        self.writer.write(json.dumps(message).encode() + b"\n")
+        return await future
+
+    async def search(self, item):
+        return await self.request({"op": "search", "item": item})
+
+    async def sort(self, items):
+        return await self.request({"op": "sort", "items": items})
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self.receiver
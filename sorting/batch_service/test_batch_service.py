@@ -0,0 +1,109 @@
+import asyncio
+import os
+import socket
+import tempfile
+import pytest
+from batch_service import batch_sort, batch_lookup, ServiceMetrics, MicroBatcher, BatchService, serve_unix, BatchClient
+
+def test_batch_sort_ints():
+    arrays = [[3, 1, 2], [], [5, -4, 5, 0], [7]]
+    assert batch_sort(arrays) == [[1, 2, 3], [], [-4, 0, 5, 5], [7]]  # Each list sorted on its own
+    assert arrays[0] == [3, 1, 2]  # Inputs are not modified
+
+def test_batch_sort_floats_and_strings():
+    assert batch_sort([[2.5, float("inf"), -1.0], [0.5]]) == [[-1.0, 2.5, float("inf")], [0.5]]
+    assert batch_sort([["b", "a"], ["c"]]) == [["a", "b"], ["c"]]  # Falls back to sorting list by list
+
+def test_batch_sort_big_ints():
+    array = [10**30, -(10**30), 1]
+    assert batch_sort([array], "Merge Sort") == [sorted(array)]  # Doesn't fit in int64
+
+def test_batch_sort_mixed_int_float_batch():
+    result = batch_sort([[3, 1], [2.5], [2**62 + 1, 2**62]])
+    assert result == [[1, 3], [2.5], [2**62, 2**62 + 1]]  # A float in the batch doesn't turn the ints into floats
+    assert all(type(item) is int for item in result[0] + result[2])
+
+def test_batch_sort_out_of_int64_ints():
+    result = batch_sort([[2**63, 1], [5, 2**63 + 5]])
+    assert result == [[1, 2**63], [5, 2**63 + 5]]  # Fits in uint64
+    assert all(type(item) is int for row in result for item in row)
+    assert batch_sort([[2**64, -1], [3, 2]]) == [[-1, 2**64], [2, 3]]  # Fits in neither
+
+def test_batch_sort_bools_stay_bools():
+    assert batch_sort([[True, False], [2, 1]]) == [[False, True], [1, 2]]
+    assert type(batch_sort([[True, False], [2, 1]])[0][0]) is bool
+
+def test_batch_lookup_numpy_table():
+    np = pytest.importorskip("numpy")
+    assert batch_lookup(np.array([1, 3, 5]), [5, 2, 1]) == [2, None, 0]  # Misses are None, not -1
+
+def test_service_search_batches_concurrent_requests():
+    table = list(range(0, 200, 2))
+
+    async def run():
+        service = BatchService(table, window=0.001)
+        results = await asyncio.gather(*(service.search(item) for item in range(50)))
+        return results, service.metrics()["search"]
+
+    results, metrics = asyncio.run(run())
+    assert results == [item // 2 if item % 2 == 0 else None for item in range(50)]
+    assert metrics["requests"] == 50
+    assert metrics["batches"] < 50  # Concurrent requests share batches
+
+def test_service_sort():
+    async def run():
+        service = BatchService(window=0)
+        return await asyncio.gather(service.sort([3, 1, 2]), service.sort(["b", "a"]), service.sort([]))
+
+    assert asyncio.run(run()) == [[1, 2, 3], ["a", "b"], []]  # A batch may mix element types
+
+def test_max_batch_flushes_without_waiting():
+    async def run():
+        batcher = MicroBatcher(lambda batch: [x * 2 for x in batch], window=60, max_batch=4)
+        results = await asyncio.wait_for(asyncio.gather(*(batcher.submit(x) for x in range(8))), 5)
+        return results, batcher.metrics.batches
+
+    assert asyncio.run(run()) == ([0, 2, 4, 6, 8, 10, 12, 14], 2)  # Two full batches, no 60 s wait
+
+def test_handler_error_reaches_every_request():
+    def handler(batch):
+        raise ValueError("bad batch")
+
+    async def run():
+        batcher = MicroBatcher(handler, window=0)
+        return await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, ValueError) for result in results)
+
+def test_invalid_max_batch():
+    with pytest.raises(ValueError):
+        MicroBatcher(lambda batch: batch, max_batch=0)
+
+def test_metrics():
+    metrics = ServiceMetrics()
+    assert metrics.percentile(50) is None  # No requests yet
+    metrics.record_batch([0, 1_000_000, 2_000_000], 4_000_000)
+    summary = metrics.summary()
+    assert summary["requests"] == 3 and summary["batches"] == 1 and summary["mean_batch"] == 3
+    assert summary["p50"] == 0.003  # Latencies of 4, 3 and 2 ms
+    assert summary["p99"] == 0.004
+    assert summary["throughput"] == pytest.approx(750)  # 3 requests in 4 ms
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+def test_unix_socket_round_trip():
+    async def run(path):
+        server = await serve_unix(BatchService([1, 3, 5, 7], window=0.001), path)
+        client = await BatchClient.connect(path)
+        try:
+            return await asyncio.gather(client.search(5), client.search(4), client.sort([9, 8, 7]),
+                                        client.search([1]), return_exceptions=True)
+        finally:
+            await client.close()
+            server.close()
+            await server.wait_closed()
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = asyncio.run(run(os.path.join(directory, "batch.sock")))
+    assert results[:3] == [2, None, [7, 8, 9]]
+    assert isinstance(results[3], RuntimeError)  # A list can't be compared with the ints of the table
@@ -0,0 +1,150 @@
+"""
+Buffer-protocol inputs and the out= and inplace= arguments of the sorts.
+
+Called without out or inplace, every sort behaves as it always has on a list: some sort
+in place and some return a new list (see the table in the README). The sorts wrapped
+with buffer_sort also take:
+
+- inplace=True: sort arr itself and return it, whichever way the algorithm works
+- out=seq: leave arr alone, write the sorted items into seq and return seq. seq can be
+  a list or a writable buffer of the same length as arr
+
+Any writable object with the buffer protocol (array.array, memoryview, bytearray, mmap,
+shared memory) is always sorted in place, or into out. A read-only one, such as bytes,
+is sorted into a new list instead; inplace=True, or a read-only out, raises TypeError. Raw byte
+buffers are sorted as unsigned bytes; cast them first, e.g. memoryview(buf).cast("q")
+for int64 keys. The items are never boxed into a list of Python ints where that can be
+avoided:
+
+- with NumPy installed, backend="numpy" and the radix and counting sorts sort an
+  ndarray view of the buffer, without any copy
+- the in-place algorithms sort an array.array, which stores 8 bytes per int64 instead of
+  a 28-byte int object plus an 8-byte pointer. An array.array is sorted as it is, other
+  buffers are copied into one and back with two memcpys
+- only the algorithms that build new lists anyway (merge_sort and quick_sort with the
+  Python backend, selection_sort) sort a list of boxed items, written back afterwards
+"""
+
+import inspect
+from array import array
+from functools import wraps
+
+
+def is_buffer(obj):
+    """Whether obj exposes the buffer protocol. Lists and NumPy arrays are handled by the sorts themselves."""
+    if type(obj) is list or hasattr(obj, "dtype"):
+        return False
+    try:
+        memoryview(obj).release()
+    except TypeError:
+        return False
+    return True
+
+
+def typed_view(buf):
+    """Return a one-dimensional, contiguous memoryview of buf."""
+    view = memoryview(buf)
+    if view.ndim != 1 or not view.c_contiguous:
+        raise ValueError("only one-dimensional, contiguous buffers can be sorted")
+    return view
+
+
+def write_back(target, result):
+    """Copy the items of result into target, keeping the type of target, and return target."""
+    if isinstance(target, array):
+        target[:] = result if isinstance(result, array) else array(target.typecode, result)
+    elif isinstance(target, memoryview):
+        target[:] = memoryview(result if isinstance(result, array) else array(target.format, result))
+    else:
+        target[:] = result
+    return target
+
+
+def sort_into(sort_func, arr, out=None, inplace=False, in_place=True, ndarray=False, **arguments):
+    """Sort arr with sort_func in place or into out, see the module docstring.
+
+    Args:
+        sort_func: The unwrapped sort
+        arr: The items to sort
+        out: Where to write the sorted items instead of arr
+        inplace: Sort arr itself
+        in_place: Whether sort_func sorts in place, so it can sort an array.array directly
+        ndarray: Whether sort_func sorts a NumPy integer array in place by itself
+        arguments: The other arguments of sort_func, by name
+
+    Returns:
+        out if given, otherwise arr
+    """
+    if out is not None and inplace:
+        raise ValueError("out and inplace can't be used together")
+    target = arr if out is None else out
+    if out is not None and len(out) != len(arr):
+        raise ValueError(f"out has {len(out)} items, expected {len(arr)}")
+
+    if not is_buffer(target) and not hasattr(target, "dtype"):
+        source = arr if out is None else (arr.tolist() if hasattr(arr, "tolist") else list(arr))
+        result = sort_func(source, **arguments)
+        if result is not target:
+            target[:] = result
+        return target
+
+    view = typed_view(target)
+    if view.readonly:
+        if out is not None or inplace:
+            raise TypeError(f"can't sort a read-only {type(target).__name__} in place, pass a writable out=")
+        # nothing asked for arr itself to be sorted, so sort a copy, as the sorts do for a
+        # read-only sequence that isn't a buffer
+        items = view.tolist()
+        view.release()
+        return sort_func(items, **arguments)
+    if out is not None:
+        if is_buffer(arr) and typed_view(arr).format == view.format:
+            view[:] = typed_view(arr)
+        else:
+            write_back(view, arr)
+
+    use_numpy = arguments.get("backend") == "numpy" or (
+        ndarray and arguments.get("key") is None and not arguments.get("reverse"))
+    if use_numpy:
+        try:
+            import numpy as np
+        except ImportError:
+            use_numpy = False
+    if use_numpy:
+        values = np.asarray(view)
+        result = sort_func(values, **arguments)
+        if result is not values:
+            values[:] = result
+    elif in_place:
+        if isinstance(target, array):
+            # an array can't be resized, even by a slice assignment, while a view of it exists
+            view.release()
+            sort_func(target, **arguments)
+        else:
+            values = array(view.format)
+            values.frombytes(view.cast("B"))
+            sort_func(values, **arguments)
+            view[:] = memoryview(values)
+    else:
+        write_back(view, sort_func(view.tolist(), **arguments))
+    return target
+
+
+def buffer_sort(in_place=True, ndarray=False):
+    """Decorator that adds out= and inplace= to a sort and lets it sort buffers, see sort_into.
+
+    Lists without out or inplace go straight to the sort, so recursive calls stay cheap.
+    """
+    def decorator(sort_func):
+        signature = inspect.signature(sort_func)
+
+        @wraps(sort_func)
+        def wrapper(arr, *args, out=None, inplace=False, **kwargs):
+            if out is None and not inplace and not is_buffer(arr):
+                return sort_func(arr, *args, **kwargs)
+            arguments = signature.bind(arr, *args, **kwargs).arguments
+            del arguments[next(iter(signature.parameters))]
+            return sort_into(sort_func, arr, out, inplace, in_place, ndarray, **arguments)
+
+        return wrapper
+    return decorator
@@ -0,0 +1,86 @@
+import os
+import sys
+
+# Add root directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.buffers import buffer_sort, write_back
+
+# counting sort allocates one counter per possible key, so it refuses ranges larger than
+# this many counters per element (or than MIN_RANGE, for small inputs)
+MAX_RANGE_FACTOR = 16
+MIN_RANGE = 1 << 16
+
+
+@buffer_sort(ndarray=True)
+def counting_sort(arr, key=None, reverse=False):
+    """Sort integers from a small range in place, in O(n + k) for k possible keys.
+
+    Counts how often every key occurs and then writes each key out as many times as it was
+    counted, so there are no comparisons at all and inputs with few unique values are as
+    fast as any other. With key, the prefix sums of the counts give each item its output
+    position, which keeps equal keys in input order. reverse=True is stable as well.
+
+    arr can be a list, an array.array or a NumPy integer array (sorted with bincount).
+    Raises ValueError if the keys span more than max(MIN_RANGE, MAX_RANGE_FACTOR * n) values.
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+    if hasattr(arr, "dtype") and key is None and not reverse:
+        return numpy_counting_sort(arr)
+
+    values = arr.tolist() if hasattr(arr, "tolist") else list(arr)
+    keys = values if key is None else [key(x) for x in values]
+    lo = min(keys)
+    hi = max(keys)
+    check_range(lo, hi, n)
+
+    counts = [0] * (hi - lo + 1)
+    for k in keys:
+        counts[k - lo] += 1
+
+    if key is None and not reverse:
+        result = []
+        for offset, count in enumerate(counts):
+            if count:
+                result.extend([lo + offset] * count)
+        return write_back(arr, result)
+
+    # starting position of every key in the output
+    if reverse:
+        counts.reverse()
+    position = 0
+    for i, count in enumerate(counts):
+        counts[i] = position
+        position += count
+
+    result = [None] * n
+    for item, k in zip(values, keys):
+        slot = hi - k if reverse else k - lo
+        result[counts[slot]] = item
+        counts[slot] += 1
+    return write_back(arr, result)
+
+
+def check_range(lo, hi, n):
+    for k in (lo, hi):
+        if not isinstance(k, int):
+            raise TypeError(f"counting sort needs integer keys, got {type(k).__name__}")
+    if hi - lo + 1 > max(MIN_RANGE, MAX_RANGE_FACTOR * n):
+        raise ValueError(f"Key range {lo}..{hi} is too wide for counting sort of {n} items, use radix sort")
+
+
+def numpy_counting_sort(a):
+    """Counting sort of an integer ndarray in place, with bincount and repeat."""
+    import numpy as np
+
+    if a.dtype.kind not in "iu":
+        raise TypeError(f"counting sort needs integer keys, got {a.dtype}")
+    lo = int(a.min())
+    hi = int(a.max())
+    check_range(lo, hi, len(a))
+    # subtract in a's own dtype, lo as a Python int could push uint64 to float64
+    counts = np.bincount((a - a.dtype.type(lo)).astype(np.intp), minlength=hi - lo + 1)
+    a[:] = np.repeat(np.arange(lo, hi + 1, dtype=a.dtype), counts)
+    return a
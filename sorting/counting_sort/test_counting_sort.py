@@ -0,0 +1,83 @@
+import pytest
+from counting_sort import counting_sort
+
+def test_counting_sort_unsorted_array():
+    array = [5, 3, 6, 2, 10]
+    assert counting_sort(array.copy()) == [2, 3, 5, 6, 10]  # Should sort in ascending order
+
+def test_counting_sort_already_sorted():
+    array = [1, 2, 3, 4, 5]
+    assert counting_sort(array.copy()) == [1, 2, 3, 4, 5]  # Already sorted array
+
+def test_counting_sort_reverse_sorted():
+    array = [5, 4, 3, 2, 1]
+    assert counting_sort(array.copy()) == [1, 2, 3, 4, 5]  # Reverse sorted array
+
+def test_counting_sort_empty_array():
+    assert counting_sort([]) == []  # Empty array should return empty array
+
+def test_counting_sort_single_element():
+    assert counting_sort([42]) == [42]  # Single element array
+
+def test_counting_sort_duplicate_elements():
+    array = [3, 1, 3, 2, 5, 1]
+    assert counting_sort(array.copy()) == [1, 1, 2, 3, 3, 5]  # Array with duplicate elements
+
+def test_counting_sort_negative_numbers():
+    array = [5, -1, 3, -7, 0, 10]
+    assert counting_sort(array.copy()) == [-7, -1, 0, 3, 5, 10]  # Array with negative numbers
+
+def test_counting_sort_sorts_in_place():
+    array = [3, 1, 2]
+    assert counting_sort(array) is array
+    assert array == [1, 2, 3]
+
+def test_counting_sort_random_large_array():
+    import random
+    random.seed(42)  # For reproducibility
+    array = [random.randint(-5000, 5000) for _ in range(5000)]
+    assert counting_sort(array.copy()) == sorted(array)  # Random large array
+
+def test_counting_sort_typed_array():
+    from array import array
+    values = array("q", [2 ** 14, -3, 7, 0, -2 ** 14, 7])
+    assert counting_sort(values) is values  # array('q') is sorted in place
+    assert values == array("q", [-2 ** 14, -3, 0, 7, 7, 2 ** 14])
+
+def test_counting_sort_numpy_array():
+    np = pytest.importorskip("numpy")
+    values = np.array([9, -4, 0, 9, 2 ** 13, -2 ** 13, 1], dtype=np.int64)
+    assert counting_sort(values) is values
+    assert values.tolist() == sorted([9, -4, 0, 9, 2 ** 13, -2 ** 13, 1])
+
+def test_counting_sort_rejects_float_arrays():
+    np = pytest.importorskip("numpy")
+    from array import array
+    with pytest.raises(TypeError):
+        counting_sort(np.array([0.7, 0.2, 1.5]))  # Would truncate the floats
+    with pytest.raises(TypeError):
+        counting_sort(array("d", [0.7, 0.2, 1.5]))  # Buffers go through the NumPy path too
+
+def test_counting_sort_uint64_array():
+    np = pytest.importorskip("numpy")
+    values = np.array([2 ** 63 + 5, 2 ** 63, 2 ** 63 + 2, 2 ** 63], dtype=np.uint64)
+    assert counting_sort(values).tolist() == [2 ** 63, 2 ** 63, 2 ** 63 + 2, 2 ** 63 + 5]  # Above int64
+
+def test_counting_sort_few_unique_values():
+    import random
+    random.seed(5)
+    array = [random.choice([3, 17, 99]) for _ in range(2000)]
+    assert counting_sort(array.copy()) == sorted(array)
+
+def test_counting_sort_rejects_wide_range():
+    with pytest.raises(ValueError):
+        counting_sort([0, 10 ** 9])  # Would need a billion counters
+
+def test_counting_sort_bytes_out():
+    out = bytearray(5)
+    assert counting_sort(b"hello", out=out) is out  # Raw bytes are sorted as unsigned bytes
+    assert out == b"ehllo"
+
+def test_counting_sort_rejects_non_integers():
+    with pytest.raises(TypeError):
+        counting_sort([1.5, float("-inf"), float("inf")])  # Not a range that is too wide, but not integers
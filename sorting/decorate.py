@@ -0,0 +1,52 @@
+"""
+Decorate-sort-undecorate support for the key= and reverse= arguments of the sorts.
+
+Each key is computed exactly once and paired with the index of its item, and the sort
+runs on the (key, index) pairs. Tuples compare in C, first by key and then by index, so
+records can be sorted by a field without wrapping them in objects whose __lt__ calls back
+into Python on every comparison. Because no two pairs are equal, the index decides ties
+and every algorithm sorts stably with a key, including the ones that aren't stable
+otherwise (quick_sort_in_place, heap_sort).
+"""
+
+from sorting.buffers import write_back
+
+
+def decorate(arr, key=None, reverse=False):
+    """Pair every key with its index, or with its negated index when sorting in reverse.
+
+    A reverse sort sorts the pairs ascending and then reverses them. The negated index
+    makes equal keys come out in their original order after the reversal, as with
+    sorted(reverse=True).
+    """
+    keys = arr if key is None else [key(x) for x in arr]
+    if reverse:
+        return [(k, -i) for i, k in enumerate(keys)]
+    return [(k, i) for i, k in enumerate(keys)]
+
+
+def undecorate(arr, decorated, reverse=False):
+    """Return the items of arr in the order of the sorted pairs."""
+    if reverse:
+        return [arr[-i] for _, i in reversed(decorated)]
+    return [arr[i] for _, i in decorated]
+
+
+def sort_with_key(sort_func, arr, key=None, reverse=False, in_place=False):
+    """Sort arr by key with sort_func, computing each key once.
+
+    Args:
+        sort_func: A sort that takes a list and returns it sorted, in place or not
+        arr: The items to sort
+        key: Function computing the sort key of an item (default: the item itself)
+        reverse: Sort in descending order, keeping equal items in their original order
+        in_place: Write the result back into arr and return arr, for the sorts that sort in place
+
+    Returns:
+        The sorted items, arr itself if in_place
+    """
+    decorated = sort_func(decorate(arr, key, reverse))
+    result = undecorate(arr, decorated, reverse)
+    if in_place:
+        return write_back(arr, result)
+    return result
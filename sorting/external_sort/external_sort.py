@@ -0,0 +1,243 @@
+import heapq
+import itertools
+import os
+import sys
+import tempfile
+from array import array
+
+# Add root directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.algorithms import resolve_algorithm
+
+# keys are signed 64-bit integers, stored in native byte order in binary files and runs
+TYPECODE = "q"
+ITEM_SIZE = array(TYPECODE).itemsize
+
+# approximate bytes per key once loaded into a Python list: an 8 byte pointer plus a 28 byte int
+LIST_ITEM_MEMORY = 36
+
+FORMATS = ("binary", "text")
+
+
+def external_sort(input_path, output_path, file_format="binary", memory_budget=64 * 1024 * 1024,
+                  fan_in=16, algorithm="Tim Sort", temp_dir=None):
+    """Sort a file of int64 keys that may be larger than memory.
+
+    Runs are produced by loading chunks of at most `memory_budget` bytes, sorting each chunk
+    with `algorithm` (a name from SORTING_ALGORITHMS or a sort function) and spilling it to a
+    temporary binary file. Runs are then merged `fan_in` at a time with a heap until a single
+    pass can write the output, so the number of merge passes is ceil(log_fan_in(runs)).
+
+    Args:
+        input_path: File of native int64 keys ("binary") or one integer per line ("text")
+        output_path: Where to write the sorted keys, in the same format as the input
+        file_format: "binary" or "text"
+        memory_budget: Approximate number of bytes of keys and buffers held in memory at once
+        fan_in: Maximum number of runs merged together in one pass
+        algorithm: Sorting algorithm used to sort each chunk
+        temp_dir: Directory for the temporary run files (default: the system temp directory)
+
+    Returns:
+        List of dicts, one per pass, with the number of runs read and written and the bytes
+        read and written by that pass
+    """
+    if file_format not in FORMATS:
+        raise ValueError(f"Unknown file format {file_format!r}, expected one of {FORMATS}")
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+
+    sort_func = resolve_algorithm(algorithm)
+    chunk_items = max(1, memory_budget // LIST_ITEM_MEMORY)
+    # every run being merged plus the output gets an equal share of the budget
+    buffer_items = max(1, memory_budget // (ITEM_SIZE * (fan_in + 1)))
+
+    passes = []
+    with tempfile.TemporaryDirectory(dir=temp_dir) as work_dir:
+        runs, stats = create_runs(input_path, file_format, chunk_items, sort_func, work_dir)
+        passes.append(stats)
+
+        pass_number = 1
+        while len(runs) > fan_in:
+            runs, stats = merge_pass(runs, fan_in, buffer_items, work_dir, pass_number)
+            passes.append(stats)
+            pass_number += 1
+
+        with open(output_path, "wb") as output:
+            writer = KeyWriter(output, file_format, buffer_items)
+            bytes_read = merge_files(runs, writer, buffer_items)
+            writer.flush()
+        passes.append({
+            "pass": pass_number,
+            "phase": "final merge",
+            "runs_in": len(runs),
+            "runs_out": 1,
+            "bytes_read": bytes_read,
+            "bytes_written": writer.bytes_written,
+        })
+
+    return passes
+
+
+def create_runs(input_path, file_format, chunk_items, sort_func, work_dir):
+    runs = []
+    bytes_read = 0
+    bytes_written = 0
+
+    with open(input_path, "rb") as source:
+        while True:
+            chunk, chunk_bytes = read_chunk(source, file_format, chunk_items)
+            if not chunk_bytes:
+                break
+            bytes_read += chunk_bytes
+            # blank lines are skipped, so a chunk of them has no keys but isn't the end of the input
+            if not chunk:
+                continue
+
+            # the sorts disagree on whether they sort in place, so always use the return value
+            chunk = sort_func(chunk)
+
+            path = os.path.join(work_dir, f"run-0-{len(runs)}.bin")
+            with open(path, "wb") as run_file:
+                array(TYPECODE, chunk).tofile(run_file)
+            bytes_written += len(chunk) * ITEM_SIZE
+            runs.append(path)
+
+    stats = {
+        "pass": 0,
+        "phase": "run generation",
+        "runs_in": 0,
+        "runs_out": len(runs),
+        "bytes_read": bytes_read,
+        "bytes_written": bytes_written,
+    }
+    return runs, stats
+
+
+def read_chunk(source, file_format, chunk_items):
+    """Read up to chunk_items keys, returning them as a list along with the number of bytes read."""
+    if file_format == "binary":
+        data = source.read(chunk_items * ITEM_SIZE)
+        if len(data) % ITEM_SIZE:
+            raise ValueError(f"Binary input size is not a multiple of {ITEM_SIZE} bytes")
+        keys = array(TYPECODE)
+        keys.frombytes(data)
+        return keys.tolist(), len(data)
+
+    keys = []
+    chunk_bytes = 0
+    for line in itertools.islice(source, chunk_items):
+        chunk_bytes += len(line)
+        if line.strip():
+            keys.append(int(line))
+    return keys, chunk_bytes
+
+
+def merge_pass(runs, fan_in, buffer_items, work_dir, pass_number):
+    merged_runs = []
+    bytes_read = 0
+    bytes_written = 0
+
+    for group_start in range(0, len(runs), fan_in):
+        group = runs[group_start:group_start + fan_in]
+        path = os.path.join(work_dir, f"run-{pass_number}-{len(merged_runs)}.bin")
+        with open(path, "wb") as output:
+            writer = KeyWriter(output, "binary", buffer_items)
+            bytes_read += merge_files(group, writer, buffer_items)
+            writer.flush()
+        bytes_written += writer.bytes_written
+        merged_runs.append(path)
+
+        # the inputs of this pass are not needed anymore
+        for run in group:
+            os.remove(run)
+
+    stats = {
+        "pass": pass_number,
+        "phase": "intermediate merge",
+        "runs_in": len(runs),
+        "runs_out": len(merged_runs),
+        "bytes_read": bytes_read,
+        "bytes_written": bytes_written,
+    }
+    return merged_runs, stats
+
+
+def merge_files(paths, writer, buffer_items):
+    """Heap-merge the sorted run files in paths into writer and return the number of bytes read."""
+    files = [open(path, "rb") for path in paths]
+    try:
+        readers = [read_run(f, buffer_items) for f in files]
+        for key in heapq.merge(*readers):
+            writer.write(key)
+        return sum(f.tell() for f in files)
+    finally:
+        for f in files:
+            f.close()
+
+
+def read_run(run_file, buffer_items):
+    # yield the keys of a run, reading buffer_items keys from disk at a time
+    while True:
+        block = array(TYPECODE)
+        block.frombytes(run_file.read(buffer_items * ITEM_SIZE))
+        if not block:
+            return
+        yield from block
+
+
+class KeyWriter:
+    """Buffers keys in memory and writes them out in blocks of buffer_items."""
+
+    def __init__(self, output, file_format, buffer_items):
+        self.output = output
+        self.file_format = file_format
+        self.buffer_items = buffer_items
+        self.buffer = array(TYPECODE)
+        self.bytes_written = 0
+
+    def write(self, key):
+        self.buffer.append(key)
+        if len(self.buffer) >= self.buffer_items:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        if self.file_format == "binary":
+            data = self.buffer.tobytes()
+        else:
+            data = "".join(f"{key}\n" for key in self.buffer).encode()
+        self.output.write(data)
+        self.bytes_written += len(data)
+        self.buffer = array(TYPECODE)
+
+
+def print_passes(passes):
+    print(f"{'Pass':>4}  {'Phase':<20} {'Runs in':>8} {'Runs out':>9} {'Bytes read':>14} {'Bytes written':>14}")
+    for stats in passes:
+        print(f"{stats['pass']:>4}  {stats['phase']:<20} {stats['runs_in']:>8} {stats['runs_out']:>9} "
+              f"{stats['bytes_read']:>14} {stats['bytes_written']:>14}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sort a file of int64 keys that does not fit in memory.")
+    parser.add_argument("input", help="File to sort")
+    parser.add_argument("output", help="Where to write the sorted file")
+    parser.add_argument("--format", choices=FORMATS, default="binary",
+                        help="binary: native int64 keys, text: one integer per line (default: binary)")
+    parser.add_argument("--memory", type=int, default=64, help="Memory budget in MiB (default: 64)")
+    parser.add_argument("--fan-in", type=int, default=16, help="Runs merged together per pass (default: 16)")
+    parser.add_argument("--algorithm", default="Tim Sort", help="Algorithm used to sort each run (default: Tim Sort)")
+    parser.add_argument("--temp-dir", default=None, help="Directory for temporary run files")
+    args = parser.parse_args()
+
+    passes = external_sort(args.input, args.output, args.format, args.memory * 1024 * 1024,
+                           args.fan_in, args.algorithm, args.temp_dir)
+    print_passes(passes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import pytest
+import random
+from array import array
+from external_sort import external_sort, ITEM_SIZE, LIST_ITEM_MEMORY
+
+def write_binary(path, keys):
+    with open(path, "wb") as f:
+        array("q", keys).tofile(f)
+
+def read_binary(path):
+    keys = array("q")
+    with open(path, "rb") as f:
+        keys.frombytes(f.read())
+    return keys.tolist()
+
+def test_external_sort_single_run(tmp_path):
+    keys = [5, 3, 6, 2, 10]
+    write_binary(tmp_path / "in.bin", keys)
+    passes = external_sort(tmp_path / "in.bin", tmp_path / "out.bin")
+    assert read_binary(tmp_path / "out.bin") == [2, 3, 5, 6, 10]  # Should sort in ascending order
+    assert len(passes) == 2  # Run generation and the final merge
+
+def test_external_sort_empty_file(tmp_path):
+    write_binary(tmp_path / "in.bin", [])
+    external_sort(tmp_path / "in.bin", tmp_path / "out.bin")
+    assert read_binary(tmp_path / "out.bin") == []  # Empty file should give an empty file
+
+def test_external_sort_multiple_merge_passes(tmp_path):
+    random.seed(42)  # For reproducibility
+    keys = [random.randint(-2**63, 2**63 - 1) for _ in range(5000)]
+    write_binary(tmp_path / "in.bin", keys)
+
+    # 100 keys per run gives 50 runs, merged 4 at a time: 50 -> 13 -> 4 -> 1
+    passes = external_sort(tmp_path / "in.bin", tmp_path / "out.bin",
+                           memory_budget=100 * LIST_ITEM_MEMORY, fan_in=4)
+    assert read_binary(tmp_path / "out.bin") == sorted(keys)
+    assert [p["runs_out"] for p in passes] == [50, 13, 4, 1]
+
+def test_external_sort_reports_bytes_per_pass(tmp_path):
+    keys = list(range(1000, 0, -1))
+    write_binary(tmp_path / "in.bin", keys)
+    passes = external_sort(tmp_path / "in.bin", tmp_path / "out.bin",
+                           memory_budget=100 * LIST_ITEM_MEMORY, fan_in=3)
+    for stats in passes:
+        assert stats["bytes_read"] == len(keys) * ITEM_SIZE  # Every pass reads the whole data once
+        assert stats["bytes_written"] == len(keys) * ITEM_SIZE
+
+def test_external_sort_text_format(tmp_path):
+    random.seed(1)
+    keys = [random.randint(-1000, 1000) for _ in range(777)]
+    (tmp_path / "in.txt").write_text("".join(f"{k}\n" for k in keys))
+    external_sort(tmp_path / "in.txt", tmp_path / "out.txt", file_format="text",
+                  memory_budget=50 * LIST_ITEM_MEMORY, fan_in=5)
+    assert [int(line) for line in (tmp_path / "out.txt").read_text().split()] == sorted(keys)
+
+def test_external_sort_text_blank_lines_longer_than_a_chunk(tmp_path):
+    (tmp_path / "in.txt").write_text("\n" * 5 + "3\n1\n\n2\n")
+    # 2 lines per chunk, so the first chunks hold no keys at all
+    external_sort(tmp_path / "in.txt", tmp_path / "out.txt", file_format="text",
+                  memory_budget=2 * LIST_ITEM_MEMORY)
+    assert (tmp_path / "out.txt").read_text() == "1\n2\n3\n"  # Keys after the blank lines aren't lost
+
+def test_external_sort_with_each_algorithm(tmp_path):
+    random.seed(7)
+    keys = [random.randint(0, 100) for _ in range(300)]
+    write_binary(tmp_path / "in.bin", keys)
+    for algorithm in ("Insertion Sort", "Quick Sort", "Merge Sort", "Selection Sort", "Tim Sort"):
+        external_sort(tmp_path / "in.bin", tmp_path / "out.bin", algorithm=algorithm,
+                      memory_budget=64 * LIST_ITEM_MEMORY, fan_in=2)
+        assert read_binary(tmp_path / "out.bin") == sorted(keys)
+
+def test_external_sort_cleans_up_runs(tmp_path):
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    write_binary(tmp_path / "in.bin", list(range(500, 0, -1)))
+    external_sort(tmp_path / "in.bin", tmp_path / "out.bin", memory_budget=50 * LIST_ITEM_MEMORY,
+                  fan_in=2, temp_dir=work_dir)
+    assert list(work_dir.iterdir()) == []  # Temporary runs are removed
+
+def test_external_sort_invalid_arguments(tmp_path):
+    write_binary(tmp_path / "in.bin", [1])
+    with pytest.raises(ValueError):
+        external_sort(tmp_path / "in.bin", tmp_path / "out.bin", file_format="csv")
+    with pytest.raises(ValueError):
+        external_sort(tmp_path / "in.bin", tmp_path / "out.bin", fan_in=1)
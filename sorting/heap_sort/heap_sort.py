@@ -0,0 +1,55 @@
+import os
+import sys
+
+# Add root directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.buffers import buffer_sort
+from sorting.decorate import sort_with_key
+
+
+@buffer_sort()
+def heap_sort(arr, key=None, reverse=False):
+    if key is not None or reverse:
+        return sort_with_key(heap_sort, arr, key, reverse, in_place=True)
+
+    n = len(arr)
+
+    # build a max-heap, starting from the last node that has children
+    for start in range(n // 2 - 1, -1, -1):
+        sift_down(arr, start, n)
+
+    # move the largest element to the end and restore the heap on what is left
+    for end in range(n - 1, 0, -1):
+        arr[0], arr[end] = arr[end], arr[0]
+        sift_down(arr, 0, end)
+
+    return arr
+
+def heap_sort_range(arr, lo, hi):
+    """Heap sort of arr[lo:hi] in place; hi is exclusive, like a slice."""
+    n = hi - lo
+
+    # build a max-heap over arr[lo:hi]
+    for start in range(n // 2 - 1, -1, -1):
+        sift_down(arr, start, n, lo)
+
+    # repeatedly move the max to the end of the shrinking heap
+    for end in range(n - 1, 0, -1):
+        arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+        sift_down(arr, 0, end, lo)
+
+def sift_down(arr, root, size, offset=0):
+    # push the heap node root down until both children are smaller; the heap has size
+    # nodes and node i is stored at arr[offset + i]
+    value = arr[offset + root]
+    child = 2 * root + 1
+    while child < size:
+        if child + 1 < size and arr[offset + child] < arr[offset + child + 1]:
+            child += 1
+        if not value < arr[offset + child]:
+            break
+        arr[offset + root] = arr[offset + child]
+        root = child
+        child = 2 * root + 1
+    arr[offset + root] = value
@@ -0,0 +1,64 @@
+import pytest
+from heap_sort import heap_sort
+
+def test_heap_sort_unsorted_array():
+    array = [5, 3, 6, 2, 10]
+    assert heap_sort(array.copy()) == [2, 3, 5, 6, 10]  # Should sort in ascending order
+
+def test_heap_sort_already_sorted():
+    array = [1, 2, 3, 4, 5]
+    assert heap_sort(array.copy()) == [1, 2, 3, 4, 5]  # Already sorted array
+
+def test_heap_sort_reverse_sorted():
+    array = [5, 4, 3, 2, 1]
+    assert heap_sort(array.copy()) == [1, 2, 3, 4, 5]  # Reverse sorted array
+
+def test_heap_sort_empty_array():
+    array = []
+    assert heap_sort(array.copy()) == []  # Empty array should return empty array
+
+def test_heap_sort_single_element():
+    array = [42]
+    assert heap_sort(array.copy()) == [42]  # Single element array
+
+def test_heap_sort_duplicate_elements():
+    array = [3, 1, 3, 2, 5, 1]
+    assert heap_sort(array.copy()) == [1, 1, 2, 3, 3, 5]  # Array with duplicate elements
+
+def test_heap_sort_negative_numbers():
+    array = [5, -1, 3, -7, 0, 10]
+    assert heap_sort(array.copy()) == [-7, -1, 0, 3, 5, 10]  # Array with negative numbers
+
+def test_heap_sort_large_array():
+    array = list(range(100, 0, -1))  # 100 down to 1
+    assert heap_sort(array.copy()) == list(range(1, 101))  # Large array (100 elements)
+
+def test_heap_sort_same_elements():
+    array = [4, 4, 4, 4, 4]
+    assert heap_sort(array.copy()) == [4, 4, 4, 4, 4]  # Array with all same elements
+
+def test_heap_sort_sorts_in_place():
+    array = [3, 1, 2]
+    heap_sort(array)
+    assert array == [1, 2, 3]  # Input list is sorted in place
+
+def test_heap_sort_random_large_array():
+    import random
+    random.seed(42)  # For reproducibility
+    array = [random.randint(0, 1000) for _ in range(2000)]
+    assert heap_sort(array.copy()) == sorted(array)  # Random large array
+
+def test_heap_sort_mmap():
+    import mmap
+    from array import array
+    values = array("q", [5, -3, 6, 2, 10])
+    with mmap.mmap(-1, len(values) * values.itemsize) as mapped:
+        mapped[:] = values.tobytes()
+        view = memoryview(mapped).cast("q")
+        heap_sort(view)  # A memory-mapped buffer is sorted in place
+        assert view.tolist() == [-3, 2, 5, 6, 10]
+        view.release()
+
+def test_heap_sort_out_length():
+    with pytest.raises(ValueError):
+        heap_sort([3, 1, 2], out=[0] * 2)  # out must have as many items as the input
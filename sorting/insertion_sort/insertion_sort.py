@@ -1,6 +1,25 @@
+import os
+import sys
 
+# Add root directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.buffers import buffer_sort
+from sorting.decorate import sort_with_key
+
+
+@buffer_sort()
+def insertion_sort(arr, backend="python", key=None, reverse=False):
+    if key is not None or reverse:
+        if backend != "python":
+            raise ValueError("key and reverse are only supported by the python backend")
+        return sort_with_key(insertion_sort, arr, key, reverse, in_place=True)
+    if backend == "numpy":
+        from sorting.numpy_backend.numpy_backend import numpy_insertion_sort
+        return numpy_insertion_sort(arr)
+    if backend != "python":
+        raise ValueError(f"Unknown backend {backend!r}, expected 'python' or 'numpy'")
 
-def insertion_sort(arr):
     for i in range(1, len(arr)):
         temp = arr[i]
         j = i - 1
@@ -13,4 +32,15 @@ def insertion_sort(arr):
         # insert key into correct position
         arr[j + 1] = temp
 
-    return arr
\ No newline at end of file
+    return arr
+
+
+def insertion_sort_range(arr, lo, hi):
+    """Insertion sort of arr[lo:hi] in place; hi is exclusive, like a slice."""
+    for i in range(lo + 1, hi):
+        temp = arr[i]
+        j = i - 1
+        while j >= lo and temp < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = temp
@@ -35,4 +35,17 @@ def test_insertion_sort_large_array():
 
 def test_insertion_sort_same_elements():
     array = [4, 4, 4, 4, 4]
-    assert insertion_sort(array.copy()) == [4, 4, 4, 4, 4]  # Array with all same elements 
\ No newline at end of file
+    assert insertion_sort(array.copy()) == [4, 4, 4, 4, 4]  # Array with all same elements
+
+def test_insertion_sort_array_in_place():
+    from array import array
+    values = array("q", [5, -3, 6, 2, 10])
+    assert insertion_sort(values) is values  # Buffers are sorted in place
+    assert values.tolist() == [-3, 2, 5, 6, 10]
+
+def test_insertion_sort_out():
+    values = [5, 3, 6, 2, 10]
+    out = [0] * 5
+    assert insertion_sort(values, out=out) is out  # The sorted items are written into out
+    assert out == [2, 3, 5, 6, 10]
+    assert values == [5, 3, 6, 2, 10]  # The input is left alone
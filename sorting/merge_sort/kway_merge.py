@@ -0,0 +1,80 @@
+def kway_merge(*iterables, key=None, reverse=False):
+    """Lazily merge any number of sorted iterables into one sorted stream.
+
+    A generator: each item is pulled from its source only when the item before it has
+    been yielded, so memory stays O(k) for k sources and stopping early (breaking out of
+    the loop, islice, close()) never reads more than k items ahead. Sources that have a
+    close() method, like generators reading shard files, are closed when the merge ends.
+
+    The current item of every source is a leaf of a loser tree. Each internal node keeps
+    the source that lost the match played there, and the overall winner is kept above
+    the root. After the winner is yielded, only the matches on the path from its leaf to
+    the root are replayed: about log2(k) comparisons per item, against up to 2 log2(k)
+    for a binary heap.
+
+    Equal keys are yielded in the order of their sources, and in input order within a
+    source, so the merge is stable. key computes the sort key of an item, once per item.
+    With reverse=True the iterables must be sorted in descending order.
+    """
+    sources = [iter(iterable) for iterable in iterables]
+    k = len(sources)
+    items = [None] * k
+    # the entry of a source is (key, index), or (key, -index) with reverse, so that one tuple
+    # comparison in C also breaks ties in favour of the earlier source; None once exhausted
+    entries = [None] * k
+    sign = -1 if reverse else 1
+
+    def advance(i):
+        for item in sources[i]:
+            items[i] = item
+            entries[i] = (item if key is None else key(item), sign * i)
+            return
+        entries[i] = None
+
+    def beats(a, b):
+        # whether entry a wins its match against entry b; exhausted sources always lose
+        if a is None or b is None:
+            return b is None
+        return b < a if reverse else a < b
+
+    try:
+        if k == 0:
+            return
+        for i in range(k):
+            advance(i)
+
+        # leaf i sits at node k + i and internal nodes 1 .. k - 1 hold the losers
+        tree = [0] * k
+        winners = [0] * (2 * k)
+        for i in range(k):
+            winners[k + i] = i
+        for node in range(k - 1, 0, -1):
+            left, right = winners[2 * node], winners[2 * node + 1]
+            if beats(entries[left], entries[right]):
+                winners[node], tree[node] = left, right
+            else:
+                winners[node], tree[node] = right, left
+        winner = winners[1] if k > 1 else 0
+
+        done = object()
+        while entries[winner] is not None:
+            yield items[winner]
+            # advance inlined, this loop runs once per item
+            item = next(sources[winner], done)
+            if item is done:
+                entry = entries[winner] = None
+            else:
+                items[winner] = item
+                entry = entries[winner] = (item if key is None else key(item), sign * winner)
+            node = (winner + k) >> 1
+            while node:
+                other = entries[tree[node]]
+                if other is not None and (entry is None or (entry < other if reverse else other < entry)):
+                    tree[node], winner = winner, tree[node]
+                    entry = other
+                node >>= 1
+    finally:
+        for source in sources:
+            close = getattr(source, "close", None)
+            if close is not None:
+                close()
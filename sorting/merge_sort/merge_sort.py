@@ -1,24 +1,143 @@
+import os
+import sys
 
+# Add root directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-def merge_sort(arr):
+from sorting.buffers import buffer_sort
+from sorting.decorate import sort_with_key
+from sorting.insertion_sort.insertion_sort import insertion_sort_range
+
+
+@buffer_sort(in_place=False)
+def merge_sort(arr, backend="python", key=None, reverse=False):
+    if key is not None or reverse:
+        if backend != "python":
+            raise ValueError("key and reverse are only supported by the python backend")
+        return sort_with_key(merge_sort, arr, key, reverse, in_place=False)
+    if backend == "numpy":
+        from sorting.numpy_backend.numpy_backend import numpy_merge_sort
+        return numpy_merge_sort(arr)
+    if backend != "python":
+        raise ValueError(f"Unknown backend {backend!r}, expected 'python' or 'numpy'")
+
+    return merge_sort_list(arr)
+
+def merge_sort_list(arr):
+    # the recursion of merge_sort, so the checks above run once per sort instead of once per call
     if len(arr) < 2:
         return arr
     else:
         middle = len(arr) // 2
-        left = merge_sort(arr[:middle])
-        right = merge_sort(arr[middle:])
+        left = merge_sort_list(arr[:middle])
+        right = merge_sort_list(arr[middle:])
         return merge(left, right)
 
-def merge(left, right):
+def merge(left, right, key=None):
+    if key is not None:
+        return merge_by_key(left, right, key)
+
     new_arr = []
     i = j = 0
 
     while i < len(left) and j < len(right):
-        if left[i] < right[j]:
+        if left[i] <= right[j]: # take from the left on ties, which keeps the sort stable
             new_arr.append(left[i])
             i += 1
         else: # right smaller than left
             new_arr.append(right[j])
             j += 1
 
-    return new_arr + left[i:] + right[j:]
\ No newline at end of file
+    return new_arr + left[i:] + right[j:]
+
+def merge_by_key(left, right, key):
+    # merge, comparing the keys of the items; each key is computed once
+    left_keys = [key(x) for x in left]
+    right_keys = [key(x) for x in right]
+    new_arr = []
+    i = j = 0
+
+    while i < len(left) and j < len(right):
+        if left_keys[i] <= right_keys[j]:
+            new_arr.append(left[i])
+            i += 1
+        else:
+            new_arr.append(right[j])
+            j += 1
+
+    return new_arr + left[i:] + right[j:]
+
+
+# runs of this size are insertion sorted in place before the first merge pass
+RUN_SIZE = 16
+
+
+@buffer_sort()
+def bottom_up_merge_sort(arr, key=None, reverse=False):
+    """Sort arr in place with an iterative merge sort that allocates a single n-slot buffer.
+
+    Each pass merges neighbouring runs from one buffer into the other and then swaps their
+    roles, so no slices or intermediate lists are created. Pairs of runs that are already
+    in order (left[-1] <= right[0]) are copied across instead of merged.
+    """
+    if key is not None or reverse:
+        return sort_with_key(bottom_up_merge_sort, arr, key, reverse, in_place=True)
+
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    for lo in range(0, n, RUN_SIZE):
+        insertion_sort_range(arr, lo, min(lo + RUN_SIZE, n))
+
+    if n <= RUN_SIZE:
+        return arr
+
+    src = arr
+    dst = [None] * n
+    width = RUN_SIZE
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid == hi or not src[mid] < src[mid - 1]:
+                copy_range(src, dst, lo, hi)
+            else:
+                merge_into(src, dst, lo, mid, hi)
+        src, dst = dst, src
+        width *= 2
+
+    # after an odd number of passes the sorted data lives in the buffer
+    if src is not arr:
+        copy_range(src, arr, 0, n)
+
+    return arr
+
+def merge_into(src, dst, lo, mid, hi):
+    # merge src[lo:mid] and src[mid:hi] into dst[lo:hi], taking from the left run on ties
+    i = lo
+    j = mid
+    k = lo
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+        else:
+            dst[k] = src[i]
+            i += 1
+        k += 1
+
+    while i < mid:
+        dst[k] = src[i]
+        i += 1
+        k += 1
+
+    while j < hi:
+        dst[k] = src[j]
+        j += 1
+        k += 1
+
+def copy_range(src, dst, lo, hi):
+    # element by element so that no temporary slice is allocated
+    for k in range(lo, hi):
+        dst[k] = src[k]
@@ -0,0 +1,62 @@
+import pytest
+import itertools
+import random
+from kway_merge import kway_merge
+
+def test_kway_merge_sorted_lists():
+    assert list(kway_merge([1, 4, 7], [2, 5, 8], [3, 6, 9])) == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+
+def test_kway_merge_empty_sources():
+    assert list(kway_merge()) == []  # No sources
+    assert list(kway_merge([], [], [])) == []  # Only empty sources
+    assert list(kway_merge([], [2, 3], [], [1])) == [1, 2, 3]  # Some empty sources
+
+def test_kway_merge_single_source():
+    assert list(kway_merge([1, 2, 3])) == [1, 2, 3]
+
+def test_kway_merge_many_sources():
+    random.seed(4)
+    sources = [sorted(random.randint(0, 1000) for _ in range(random.randint(0, 50))) for _ in range(37)]
+    assert list(kway_merge(*sources)) == sorted(itertools.chain(*sources))  # Not a power of two
+
+def test_kway_merge_is_stable():
+    random.seed(5)
+    sources = [[(random.randint(0, 5), s) for _ in range(20)] for s in range(10)]
+    sources = [sorted(source, key=lambda r: r[0]) for source in sources]
+    expected = sorted(itertools.chain(*sources), key=lambda r: r[0])
+    assert list(kway_merge(*sources, key=lambda r: r[0])) == expected  # Ties in source order
+
+def test_kway_merge_reverse():
+    sources = [[9, 5, 1], [8, 5, 2], [7]]
+    assert list(kway_merge(*sources, reverse=True)) == [9, 8, 7, 5, 5, 2, 1]
+
+def test_kway_merge_pulls_lazily():
+    pulled = []
+
+    def source(values):
+        for value in values:
+            pulled.append(value)
+            yield value
+
+    merged = kway_merge(source(range(0, 1000, 2)), source(range(1, 1000, 2)))
+    assert list(itertools.islice(merged, 5)) == [0, 1, 2, 3, 4]
+    assert len(pulled) <= 7  # At most one item per source read ahead
+
+def test_kway_merge_closes_sources_on_early_exit():
+    closed = []
+
+    def source(values):
+        try:
+            yield from values
+        finally:
+            closed.append(True)
+
+    merged = kway_merge(source([1, 3]), source([2, 4]))
+    assert next(merged) == 1
+    merged.close()
+    assert closed == [True, True]  # Both generators were closed
+
+def test_kway_merge_infinite_sources():
+    evens = itertools.count(0, 2)
+    odds = itertools.count(1, 2)
+    assert list(itertools.islice(kway_merge(evens, odds), 6)) == [0, 1, 2, 3, 4, 5]  # Never materialized
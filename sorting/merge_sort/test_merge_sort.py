@@ -1,5 +1,5 @@
 import pytest
-from merge_sort import merge_sort
+from merge_sort import merge_sort, bottom_up_merge_sort, merge
 
 def test_merge_sort_unsorted_array():
     array = [5, 3, 6, 2, 10]
@@ -35,4 +35,57 @@ def test_merge_sort_large_array():
 
 def test_merge_sort_same_elements():
     array = [4, 4, 4, 4, 4]
-    assert merge_sort(array.copy()) == [4, 4, 4, 4, 4]  # Array with all same elements 
\ No newline at end of file
+    assert merge_sort(array.copy()) == [4, 4, 4, 4, 4]  # Array with all same elements 
+
+def test_bottom_up_merge_sort_unsorted_array():
+    array = [5, 3, 6, 2, 10]
+    assert bottom_up_merge_sort(array.copy()) == [2, 3, 5, 6, 10]  # Should sort in ascending order
+
+def test_bottom_up_merge_sort_edge_cases():
+    assert bottom_up_merge_sort([]) == []  # Empty array
+    assert bottom_up_merge_sort([42]) == [42]  # Single element array
+    assert bottom_up_merge_sort([4, 4, 4, 4, 4]) == [4, 4, 4, 4, 4]  # All same elements
+    assert bottom_up_merge_sort([5, -1, 3, -7, 0, 10]) == [-7, -1, 0, 3, 5, 10]  # Negative numbers
+
+def test_bottom_up_merge_sort_sorts_in_place():
+    array = list(range(100, 0, -1))
+    bottom_up_merge_sort(array)
+    assert array == list(range(1, 101))  # Input list is sorted in place
+
+def test_bottom_up_merge_sort_odd_and_even_pass_counts():
+    import random
+    random.seed(42)  # For reproducibility
+    for size in (17, 33, 64, 65, 100, 1000, 1025):
+        array = [random.randint(0, 100) for _ in range(size)]
+        assert bottom_up_merge_sort(array.copy()) == sorted(array)
+
+def test_bottom_up_merge_sort_uses_one_buffer():
+    import sys
+    import tracemalloc
+    array = list(range(20000, 0, -1))
+    tracemalloc.start()
+    bottom_up_merge_sort(array)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak <= sys.getsizeof([None] * len(array)) + 1024  # Exactly n extra slots, no slices
+
+def test_merge_with_key():
+    left = [("a", 1), ("b", 3)]
+    right = [("c", 1), ("d", 2)]
+    assert merge(left, right, key=lambda r: r[1]) == [("a", 1), ("c", 1), ("d", 2), ("b", 3)]  # Ties taken from the left
+
+def test_merge_sort_array_in_place():
+    from array import array
+    values = array("d", [2.5, -1.0, 3.25, 0.0])
+    assert merge_sort(values) is values  # Buffers are sorted in place, even by merge_sort
+    assert values.tolist() == [-1.0, 0.0, 2.5, 3.25]
+
+def test_bottom_up_merge_sort_read_only_out():
+    from array import array
+    source = bytes(array("q", [5, 3, 6, 2, 10]))
+    out = array("q", [0] * 5)
+    assert bottom_up_merge_sort(memoryview(source).cast("q"), out=out) is out  # A read-only source sorted into out
+    assert out.tolist() == [2, 3, 5, 6, 10]
+    assert bottom_up_merge_sort(memoryview(source).cast("q")) == [2, 3, 5, 6, 10]  # Without out, a new list
+    with pytest.raises(TypeError):
+        bottom_up_merge_sort(memoryview(source).cast("q"), inplace=True)  # It can't be sorted in place
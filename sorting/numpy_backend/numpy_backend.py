@@ -0,0 +1,234 @@
+import os
+import sys
+
+import numpy as np
+
+# Add root directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# Vectorized versions of the pure-Python sorts, selected with backend="numpy".
+# They work directly on typed ndarrays, so values are never boxed into Python objects.
+# Other inputs are converted once with np.asarray, and the result is handed back in
+# the same type: lists are sorted in place or returned as lists, like the Python backend.
+# NaNs are sorted to the end, as np.sort does, since they compare false with everything.
+
+# blocks up to this width are sorted or merged with all-pairs comparisons, which is
+# O(width^2) work per block but has no Python-level loop over blocks
+BROADCAST_WIDTH = 32
+# number of blocks compared at once, bounds the temporary boolean arrays to a few MB
+BROADCAST_BATCH = 4096
+
+
+def numpy_insertion_sort(arr):
+    """Binary insertion sort: searchsorted finds each insertion point, a vectorized slice move shifts the tail."""
+    a = arr if isinstance(arr, np.ndarray) else np.asarray(arr)
+    values, nans = split_nans(a)
+    if nans is not None:
+        a[:] = np.concatenate((numpy_insertion_sort(values), nans))
+        return sorted_in_place(arr, a)
+
+    for i in range(1, len(a)):
+        value = a[i]
+        if not value < a[i - 1]:
+            continue  # already in place, the common case for nearly sorted input
+        pos = int(np.searchsorted(a[:i], value, side="right"))
+        a[pos + 1:i + 1] = a[pos:i]
+        a[pos] = value
+    return sorted_in_place(arr, a)
+
+
+def numpy_merge_sort(arr):
+    """Bottom-up merge sort with vectorized merges; returns a new array."""
+    a, nans = split_nans(np.array(arr))
+    n = len(a)
+    width = 1
+
+    # narrow passes merge every pair of blocks at once
+    while width < n and width < BROADCAST_WIDTH:
+        a = merge_pass_broadcast(a, width)
+        width *= 2
+
+    # wide passes merge one pair at a time with searchsorted
+    while width < n:
+        out = np.empty_like(a)
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid == hi or not a[mid] < a[mid - 1]:
+                out[lo:hi] = a[lo:hi]
+            else:
+                merge_into(a[lo:mid], a[mid:hi], out[lo:hi])
+        a = out
+        width *= 2
+
+    return sorted_copy(arr, with_nans(a, nans))
+
+
+def numpy_quick_sort(arr):
+    """Quick sort with boolean-mask three-way partitioning; returns a new array."""
+    a, nans = split_nans(np.array(arr))
+    stack = [(0, len(a))]
+
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo <= BROADCAST_WIDTH:
+            a[lo:hi] = rank_sort(a[lo:hi])
+            continue
+
+        segment = a[lo:hi]
+        pivot = median_of_three(segment)
+        less = segment[segment < pivot]
+        greater = segment[segment > pivot]
+        lt = lo + len(less)
+        gt = hi - len(greater)
+
+        a[lo:lt] = less
+        a[lt:gt] = pivot
+        a[gt:hi] = greater
+
+        stack.append((lo, lt))
+        stack.append((gt, hi))
+
+    return sorted_copy(arr, with_nans(a, nans))
+
+
+def numpy_timsort(arr):
+    """Simplified timsort: min_run blocks are sorted all at once, then merged pairwise; sorts ndarrays in place."""
+    a = arr if isinstance(arr, np.ndarray) else np.asarray(arr)
+    n = len(a)
+    if n < 2:
+        return arr
+    values, nans = split_nans(a)
+    if nans is not None:
+        a[:] = np.concatenate((numpy_timsort(values), nans))
+        return sorted_in_place(arr, a)
+
+    min_run = find_min_run(n)
+    a[:] = sort_blocks(a, min_run)
+
+    size = min_run
+    while size < n:
+        for left in range(0, n, 2 * size):
+            mid = min(left + size, n)
+            right = min(left + 2 * size, n)
+            if mid < right and a[mid] < a[mid - 1]:
+                a[left:right] = merge_arrays(a[left:mid], a[mid:right])
+        size *= 2
+
+    return sorted_in_place(arr, a)
+
+
+def sorted_in_place(arr, a):
+    # a is arr itself for ndarrays, otherwise copy the sorted values back into the caller's sequence
+    if a is not arr:
+        arr[:] = a.tolist()
+    return arr
+
+
+def sorted_copy(arr, a):
+    return a if isinstance(arr, np.ndarray) else a.tolist()
+
+
+def split_nans(a):
+    """Split a float array into its other values and its NaNs (None if there are none).
+
+    The sorts compare with < and ==, which are false for NaN, so NaNs would be lost,
+    duplicated or left anywhere; they are set aside and put back at the end instead.
+    """
+    if a.dtype.kind in "fc":
+        mask = np.isnan(a)
+        if mask.any():
+            return a[~mask], a[mask]
+    return a, None
+
+
+def with_nans(a, nans):
+    return a if nans is None else np.concatenate((a, nans))
+
+
+def find_min_run(n):
+    # same rule as simplified_timsort: a run length from 16 to 32
+    r = 0
+    while n >= 32:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def merge_arrays(left, right):
+    """Stable merge of two sorted arrays using searchsorted to find every element's final position."""
+    out = np.empty(len(left) + len(right), dtype=np.result_type(left, right))
+    merge_into(left, right, out)
+    return out
+
+
+def merge_into(left, right, out):
+    # an element of left goes after the elements of right that are strictly smaller,
+    # an element of right goes after the elements of left that are smaller or equal
+    out[np.arange(len(left)) + np.searchsorted(right, left, side="left")] = left
+    out[np.arange(len(right)) + np.searchsorted(left, right, side="right")] = right
+
+
+def merge_pass_broadcast(a, width):
+    """Merge every pair of neighbouring sorted blocks of `width` elements in one vectorized step."""
+    n = len(a)
+    block = 2 * width
+    blocks = -(-n // block)
+
+    # pad with the maximum so the padding sorts to the end of the last block
+    padded = np.full(blocks * block, a.max(), dtype=a.dtype)
+    padded[:n] = a
+    pairs = padded.reshape(blocks, 2, width)
+    left = pairs[:, 0, :]
+    right = pairs[:, 1, :]
+
+    offsets = np.arange(width)
+
+    out = np.empty((blocks, block), dtype=a.dtype)
+    for start in range(0, blocks, BROADCAST_BATCH):
+        stop = min(start + BROADCAST_BATCH, blocks)
+        batch_left = left[start:stop]
+        batch_right = right[start:stop]
+        left_pos = offsets + (batch_right[:, None, :] < batch_left[:, :, None]).sum(axis=2)
+        right_pos = offsets + (batch_left[:, None, :] <= batch_right[:, :, None]).sum(axis=2)
+
+        rows = np.arange(stop - start)[:, None]
+        out[start:stop][rows, left_pos] = batch_left
+        out[start:stop][rows, right_pos] = batch_right
+    return out.reshape(-1)[:n]
+
+
+def rank_sort(segment):
+    """Stable sort of a small array by computing each element's rank with all-pairs comparisons."""
+    return sort_blocks(segment, len(segment))
+
+
+def sort_blocks(a, width):
+    """Stably sort every block of `width` consecutive elements of a at once; returns a new array."""
+    n = len(a)
+    if n < 2:
+        return a.copy()
+    blocks = -(-n // width)
+
+    padded = np.full(blocks * width, a.max(), dtype=a.dtype)
+    padded[:n] = a
+    values = padded.reshape(blocks, width)
+
+    # rank = number of smaller elements + number of equal elements that come earlier
+    index = np.arange(width)
+    earlier = index[None, :] < index[:, None]
+    out = np.empty_like(values)
+    for start in range(0, blocks, BROADCAST_BATCH):
+        batch = values[start:start + BROADCAST_BATCH]
+        smaller = batch[:, None, :] < batch[:, :, None]
+        equal_before = (batch[:, None, :] == batch[:, :, None]) & earlier
+        ranks = (smaller | equal_before).sum(axis=2)
+        out[start:start + BROADCAST_BATCH][np.arange(len(batch))[:, None], ranks] = batch
+    return out.reshape(-1)[:n]
+
+
+def median_of_three(segment):
+    first = segment[0]
+    middle = segment[len(segment) // 2]
+    last = segment[-1]
+    return max(min(first, middle), min(max(first, middle), last))
@@ -0,0 +1,85 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from numpy_backend import (numpy_insertion_sort, numpy_merge_sort, numpy_quick_sort, numpy_timsort,
+                           merge_arrays, sort_blocks, merge_pass_broadcast)
+from sorting.insertion_sort.insertion_sort import insertion_sort
+from sorting.merge_sort.merge_sort import merge_sort
+from sorting.quick_sort.quick_sort import quick_sort
+from sorting.timsort.simplified_timsort import simplified_timsort
+
+NUMPY_SORTS = [numpy_insertion_sort, numpy_merge_sort, numpy_quick_sort, numpy_timsort]
+
+@pytest.mark.parametrize("sort_func", NUMPY_SORTS)
+def test_numpy_sorts_small_arrays(sort_func):
+    for array in ([5, 3, 6, 2, 10], [], [42], [4, 4, 4, 4, 4], [5, -1, 3, -7, 0, 10], list(range(100, 0, -1))):
+        result = sort_func(np.array(array, dtype=np.int64))
+        assert result.tolist() == sorted(array)
+
+@pytest.mark.parametrize("sort_func", NUMPY_SORTS)
+@pytest.mark.parametrize("dtype", [np.int32, np.int64, np.float64])
+def test_numpy_sorts_typed_arrays(sort_func, dtype):
+    rng = np.random.default_rng(42)
+    for size in (31, 33, 64, 100, 1000, 3000):
+        array = (rng.random(size) * 500).astype(dtype)
+        result = sort_func(array.copy())
+        assert result.dtype == dtype  # No conversion to Python objects
+        assert np.array_equal(result, np.sort(array))
+
+@pytest.mark.parametrize("sort_func", NUMPY_SORTS)
+def test_numpy_sorts_presorted_and_duplicates(sort_func):
+    rng = np.random.default_rng(1)
+    for array in (np.arange(2000), np.arange(2000)[::-1].copy(), rng.integers(0, 3, 2000)):
+        assert np.array_equal(sort_func(array.copy()), np.sort(array))
+
+@pytest.mark.parametrize("sort_func", NUMPY_SORTS)
+def test_numpy_sorts_put_nans_last(sort_func):
+    rng = np.random.default_rng(3)
+    array = rng.random(100)
+    array[[17, 60]] = np.nan
+    result = sort_func(array.copy())
+    assert np.isnan(result).sum() == 2  # NaNs are neither lost nor duplicated
+    assert np.array_equal(result, np.sort(array), equal_nan=True)  # At the end, like np.sort
+    assert sort_func([np.nan, 2.0, 1.0])[:2] == [1.0, 2.0]
+
+def test_in_place_backends_keep_input_semantics():
+    array = np.array([3, 1, 2])
+    assert numpy_insertion_sort(array) is array  # ndarrays are sorted in place
+    assert numpy_timsort(array) is array
+    values = [3, 1, 2]
+    assert numpy_insertion_sort(values) is values and values == [1, 2, 3]  # Lists are sorted in place too
+
+def test_copying_backends_return_input_type():
+    assert numpy_merge_sort([3, 1, 2]) == [1, 2, 3]  # Lists in, lists out
+    assert isinstance(numpy_quick_sort(np.array([3, 1, 2])), np.ndarray)
+
+def test_merge_arrays_is_stable():
+    left = np.array([1, 2, 2, 5])
+    right = np.array([2, 3, 5])
+    assert merge_arrays(left, right).tolist() == [1, 2, 2, 2, 3, 5, 5]
+    # ties are taken from the left block first
+    keys = np.array([0, 1, 1, 2, 1, 1, 3])
+    assert np.array_equal(merge_pass_broadcast(keys, 4), [0, 1, 1, 1, 1, 2, 3])
+
+def test_sort_blocks():
+    array = np.array([3, 1, 2, 9, 7, 8, 5])
+    assert sort_blocks(array, 3).tolist() == [1, 2, 3, 7, 8, 9, 5]
+
+def test_backend_argument():
+    array = [5, 3, 6, 2, 10]
+    for sort_func in (insertion_sort, merge_sort, quick_sort, simplified_timsort):
+        assert list(sort_func(np.array(array), backend="numpy")) == [2, 3, 5, 6, 10]
+        assert list(sort_func(array.copy(), backend="numpy")) == [2, 3, 5, 6, 10]
+        with pytest.raises(ValueError):
+            sort_func(array.copy(), backend="fortran")
+        with pytest.raises(ValueError):
+            sort_func(array.copy(), backend="numpy", key=abs)  # key and reverse need the python backend
+
+def test_backend_sorts_buffer_view():
+    from array import array
+    for sort_func in (insertion_sort, merge_sort, quick_sort, simplified_timsort):
+        buf = bytearray(array("q", [5, -3, 6, 2, 10]))
+        view = memoryview(buf).cast("q")
+        assert sort_func(view, backend="numpy") is view  # The buffer is sorted through an ndarray view of it
+        assert array("q", buf).tolist() == [-3, 2, 5, 6, 10]
@@ -0,0 +1,130 @@
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# Add root directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.algorithms import resolve_algorithm
+from sorting.merge_sort.merge_sort import merge
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+def parallel_sort(arr, workers=None, algorithm="Tim Sort"):
+    """Sort arr on several cores and return a new sorted list.
+
+    The input is split into one chunk per worker, each chunk is sorted in a separate
+    process with `algorithm` (a name from SORTING_ALGORITHMS or a module-level function),
+    and the sorted chunks are merged pairwise with merge_sort.merge.
+
+    Lists of ints that fit in 64 bits, or of floats, are shipped to the workers through a
+    shared memory block instead of being pickled. Anything else falls back to pickling.
+    """
+    sort_func = resolve_algorithm(algorithm)
+    n = len(arr)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, n))
+
+    if workers == 1:
+        return list(sort_func(list(arr)))
+
+    bounds = chunk_bounds(n, workers)
+    typecode = buffer_typecode(arr)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if typecode is None:
+            chunks = [list(arr[lo:hi]) for lo, hi in bounds]
+            runs = list(executor.map(sort_chunk, [algorithm] * workers, chunks))
+        else:
+            runs = sort_shared(executor, arr, typecode, bounds, algorithm)
+
+    return merge_runs(runs)
+
+
+def chunk_bounds(n, chunks):
+    # split range(n) into `chunks` contiguous pieces whose sizes differ by at most one
+    size, extra = divmod(n, chunks)
+    bounds = []
+    lo = 0
+    for i in range(chunks):
+        hi = lo + size + (1 if i < extra else 0)
+        bounds.append((lo, hi))
+        lo = hi
+    return bounds
+
+
+def buffer_typecode(arr):
+    """Return the array typecode that can hold every element of arr, or None."""
+    if all(type(x) is int for x in arr):
+        if arr and (min(arr) < INT64_MIN or max(arr) > INT64_MAX):
+            return None
+        return "q"
+    if all(type(x) is float for x in arr):
+        return "d"
+    return None
+
+
+def sort_chunk(algorithm, chunk):
+    # the sorts disagree on whether they sort in place, so always use the return value
+    return list(resolve_algorithm(algorithm)(chunk))
+
+
+def sort_shared(executor, arr, typecode, bounds, algorithm):
+    n = len(arr)
+    itemsize = array(typecode).itemsize
+    shm = shared_memory.SharedMemory(create=True, size=max(n * itemsize, 1))
+    try:
+        # the block can't be closed while a view of it exists, so the view is released
+        # even when a worker fails, and the worker's error isn't replaced by a BufferError
+        view = shm.buf[:n * itemsize].cast(typecode)
+        try:
+            view[:] = array(typecode, arr)
+
+            futures = [
+                executor.submit(sort_shared_chunk, shm.name, typecode, n, lo, hi, algorithm)
+                for lo, hi in bounds
+            ]
+            for future in futures:
+                future.result()
+
+            runs = [view[lo:hi].tolist() for lo, hi in bounds]
+        finally:
+            view.release()
+    finally:
+        try:
+            shm.close()
+        finally:
+            shm.unlink()
+    return runs
+
+
+def sort_shared_chunk(name, typecode, n, lo, hi, algorithm):
+    """Worker: sort view[lo:hi] of the shared block `name` and write it back in place."""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        itemsize = array(typecode).itemsize
+        view = shm.buf[:n * itemsize].cast(typecode)
+        try:
+            chunk = sort_chunk(algorithm, view[lo:hi].tolist())
+            view[lo:hi] = array(typecode, chunk)
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def merge_runs(runs):
+    # k-way merge as a balanced tree of two-way merges: O(n log k)
+    if not runs:
+        return []
+    while len(runs) > 1:
+        merged = [merge(runs[i], runs[i + 1]) for i in range(0, len(runs) - 1, 2)]
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+    return runs[0]
@@ -0,0 +1,76 @@
+import pytest
+from parallel_sort import parallel_sort, chunk_bounds, buffer_typecode, merge_runs
+
+def test_parallel_sort_unsorted_array():
+    array = [5, 3, 6, 2, 10]
+    assert parallel_sort(array, workers=2) == [2, 3, 5, 6, 10]  # Should sort in ascending order
+
+def test_parallel_sort_empty_array():
+    assert parallel_sort([], workers=2) == []  # Empty array should return empty array
+
+def test_parallel_sort_single_element():
+    assert parallel_sort([42], workers=2) == [42]  # Single element array
+
+def test_parallel_sort_does_not_modify_input():
+    array = [3, 1, 2]
+    parallel_sort(array, workers=2)
+    assert array == [3, 1, 2]  # Returns a new list
+
+def test_parallel_sort_random_ints():
+    import random
+    random.seed(42)  # For reproducibility
+    array = [random.randint(-10**12, 10**12) for _ in range(10000)]
+    assert parallel_sort(array, workers=3) == sorted(array)  # Shared memory path with int64
+
+def test_parallel_sort_floats():
+    import random
+    random.seed(42)
+    array = [random.random() for _ in range(1001)]
+    assert parallel_sort(array, workers=4) == sorted(array)  # Shared memory path with doubles
+
+def test_parallel_sort_falls_back_to_pickling():
+    words = ["pear", "apple", "fig", "kiwi", "banana"]
+    assert parallel_sort(words, workers=2) == sorted(words)  # Strings can't go in shared memory
+    huge = [2**70, 1, -2**70, 5]
+    assert parallel_sort(huge, workers=2) == sorted(huge)  # Ints that don't fit in 64 bits
+
+def test_parallel_sort_with_each_algorithm():
+    import random
+    random.seed(7)
+    array = [random.randint(0, 100) for _ in range(300)]
+    for algorithm in ("Insertion Sort", "Quick Sort", "Merge Sort", "Selection Sort", "Tim Sort"):
+        assert parallel_sort(array, workers=2, algorithm=algorithm) == sorted(array)
+
+def test_parallel_sort_unknown_algorithm():
+    with pytest.raises(ValueError):
+        parallel_sort([2, 1], workers=2, algorithm="Bogo Sort")
+
+def broken_sort(arr):
+    raise ValueError("broken sort")
+
+def test_parallel_sort_worker_error_frees_shared_memory():
+    import os
+    shm_dir = "/dev/shm"
+    before = set(os.listdir(shm_dir)) if os.path.isdir(shm_dir) else set()
+    with pytest.raises(ValueError, match="broken sort"):
+        parallel_sort(list(range(1000, 0, -1)), workers=2, algorithm=broken_sort)  # Not a BufferError from close()
+    with pytest.raises(Exception) as error:
+        parallel_sort(list(range(1000, 0, -1)), workers=2, algorithm=lambda arr: sorted(arr))  # Can't be pickled
+    assert not isinstance(error.value, BufferError)
+    after = set(os.listdir(shm_dir)) if os.path.isdir(shm_dir) else set()
+    assert after <= before  # The shared blocks were unlinked
+
+def test_chunk_bounds():
+    assert chunk_bounds(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert chunk_bounds(2, 2) == [(0, 1), (1, 2)]
+
+def test_buffer_typecode():
+    assert buffer_typecode([1, 2, 3]) == "q"
+    assert buffer_typecode([1.0, 2.5]) == "d"
+    assert buffer_typecode([1, 2.5]) is None  # Mixed types keep their Python types
+    assert buffer_typecode([True, False]) is None
+    assert buffer_typecode([2**64]) is None
+
+def test_merge_runs():
+    assert merge_runs([[1, 4], [2, 5], [0, 3, 6]]) == [0, 1, 2, 3, 4, 5, 6]
+    assert merge_runs([]) == []
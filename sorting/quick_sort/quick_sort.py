@@ -1,6 +1,32 @@
+import math
+import os
 import random
+import sys
 
-def quick_sort(arr):
+# Add root directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.buffers import buffer_sort
+from sorting.decorate import sort_with_key
+from sorting.heap_sort.heap_sort import heap_sort_range
+from sorting.insertion_sort.insertion_sort import insertion_sort_range
+
+@buffer_sort(in_place=False)
+def quick_sort(arr, backend="python", key=None, reverse=False):
+    if key is not None or reverse:
+        if backend != "python":
+            raise ValueError("key and reverse are only supported by the python backend")
+        return sort_with_key(quick_sort, arr, key, reverse, in_place=False)
+    if backend == "numpy":
+        from sorting.numpy_backend.numpy_backend import numpy_quick_sort
+        return numpy_quick_sort(arr)
+    if backend != "python":
+        raise ValueError(f"Unknown backend {backend!r}, expected 'python' or 'numpy'")
+
+    return quick_sort_list(arr)
+
+def quick_sort_list(arr):
+    # the recursion of quick_sort, so the checks above run once per sort instead of once per call
     if len(arr) < 2:
         return arr
     else:
@@ -14,4 +40,105 @@ def quick_sort(arr):
         equal = [i for i in arr if i == pivot]
         greater = [i for i in arr if i > pivot]
 
-        return quick_sort(less) + equal + quick_sort(greater)
\ No newline at end of file
+        return quick_sort_list(less) + equal + quick_sort_list(greater)
+
+
+# partitions at or below this size are finished with insertion sort
+INSERTION_SORT_CUTOFF = 16
+# partitions above this size use Tukey's ninther instead of a plain median-of-three
+NINTHER_CUTOFF = 40
+
+
+@buffer_sort()
+def quick_sort_in_place(arr, key=None, reverse=False):
+    """Sort arr in place with an introsort: three-way quicksort that falls back to heap sort.
+
+    Uses an explicit stack instead of recursion, always continuing with the smaller partition,
+    so the stack holds O(log n) entries. Once a partition is split more than 2*log2(n) times
+    it is heap sorted, which keeps the worst case at O(n log n).
+
+    Equal elements can be reordered, except when sorting with key or reverse.
+    """
+    if key is not None or reverse:
+        return sort_with_key(quick_sort_in_place, arr, key, reverse, in_place=True)
+
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    max_depth = 2 * math.floor(math.log2(n))
+    stack = [(0, n - 1, 0)]
+
+    while stack:
+        lo, hi, depth = stack.pop()
+
+        while hi - lo + 1 > INSERTION_SORT_CUTOFF and depth < max_depth:
+            depth += 1
+            pivot = arr[choose_pivot(arr, lo, hi)]
+            lt, gt = partition_three_way(arr, lo, hi, pivot)
+
+            # push the larger side, keep working on the smaller one
+            if lt - lo < hi - gt:
+                stack.append((gt + 1, hi, depth))
+                hi = lt - 1
+            else:
+                stack.append((lo, lt - 1, depth))
+                lo = gt + 1
+
+        # lo..hi is inclusive here, the range helpers take a slice
+        if hi - lo + 1 > INSERTION_SORT_CUTOFF:
+            heap_sort_range(arr, lo, hi + 1)
+        else:
+            insertion_sort_range(arr, lo, hi + 1)
+
+    return arr
+
+
+def median_of_three(arr, a, b, c):
+    # index of the median of arr[a], arr[b], arr[c]
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    return c if arr[b] < arr[c] else b
+
+
+def choose_pivot(arr, lo, hi):
+    mid = (lo + hi) // 2
+    if hi - lo + 1 <= NINTHER_CUTOFF:
+        return median_of_three(arr, lo, mid, hi)
+
+    # Tukey's ninther: median of the medians of three groups of three
+    step = (hi - lo + 1) // 8
+    return median_of_three(
+        arr,
+        median_of_three(arr, lo, lo + step, lo + 2 * step),
+        median_of_three(arr, mid - step, mid, mid + step),
+        median_of_three(arr, hi - 2 * step, hi - step, hi),
+    )
+
+
+def partition_three_way(arr, lo, hi, pivot):
+    """Dutch national flag partition of arr[lo..hi] around pivot.
+
+    Returns (lt, gt) such that arr[lo:lt] < pivot, arr[lt:gt+1] == pivot and arr[gt+1:hi+1] > pivot.
+    """
+    lt = lo
+    i = lo
+    gt = hi
+    while i <= gt:
+        value = arr[i]
+        if value < pivot:
+            arr[i] = arr[lt]
+            arr[lt] = value
+            lt += 1
+            i += 1
+        elif pivot < value:
+            arr[i] = arr[gt]
+            arr[gt] = value
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
@@ -1,5 +1,5 @@
 import pytest
-from quick_sort import quick_sort
+from quick_sort import quick_sort, quick_sort_in_place, partition_three_way, heap_sort_range
 
 def test_quick_sort_unsorted_array():
     array = [5, 3, 6, 2, 10]
@@ -35,4 +35,60 @@ def test_quick_sort_large_array():
 
 def test_quick_sort_same_elements():
     array = [4, 4, 4, 4, 4]
-    assert quick_sort(array.copy()) == [4, 4, 4, 4, 4]  # Array with all same elements
\ No newline at end of file
+    assert quick_sort(array.copy()) == [4, 4, 4, 4, 4]  # Array with all same elements
+
+def test_quick_sort_in_place_unsorted_array():
+    array = [5, 3, 6, 2, 10]
+    assert quick_sort_in_place(array.copy()) == [2, 3, 5, 6, 10]  # Should sort in ascending order
+
+def test_quick_sort_in_place_edge_cases():
+    assert quick_sort_in_place([]) == []  # Empty array
+    assert quick_sort_in_place([42]) == [42]  # Single element array
+    assert quick_sort_in_place([4, 4, 4, 4, 4]) == [4, 4, 4, 4, 4]  # All same elements
+    assert quick_sort_in_place([5, -1, 3, -7, 0, 10]) == [-7, -1, 0, 3, 5, 10]  # Negative numbers
+
+def test_quick_sort_in_place_sorts_input():
+    array = [3, 1, 2]
+    quick_sort_in_place(array)
+    assert array == [1, 2, 3]  # Input list is sorted in place
+
+def test_quick_sort_in_place_large_arrays():
+    import random
+    random.seed(42)  # For reproducibility
+    random_array = [random.randint(0, 10000) for _ in range(5000)]
+    few_unique = [random.randint(0, 3) for _ in range(5000)]
+    organ_pipe = list(range(2500)) + list(range(2500, 0, -1))
+    for array in (random_array, few_unique, organ_pipe, sorted(random_array), sorted(random_array, reverse=True)):
+        assert quick_sort_in_place(array.copy()) == sorted(array)
+
+def test_quick_sort_in_place_does_not_recurse():
+    import sys
+    array = list(range(sys.getrecursionlimit() * 10, 0, -1))
+    assert quick_sort_in_place(array) == sorted(array)  # No RecursionError on long inputs
+
+def test_partition_three_way():
+    array = [3, 5, 3, 1, 3, 9, 0]
+    lt, gt = partition_three_way(array, 0, len(array) - 1, 3)
+    assert all(x < 3 for x in array[:lt])
+    assert array[lt:gt + 1] == [3, 3, 3]
+    assert all(x > 3 for x in array[gt + 1:])
+
+def test_heap_sort_range():
+    array = [9, 8, 7, 6, 5, 4, 3, 2, 1]
+    heap_sort_range(array, 2, 7)
+    assert array == [9, 8, 3, 4, 5, 6, 7, 2, 1]  # Only arr[2:7] is sorted
+
+def test_quick_sort_inplace():
+    array = [5, 3, 6, 2, 10]
+    assert quick_sort(array, inplace=True) is array  # inplace=True sorts the list itself
+    assert array == [2, 3, 5, 6, 10]
+
+def test_quick_sort_in_place_memoryview():
+    from array import array
+    view = memoryview(bytearray(array("q", [5, -3, 6, 2, 10]))).cast("q")
+    assert quick_sort_in_place(view) is view  # Writable buffers are sorted in place
+    assert view.tolist() == [-3, 2, 5, 6, 10]
+
+def test_quick_sort_out_and_inplace():
+    with pytest.raises(ValueError):
+        quick_sort([3, 1, 2], out=[0] * 3, inplace=True)  # Only one of out and inplace
@@ -0,0 +1,154 @@
+import os
+import sys
+from itertools import chain
+
+# Add root directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.buffers import buffer_sort, write_back
+from sorting.insertion_sort.insertion_sort import insertion_sort
+
+# keys are split into bytes, one bucket per byte value
+RADIX_BITS = 8
+RADIX = 1 << RADIX_BITS
+# MSD buckets at or below this size are finished with insertion sort
+MSD_CUTOFF = 32
+
+
+@buffer_sort(ndarray=True)
+def lsd_radix_sort(arr, key=None, reverse=False):
+    """Sort integers in place, one byte at a time from the least significant byte.
+
+    Every pass is a stable distribution into 256 buckets, so after the pass on byte b the
+    keys are sorted by their low b+1 bytes. Keys are offset by the minimum first, so
+    negative numbers work and only the bytes that differ get a pass: O(n * w / 8) for keys
+    spanning w bits, independent of how many keys are equal.
+
+    arr can be a list, an array.array or a NumPy integer array, which is sorted with one
+    vectorized stable pass per byte. With key, each key is computed once and must be an int.
+    """
+    if hasattr(arr, "dtype") and key is None and not reverse:
+        return numpy_lsd_radix_sort(arr)
+    return sort_ints(lsd_sort_ints, arr, key, reverse)
+
+
+@buffer_sort()
+def msd_radix_sort(arr, key=None, reverse=False):
+    """Sort integers in place, one byte at a time from the most significant byte.
+
+    Each bucket of the current byte is sorted on its own by the next byte, and buckets of
+    MSD_CUTOFF keys or fewer are finished with insertion_sort instead. Sorting stops early
+    in buckets whose keys are all equal, so inputs with many duplicates or short distinct
+    prefixes take fewer passes than LSD. Accepts the same inputs as lsd_radix_sort.
+    """
+    return sort_ints(msd_sort_ints, arr, key, reverse)
+
+
+def sort_ints(sort_func, arr, key=None, reverse=False):
+    # sort_func sorts a list of non-negative ints; the keys are shifted to start at 0
+    values = arr.tolist() if hasattr(arr, "tolist") else list(arr)
+    n = len(values)
+    if n < 2 and key is None:
+        return arr
+
+    if key is None and not reverse:
+        lo = min(values)
+        check_int_keys(lo, max(values))
+        shifted = sort_func([v - lo for v in values] if lo else values)
+        return write_back(arr, [v + lo for v in shifted] if lo else shifted)
+
+    # pack each key and its index into one int, key in the high bits, so ties keep their
+    # input order and the payload comes back out of the low bits
+    keys = values if key is None else [key(x) for x in values]
+    if reverse:
+        keys = [-k for k in keys]
+    lo = min(keys, default=0)
+    check_int_keys(lo, max(keys, default=0))
+    index_bits = max(1, (n - 1).bit_length())
+    mask = (1 << index_bits) - 1
+    packed = sort_func([(k - lo) << index_bits | i for i, k in enumerate(keys)])
+    return write_back(arr, [values[p & mask] for p in packed])
+
+
+def check_int_keys(lo, hi):
+    # keys between two ints that aren't ints themselves fail on the first shift, with a TypeError too
+    for k in (lo, hi):
+        if not isinstance(k, int):
+            raise TypeError(f"radix sort needs integer keys, got {type(k).__name__}")
+
+
+def lsd_sort_ints(values):
+    """Return the non-negative ints in values in ascending order, by LSD radix sort."""
+    n = len(values)
+    if n < 2:
+        return values
+    bits = max(values).bit_length()
+
+    for shift in range(0, bits, RADIX_BITS):
+        buckets = [[] for _ in range(RADIX)]
+        for v in values:
+            buckets[(v >> shift) & (RADIX - 1)].append(v)
+
+        # a pass that puts every key in the same bucket doesn't change the order
+        if max(len(b) for b in buckets) < n:
+            values = list(chain.from_iterable(buckets))
+    return values
+
+
+def msd_sort_ints(values):
+    """Return the non-negative ints in values in ascending order, by MSD radix sort."""
+    values = list(values)
+    n = len(values)
+    if n < 2:
+        return values
+    top_shift = max(0, (max(values).bit_length() - 1) // RADIX_BITS * RADIX_BITS)
+
+    # (lo, hi, shift): values[lo:hi] share every byte above shift and still need sorting
+    stack = [(0, n, top_shift)]
+    while stack:
+        lo, hi, shift = stack.pop()
+        if hi - lo <= MSD_CUTOFF:
+            values[lo:hi] = insertion_sort(values[lo:hi])
+            continue
+
+        buckets = [[] for _ in range(RADIX)]
+        for v in values[lo:hi]:
+            buckets[(v >> shift) & (RADIX - 1)].append(v)
+
+        start = lo
+        for bucket in buckets:
+            end = start + len(bucket)
+            if bucket:
+                values[start:end] = bucket
+                if end - start > 1 and shift > 0:
+                    stack.append((start, end, shift - RADIX_BITS))
+            start = end
+    return values
+
+
+def numpy_lsd_radix_sort(a):
+    """LSD radix sort of an integer ndarray in place, with one stable argsort of a byte per pass."""
+    import numpy as np
+
+    if a.dtype.kind not in "iu":
+        raise TypeError(f"radix sort needs integer keys, got {a.dtype}")
+    if len(a) < 2:
+        return a
+
+    if a.dtype.kind == "u":
+        keys = a.astype(np.uint64)
+    else:
+        # flip the sign bit so signed order matches unsigned order
+        keys = a.astype(np.int64).view(np.uint64) ^ np.uint64(1 << 63)
+    # offset by the minimum, so only the bytes that differ get a pass
+    keys -= keys.min()
+    bits = int(keys.max()).bit_length()
+
+    order = np.arange(len(a))
+    for shift in range(0, bits, RADIX_BITS):
+        digits = ((keys[order] >> np.uint64(shift)) & np.uint64(RADIX - 1)).astype(np.uint8)
+        # NumPy's stable sort of uint8 is itself a counting sort, so each pass is O(n)
+        order = order[np.argsort(digits, kind="stable")]
+
+    a[:] = a[order]
+    return a
@@ -0,0 +1,146 @@
+import pytest
+from radix_sort import lsd_radix_sort, msd_radix_sort, lsd_sort_ints, msd_sort_ints
+
+def test_lsd_radix_sort_unsorted_array():
+    array = [5, 3, 6, 2, 10]
+    assert lsd_radix_sort(array.copy()) == [2, 3, 5, 6, 10]  # Should sort in ascending order
+
+def test_lsd_radix_sort_already_sorted():
+    array = [1, 2, 3, 4, 5]
+    assert lsd_radix_sort(array.copy()) == [1, 2, 3, 4, 5]  # Already sorted array
+
+def test_lsd_radix_sort_reverse_sorted():
+    array = [5, 4, 3, 2, 1]
+    assert lsd_radix_sort(array.copy()) == [1, 2, 3, 4, 5]  # Reverse sorted array
+
+def test_lsd_radix_sort_empty_array():
+    assert lsd_radix_sort([]) == []  # Empty array should return empty array
+
+def test_lsd_radix_sort_single_element():
+    assert lsd_radix_sort([42]) == [42]  # Single element array
+
+def test_lsd_radix_sort_duplicate_elements():
+    array = [3, 1, 3, 2, 5, 1]
+    assert lsd_radix_sort(array.copy()) == [1, 1, 2, 3, 3, 5]  # Array with duplicate elements
+
+def test_lsd_radix_sort_negative_numbers():
+    array = [5, -1, 3, -7, 0, 10]
+    assert lsd_radix_sort(array.copy()) == [-7, -1, 0, 3, 5, 10]  # Array with negative numbers
+
+def test_lsd_radix_sort_sorts_in_place():
+    array = [3, 1, 2]
+    assert lsd_radix_sort(array) is array
+    assert array == [1, 2, 3]
+
+def test_lsd_radix_sort_random_large_array():
+    import random
+    random.seed(42)  # For reproducibility
+    array = [random.randint(-5000, 5000) for _ in range(5000)]
+    assert lsd_radix_sort(array.copy()) == sorted(array)  # Random large array
+
+def test_lsd_radix_sort_typed_array():
+    from array import array
+    values = array("q", [2 ** 40, -3, 7, 0, -2 ** 40, 7])
+    assert lsd_radix_sort(values) is values  # array('q') is sorted in place
+    assert values == array("q", [-2 ** 40, -3, 0, 7, 7, 2 ** 40])
+
+def test_lsd_radix_sort_numpy_array():
+    np = pytest.importorskip("numpy")
+    values = np.array([9, -4, 0, 9, 2 ** 33, -2 ** 33, 1], dtype=np.int64)
+    assert lsd_radix_sort(values) is values
+    assert values.tolist() == sorted([9, -4, 0, 9, 2 ** 33, -2 ** 33, 1])
+
+def test_lsd_radix_sort_rejects_float_arrays():
+    np = pytest.importorskip("numpy")
+    from array import array
+    with pytest.raises(TypeError):
+        lsd_radix_sort(np.array([0.7, 0.2, 0.1, 1.5]))  # Would sort the truncated floats
+    with pytest.raises(TypeError):
+        lsd_radix_sort(array("d", [0.7, 0.2, 0.1, 1.5]))  # Buffers go through the NumPy path too
+
+def test_lsd_radix_sort_uint64_array():
+    np = pytest.importorskip("numpy")
+    array = [2 ** 64 - 1, 3, 2 ** 63, 0, 2 ** 63 - 1]
+    values = np.array(array, dtype=np.uint64)
+    assert lsd_radix_sort(values).tolist() == sorted(array)  # Values above int64 don't wrap
+
+def test_msd_radix_sort_unsorted_array():
+    array = [5, 3, 6, 2, 10]
+    assert msd_radix_sort(array.copy()) == [2, 3, 5, 6, 10]  # Should sort in ascending order
+
+def test_msd_radix_sort_already_sorted():
+    array = [1, 2, 3, 4, 5]
+    assert msd_radix_sort(array.copy()) == [1, 2, 3, 4, 5]  # Already sorted array
+
+def test_msd_radix_sort_reverse_sorted():
+    array = [5, 4, 3, 2, 1]
+    assert msd_radix_sort(array.copy()) == [1, 2, 3, 4, 5]  # Reverse sorted array
+
+def test_msd_radix_sort_empty_array():
+    assert msd_radix_sort([]) == []  # Empty array should return empty array
+
+def test_msd_radix_sort_single_element():
+    assert msd_radix_sort([42]) == [42]  # Single element array
+
+def test_msd_radix_sort_duplicate_elements():
+    array = [3, 1, 3, 2, 5, 1]
+    assert msd_radix_sort(array.copy()) == [1, 1, 2, 3, 3, 5]  # Array with duplicate elements
+
+def test_msd_radix_sort_negative_numbers():
+    array = [5, -1, 3, -7, 0, 10]
+    assert msd_radix_sort(array.copy()) == [-7, -1, 0, 3, 5, 10]  # Array with negative numbers
+
+def test_msd_radix_sort_sorts_in_place():
+    array = [3, 1, 2]
+    assert msd_radix_sort(array) is array
+    assert array == [1, 2, 3]
+
+def test_msd_radix_sort_random_large_array():
+    import random
+    random.seed(42)  # For reproducibility
+    array = [random.randint(-5000, 5000) for _ in range(5000)]
+    assert msd_radix_sort(array.copy()) == sorted(array)  # Random large array
+
+def test_msd_radix_sort_typed_array():
+    from array import array
+    values = array("q", [2 ** 40, -3, 7, 0, -2 ** 40, 7])
+    assert msd_radix_sort(values) is values  # array('q') is sorted in place
+    assert values == array("q", [-2 ** 40, -3, 0, 7, 7, 2 ** 40])
+
+def test_msd_radix_sort_numpy_array():
+    np = pytest.importorskip("numpy")
+    values = np.array([9, -4, 0, 9, 2 ** 33, -2 ** 33, 1], dtype=np.int64)
+    assert msd_radix_sort(values) is values
+    assert values.tolist() == sorted([9, -4, 0, 9, 2 ** 33, -2 ** 33, 1])
+
+def test_sort_ints_cross_byte_boundaries():
+    values = [0x1FF, 0x100, 0xFF, 0x10000, 0, 0x1FFFF, 0x100FF]
+    assert lsd_sort_ints(values) == sorted(values)  # Keys that differ in several bytes
+    assert msd_sort_ints(values) == sorted(values)
+
+def test_msd_radix_sort_many_buckets():
+    import random
+    random.seed(1)
+    array = [random.randint(0, 1 << 40) for _ in range(3000)] + [7] * 500
+    assert msd_radix_sort(array.copy()) == sorted(array)  # Large buckets recurse, small ones use insertion sort
+
+def test_radix_sorts_memoryview():
+    from array import array
+    for sort in (lsd_radix_sort, msd_radix_sort):
+        buf = bytearray(array("q", [5, -3, 6, 2, 10]))
+        view = memoryview(buf).cast("q")
+        assert sort(view) is view  # Writable buffers are sorted in place
+        assert array("q", buf).tolist() == [-3, 2, 5, 6, 10]
+
+def test_lsd_radix_sort_out():
+    array = [5, 3, 6, 2, 10]
+    out = [0] * 5
+    assert lsd_radix_sort(array, out=out) is out  # The sorted items are written into out
+    assert out == [2, 3, 5, 6, 10] and array == [5, 3, 6, 2, 10]
+
+def test_radix_sorts_reject_non_integers():
+    for sort in (lsd_radix_sort, msd_radix_sort):
+        with pytest.raises(TypeError):
+            sort([1.5, float("inf"), 0.0])  # Floats, even at the ends of the range
+        with pytest.raises(TypeError):
+            sort(["b", "a"])  # Strings
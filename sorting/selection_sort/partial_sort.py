@@ -0,0 +1,105 @@
+import math
+import os
+import sys
+from itertools import count
+
+# Add root directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.decorate import decorate
+from sorting.heap_sort.heap_sort import heap_sort
+from sorting.insertion_sort.insertion_sort import insertion_sort_range
+from sorting.quick_sort.quick_sort import median_of_three, partition_three_way
+
+# ranges at or below this size are finished with insertion sort
+INSERTION_SORT_CUTOFF = 16
+
+
+def nsmallest(items, k):
+    """Return the k smallest items in sorted order, without modifying the input.
+
+    Sized sequences are copied and partially sorted with introselect in O(n + k log k).
+    Other iterables, such as generators, are streamed through a buffer of at most 2k items,
+    cut back to its k smallest with introselect whenever it fills up, in O(n + k log k)
+    time and O(k) memory. Either way the result is stable: equal items come out in input
+    order.
+    """
+    if k <= 0:
+        return []
+    if hasattr(items, "__len__"):
+        # introselect and heap_sort move equal items around, so ties are broken by the
+        # index of (item, index) pairs, which compare in C
+        return [item for item, _ in partial_sort(decorate(items), k)[:k]]
+
+    kept = []
+    bound = None
+    for item, index in zip(items, count()):
+        # after a cut, only items below the largest kept one can make it; equal ones come
+        # later in the input and lose the tie
+        if bound is not None and not item < bound:
+            continue
+        kept.append((item, index))
+        if len(kept) == 2 * k:
+            select(kept, k - 1)
+            del kept[k:]
+            bound = kept[k - 1][0]
+    return [item for item, _ in partial_sort(kept, k)[:k]]
+
+
+def partial_sort(arr, k):
+    """Rearrange arr in place so that arr[:k] holds its k smallest items in sorted order.
+
+    The rest of the list is left in no particular order. Returns arr.
+    """
+    n = len(arr)
+    if k <= 0 or n < 2:
+        return arr
+    if k >= n:
+        return heap_sort(arr)
+
+    select(arr, k - 1)
+    head = heap_sort(arr[:k])
+    arr[:k] = head
+    return arr
+
+
+def select(arr, k, lo=0, hi=None):
+    """Move the k-th smallest item (0-based) of arr[lo:hi] to arr[k], in place.
+
+    Afterwards arr[lo:k] <= arr[k] <= arr[k+1:hi]. This is introselect: quickselect with a
+    median-of-three pivot, switching to median-of-medians pivots once it has taken more than
+    2*log2(n) steps, which bounds the worst case at O(n).
+    """
+    if hi is None:
+        hi = len(arr)
+    if not lo <= k < hi:
+        raise IndexError("k is out of range")
+
+    budget = 2 * math.floor(math.log2(hi - lo)) if hi - lo > 1 else 0
+    while hi - lo > INSERTION_SORT_CUTOFF:
+        if budget > 0:
+            budget -= 1
+            pivot = arr[median_of_three(arr, lo, (lo + hi) // 2, hi - 1)]
+        else:
+            pivot = median_of_medians(arr, lo, hi)
+
+        lt, gt = partition_three_way(arr, lo, hi - 1, pivot)
+        if k < lt:
+            hi = lt
+        elif k > gt:
+            lo = gt + 1
+        else:
+            return arr[k]
+
+    insertion_sort_range(arr, lo, hi)
+    return arr[k]
+
+
+def median_of_medians(arr, lo, hi):
+    # median of the medians of groups of five, guaranteed to split off at least 30% of the range
+    medians = []
+    for start in range(lo, hi, 5):
+        group = arr[start:min(start + 5, hi)]
+        insertion_sort_range(group, 0, len(group))
+        medians.append(group[(len(group) - 1) // 2])
+    return select(medians, (len(medians) - 1) // 2)
@@ -1,6 +1,20 @@
+import os
+import sys
 
+# Add root directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-def selection_sort(arr):
+from sorting.buffers import buffer_sort
+from sorting.decorate import sort_with_key
+
+
+@buffer_sort(in_place=False)
+def selection_sort(arr, key=None, reverse=False):
+    if key is not None or reverse:
+        return sort_with_key(selection_sort, arr, key, reverse, in_place=False)
+
+    # pop from a copy, so that the input isn't emptied
+    arr = list(arr)
     newArr = []
 
     for i in range(len(arr)):
@@ -0,0 +1,101 @@
+import pytest
+from partial_sort import nsmallest, partial_sort, select, median_of_medians
+
+def test_nsmallest_unsorted_array():
+    array = [5, 3, 6, 2, 10]
+    assert nsmallest(array, 3) == [2, 3, 5]  # Three smallest in ascending order
+    assert array == [5, 3, 6, 2, 10]  # Input is not modified
+
+def test_nsmallest_edge_cases():
+    assert nsmallest([], 3) == []  # Empty array
+    assert nsmallest([5, 3], 0) == []  # k = 0
+    assert nsmallest([5, 3], -1) == []  # Negative k
+    assert nsmallest([5, 3], 10) == [3, 5]  # k larger than the array
+
+def test_nsmallest_duplicates():
+    assert nsmallest([3, 1, 3, 2, 5, 1], 4) == [1, 1, 2, 3]
+
+def test_nsmallest_from_generator():
+    assert nsmallest((x * 7 % 11 for x in range(11)), 4) == [0, 1, 2, 3]  # Streams through a bounded heap
+
+def test_nsmallest_from_generator_keeps_input_order_of_ties():
+    import functools
+
+    @functools.total_ordering
+    class Item:
+        def __init__(self, key, tag):
+            self.key = key
+            self.tag = tag
+
+        def __eq__(self, other):
+            return self.key == other.key
+
+        def __lt__(self, other):
+            return self.key < other.key
+
+    items = [Item(k, i) for i, k in enumerate([2, 1, 2, 1, 2, 0, 2])]
+    result = nsmallest(iter(items), 5)
+    assert [(x.key, x.tag) for x in result] == [(0, 5), (1, 1), (1, 3), (2, 0), (2, 2)]
+    items = [Item(k, i) for i, k in enumerate([2, 1, 2, 1, 2, 0, 2] * 10)]
+    result = nsmallest(iter(items), 4)  # The buffer is cut back many times
+    assert [x.tag for x in result] == sorted(range(len(items)), key=lambda i: items[i].key)[:4]
+
+def test_nsmallest_from_list_keeps_input_order_of_ties():
+    import functools
+
+    @functools.total_ordering
+    class Item:
+        def __init__(self, key, tag):
+            self.key = key
+            self.tag = tag
+
+        def __eq__(self, other):
+            return self.key == other.key
+
+        def __lt__(self, other):
+            return self.key < other.key
+
+    items = [Item(k, i) for i, k in enumerate([2, 1, 2, 1, 2, 0, 2] * 10)]
+    result = nsmallest(items, 25)
+    expected = sorted(range(len(items)), key=lambda i: items[i].key)[:25]
+    assert [x.tag for x in result] == expected  # Same order as the stable built-in sort
+
+def test_nsmallest_random_large_array():
+    import random
+    random.seed(42)  # For reproducibility
+    array = [random.randint(0, 1000) for _ in range(5000)]
+    for k in (1, 10, 100, 2500, 4999, 5000):
+        assert nsmallest(array, k) == sorted(array)[:k]
+        assert nsmallest(iter(array), k) == sorted(array)[:k]
+
+def test_partial_sort_in_place():
+    array = [9, 4, 7, 1, 8, 2, 6, 3, 5, 0] * 5
+    partial_sort(array, 12)
+    assert array[:12] == [0] * 5 + [1] * 5 + [2, 2]  # Smallest 12 in order
+    assert sorted(array) == sorted([9, 4, 7, 1, 8, 2, 6, 3, 5, 0] * 5)  # Nothing lost
+
+def test_select():
+    import random
+    random.seed(1)
+    array = [random.randint(0, 100) for _ in range(1000)]
+    expected = sorted(array)
+    for k in (0, 1, 499, 500, 998, 999):
+        copy = array.copy()
+        assert select(copy, k) == expected[k]
+        assert all(x <= copy[k] for x in copy[:k])
+        assert all(x >= copy[k] for x in copy[k + 1:])
+    with pytest.raises(IndexError):
+        select([1, 2], 2)
+
+def test_select_adversarial_inputs():
+    size = 3000
+    organ_pipe = list(range(size // 2)) + list(range(size // 2, 0, -1))
+    for array in (organ_pipe, list(range(size)), list(range(size, 0, -1)), [7] * size):
+        assert select(array.copy(), size // 2) == sorted(array)[size // 2]
+
+def test_median_of_medians_splits_range():
+    import random
+    random.seed(3)
+    array = random.sample(range(10000), 10000)
+    pivot = median_of_medians(array, 0, len(array))
+    assert 3000 <= pivot <= 7000  # At least 30% of the items on each side
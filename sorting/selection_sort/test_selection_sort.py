@@ -25,3 +25,17 @@ def test_selection_sort_duplicate_elements():
     array = [3, 1, 3, 2, 5, 1]
     assert selection_sort(array.copy()) == [1, 1, 2, 3, 3, 5]  # Array with duplicate elements
 
+def test_selection_sort_keeps_input():
+    array = [5, 3, 6, 2, 10]
+    assert selection_sort(array) == [2, 3, 5, 6, 10]
+    assert array == [5, 3, 6, 2, 10]  # The input is no longer emptied
+
+def test_selection_sort_out_and_inplace():
+    from array import array
+    values = array("i", [5, 3, 6, 2, 10])
+    out = array("i", [0] * 5)
+    assert selection_sort(values, out=out) is out  # The sorted items are written into out
+    assert out.tolist() == [2, 3, 5, 6, 10]
+    items = [3, 1, 2]
+    assert selection_sort(items, inplace=True) is items  # inplace=True sorts the list itself
+    assert items == [1, 2, 3]
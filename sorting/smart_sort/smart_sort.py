@@ -0,0 +1,344 @@
+import json
+import numbers
+import os
+import platform
+import random
+import sys
+import time
+from functools import lru_cache
+
+# Add root directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.algorithms import SORTING_ALGORITHMS
+from sorting.buffers import write_back
+
+# size classes, by the largest size they hold, and the size each one is calibrated at
+SIZE_CLASSES = [("tiny", 16), ("small", 256), ("medium", 4096), ("large", None)]
+CALIBRATION_SIZES = {"tiny": 16, "small": 200, "medium": 3000, "large": 20000}
+# small inputs are sorted this many items' worth of times per timing, to rise above timer noise
+CALIBRATION_LOOP_ITEMS = 4096
+# integers whose range is at most the number of items are "narrow", everything else that
+# isn't an int is "other"
+KINDS = ("narrow int", "int", "other")
+ORDERS = ("sorted", "reversed", "nearly sorted", "random")
+DUPLICATES = ("distinct", "few unique")
+
+# the input is profiled from this many evenly spaced items, and its order from this many
+# windows of consecutive items
+SAMPLE_SIZE = 1024
+ORDER_WINDOWS = 16
+ORDER_WINDOW_SIZE = 64
+# less than this fraction of descents is "nearly sorted"
+NEARLY_SORTED_RATIO = 0.1
+# more than this fraction of repeated items in the sample is "few unique"
+FEW_UNIQUE_RATIO = 0.5
+
+# quadratic sorts are only considered for the sizes where they can win
+QUADRATIC_ALGORITHMS = {"Insertion Sort", "Selection Sort"}
+QUADRATIC_SIZE_CLASSES = {"tiny", "small"}
+# sorts that need integer keys, and raise TypeError or ValueError otherwise
+INTEGER_ALGORITHMS = {"LSD Radix Sort", "MSD Radix Sort", "Counting Sort"}
+
+# dispatch tables are cached per host, since the fastest sort depends on the machine
+DEFAULT_TABLE_PATH = os.environ.get(
+    "SMART_SORT_TABLE",
+    os.path.join(os.path.expanduser("~"), ".cache", "sorting", f"smart_sort-{platform.node() or 'unknown'}.json"))
+
+
+def smart_sort(arr, key=None, reverse=False, table=None, out=None, inplace=False):
+    """Sort arr with the algorithm that is fastest for inputs like it.
+
+    A sample of arr is profiled (size, presortedness, duplicates, key type and range),
+    the profile is reduced to a class like "large/int/nearly sorted/distinct", and the
+    sort registered for that class in the dispatch table is used. If an integer-only sort
+    was picked and the keys turn out not to be integers, or to span too wide a range,
+    the sort for the same class with "other" keys is used instead.
+
+    Args:
+        arr: The items to sort
+        key: Function computing the sort key of an item (default: the item itself)
+        reverse: Sort in descending order, keeping equal items in their original order
+        table: Dispatch table mapping class keys to names in SORTING_ALGORITHMS
+            (default: the calibrated table of this host, see load_dispatch_table)
+        out: Write the sorted items into this list or buffer instead, see sorting.buffers
+        inplace: Sort arr itself, whichever sort is picked
+
+    Returns:
+        The sorted items. Like the sorts in SORTING_ALGORITHMS, arr itself may or may
+        not be sorted in place, so use the return value, unless out or inplace is given
+        or arr is a buffer.
+    """
+    if out is not None and inplace:
+        raise ValueError("out and inplace can't be used together")
+    if len(arr) < 2:
+        return arr if out is None else write_back(out, arr)
+    if table is None:
+        table = load_dispatch_table()
+
+    cls = classify(profile_input(arr, key), reverse)
+    name = choose_algorithm(cls, table)
+    if name in INTEGER_ALGORITHMS:
+        try:
+            return SORTING_ALGORITHMS[name](arr, key=key, reverse=reverse, out=out, inplace=inplace)
+        except (TypeError, ValueError):
+            # the integer sorts check their keys before writing anything back into arr
+            name = choose_algorithm(cls[:1] + ("other",) + cls[2:], table)
+    return SORTING_ALGORITHMS[name](arr, key=key, reverse=reverse, out=out, inplace=inplace)
+
+
+def profile_input(arr, key=None, sample_size=SAMPLE_SIZE):
+    """Profile arr from a sample of its items.
+
+    Args:
+        arr: The items to profile
+        key: Function computing the sort key of an item, applied to the sampled items only
+        sample_size: Number of evenly spaced items to sample
+
+    Returns:
+        Dict with the size, the type name of the keys ("int" for any integer type, "mixed"
+        if they differ), the range hi - lo + 1 of integer keys (None otherwise), the
+        fractions of adjacent pairs that descend and ascend, and the fraction of repeated
+        keys in the sample
+    """
+    n = len(arr)
+    step = max(1, n / sample_size)
+    sample = [arr[int(i * step)] for i in range(min(n, sample_size))]
+    if key is not None:
+        sample = [key(x) for x in sample]
+
+    if all(isinstance(x, numbers.Integral) and not isinstance(x, bool) for x in sample):
+        key_type = "int"
+    else:
+        types = {type(x) for x in sample}
+        key_type = types.pop().__name__ if len(types) == 1 else "mixed"
+    key_range = None
+    if key_type == "int":
+        # without a key min and max are exact, and cheap next to any sort
+        keys = sample if key is not None else arr
+        key_range = int(max(keys)) - int(min(keys)) + 1
+
+    try:
+        duplicate_ratio = 1 - len(set(sample)) / len(sample)
+    except TypeError:
+        duplicate_ratio = 0.0
+
+    descents = ascents = pairs = 0
+    for window in order_windows(arr, key):
+        for a, b in zip(window, window[1:]):
+            try:
+                if b < a:
+                    descents += 1
+                elif a < b:
+                    ascents += 1
+            except TypeError:
+                pass
+            pairs += 1
+
+    return {
+        "size": n,
+        "type": key_type,
+        "range": key_range,
+        "descent_ratio": descents / pairs if pairs else 0.0,
+        "ascent_ratio": ascents / pairs if pairs else 0.0,
+        "duplicate_ratio": duplicate_ratio,
+    }
+
+
+def order_windows(arr, key=None):
+    # runs of consecutive items spread over arr, or all of arr if it is small
+    n = len(arr)
+    if n <= ORDER_WINDOWS * ORDER_WINDOW_SIZE:
+        starts = [0]
+        size = n
+    else:
+        stride = (n - ORDER_WINDOW_SIZE) / (ORDER_WINDOWS - 1)
+        starts = [int(i * stride) for i in range(ORDER_WINDOWS)]
+        size = ORDER_WINDOW_SIZE
+    for start in starts:
+        window = arr[start:start + size]
+        yield window if key is None else [key(x) for x in window]
+
+
+def classify(profile, reverse=False):
+    """Reduce a profile to its (size, kind, order, duplicates) class.
+
+    With reverse=True the order is judged against the descending order that is wanted,
+    so a reversed input counts as sorted.
+    """
+    size_class = next(name for name, limit in SIZE_CLASSES if limit is None or profile["size"] <= limit)
+
+    if profile["type"] != "int":
+        kind = "other"
+    elif profile["range"] <= profile["size"]:
+        kind = "narrow int"
+    else:
+        kind = "int"
+
+    descents, ascents = profile["descent_ratio"], profile["ascent_ratio"]
+    if reverse:
+        descents, ascents = ascents, descents
+    if descents == 0:
+        order = "sorted"
+    elif ascents == 0:
+        order = "reversed"
+    elif descents < NEARLY_SORTED_RATIO:
+        order = "nearly sorted"
+    else:
+        order = "random"
+
+    duplicates = "few unique" if profile["duplicate_ratio"] > FEW_UNIQUE_RATIO else "distinct"
+    return size_class, kind, order, duplicates
+
+
+def class_key(cls):
+    """Return the key of a class in a dispatch table, e.g. "large/int/random/distinct"."""
+    return "/".join(cls)
+
+
+def all_classes():
+    """Return every (size, kind, order, duplicates) class."""
+    return [(size_class, kind, order, duplicates)
+            for size_class, _ in SIZE_CLASSES for kind in KINDS for order in ORDERS for duplicates in DUPLICATES]
+
+
+def default_algorithm(cls):
+    """Return the algorithm used for a class that hasn't been calibrated on this host."""
+    size_class, kind, order, duplicates = cls
+    if size_class == "tiny":
+        return "Insertion Sort"
+    if order in ("sorted", "reversed"):
+        return "Full Tim Sort"
+    if kind == "narrow int":
+        return "Counting Sort"
+    if duplicates == "few unique":
+        # three-way partitioning puts all copies of the pivot in place at once
+        return "Quick Sort"
+    if order == "nearly sorted":
+        return "Full Tim Sort"
+    return "LSD Radix Sort" if kind == "int" else "In-Place Quick Sort"
+
+
+def choose_algorithm(cls, table):
+    """Return the name of the sort for a class, from table or else from default_algorithm."""
+    name = table.get(class_key(cls))
+    if name not in SORTING_ALGORITHMS:
+        name = default_algorithm(cls)
+    return name
+
+
+def generate_class_input(cls, size, rng=random):
+    """Generate an input of the given size that falls into class cls."""
+    _, kind, order, duplicates = cls
+    if kind == "narrow int":
+        values = list(range(size))
+    elif kind == "int":
+        values = [rng.randint(-2**31, 2**31 - 1) for _ in range(size)]
+    else:
+        values = [rng.random() for _ in range(size)]
+
+    if duplicates == "few unique":
+        unique = rng.sample(values, max(2, min(8, size // 8)))
+        arr = [rng.choice(unique) for _ in range(size)]
+    else:
+        arr = values
+        rng.shuffle(arr)
+
+    if order != "random":
+        arr.sort(reverse=order == "reversed")
+    if order == "nearly sorted":
+        for _ in range(max(1, size // 50)):
+            i, j = rng.randrange(size), rng.randrange(size)
+            arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+
+def candidate_algorithms(cls):
+    """Return the names of the sorts that are timed for a class during calibration."""
+    size_class, kind, _, _ = cls
+    return [name for name in SORTING_ALGORITHMS
+            if (name not in QUADRATIC_ALGORITHMS or size_class in QUADRATIC_SIZE_CLASSES)
+            and (name not in INTEGER_ALGORITHMS or kind != "other")]
+
+
+def calibrate(classes=None, sizes=CALIBRATION_SIZES, trials=3, seed=0, timings=None):
+    """Time the candidate sorts on an input of every class and pick the fastest for each.
+
+    Every candidate sorts copies of the same seeded input, trials times, and its best
+    time counts. Small inputs are sorted several times per timing. A candidate is dropped after its first trial if it was more than four
+    times slower than the fastest so far.
+
+    Args:
+        classes: The classes to calibrate (default: all_classes())
+        sizes: Input size for each size class
+        trials: Number of times each candidate sorts the input
+        seed: Seed of the generated inputs
+        timings: If given, filled with the best time in seconds of every candidate,
+            keyed by class key and then by algorithm name
+
+    Returns:
+        Dispatch table mapping class keys to the name of the fastest sort
+    """
+    table = {}
+    for cls in classes or all_classes():
+        rng = random.Random(f"{seed}/{class_key(cls)}")
+        arr = generate_class_input(cls, sizes[cls[0]], rng)
+        expected = sorted(arr)
+
+        loops = max(1, CALIBRATION_LOOP_ITEMS // len(arr))
+
+        times = {}
+        for name in candidate_algorithms(cls):
+            sort_func = SORTING_ALGORITHMS[name]
+            best = None
+            for _ in range(trials):
+                copies = [arr.copy() for _ in range(loops)]
+                start = time.perf_counter()
+                try:
+                    for copy in copies:
+                        result = sort_func(copy)
+                except (TypeError, ValueError):
+                    break
+                elapsed = (time.perf_counter() - start) / loops
+                if list(result) != expected:
+                    break
+                best = elapsed if best is None else min(best, elapsed)
+                if times and best > 4 * min(times.values()):
+                    break
+            if best is not None:
+                times[name] = best
+
+        table[class_key(cls)] = min(times, key=times.get)
+        if timings is not None:
+            timings[class_key(cls)] = times
+    return table
+
+
+def save_dispatch_table(table, path=DEFAULT_TABLE_PATH):
+    """Save a dispatch table, with the host and algorithms it was calibrated for, as JSON."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({
+            "host": platform.node(),
+            "python": platform.python_version(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "table": table,
+        }, f, indent=2)
+    load_dispatch_table.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def load_dispatch_table(path=DEFAULT_TABLE_PATH):
+    """Return the cached dispatch table of this host, or an empty table if there is none.
+
+    Tables calibrated on another host are ignored. Classes missing from the table use
+    default_algorithm.
+    """
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("host") != platform.node():
+        return {}
+    return data.get("table", {})
@@ -0,0 +1,86 @@
+import pytest
+import random
+from smart_sort import (smart_sort, profile_input, classify, class_key, all_classes, calibrate,
+                        choose_algorithm, default_algorithm, save_dispatch_table, load_dispatch_table)
+
+def test_smart_sort_random_ints():
+    array = [random.randint(-1000, 1000) for _ in range(5000)]
+    assert smart_sort(array.copy()) == sorted(array)  # Large random integers
+
+def test_smart_sort_small_arrays():
+    assert smart_sort([]) == []  # Empty array
+    assert smart_sort([42]) == [42]  # Single element
+    assert smart_sort([3, 1, 2]) == [1, 2, 3]  # Tiny array
+
+def test_smart_sort_floats_and_strings():
+    floats = [random.random() for _ in range(500)]
+    words = [str(random.random()) for _ in range(500)]
+    assert smart_sort(floats.copy()) == sorted(floats)  # Floats can't use the integer sorts
+    assert smart_sort(words.copy()) == sorted(words)  # Neither can strings
+
+def test_smart_sort_key_and_reverse_are_stable():
+    records = [(random.randint(0, 5), i) for i in range(1000)]
+    assert smart_sort(records.copy(), key=lambda r: r[0]) == sorted(records, key=lambda r: r[0])  # Stable with a key
+    assert smart_sort(records.copy(), key=lambda r: r[0], reverse=True) == sorted(records, key=lambda r: r[0], reverse=True)  # Stable in reverse
+
+def test_smart_sort_falls_back_when_keys_are_not_ints():
+    array = [random.randint(0, 100) for _ in range(1000)] + [0.5]
+    table = {class_key(("medium", "narrow int", "random", "few unique")): "Counting Sort"}
+    assert smart_sort(array.copy(), table=table) == sorted(array)  # A float the sample missed
+
+def test_profile_input():
+    profile = profile_input(list(range(10000)))
+    assert profile["size"] == 10000
+    assert profile["type"] == "int"
+    assert profile["range"] == 10000  # Exact without a key
+    assert profile["descent_ratio"] == 0  # Sorted
+    assert profile["duplicate_ratio"] == 0  # All distinct
+
+def test_profile_input_with_key():
+    profile = profile_input([("b", 2), ("a", 1)] * 100, key=lambda r: r[1])
+    assert profile["type"] == "int"  # Profiles the keys
+    assert profile["duplicate_ratio"] == 0.99  # Two unique keys in 200 items
+
+def test_classify():
+    assert classify(profile_input(list(range(10)))) == ("tiny", "narrow int", "sorted", "distinct")
+    assert classify(profile_input(list(range(10, 0, -1)))) == ("tiny", "narrow int", "reversed", "distinct")
+    assert classify(profile_input(list(range(10, 0, -1))), reverse=True)[2] == "sorted"  # Already in descending order
+    assert classify(profile_input([random.random() for _ in range(5000)])) == ("large", "other", "random", "distinct")
+    assert classify(profile_input([random.choice([0, 10**9]) for _ in range(1000)])) == ("medium", "int", "random", "few unique")
+
+def test_classify_nearly_sorted():
+    array = list(range(10000))
+    for i in range(0, 10000, 500):
+        array[i], array[i + 1] = array[i + 1], array[i]
+    assert classify(profile_input(array))[2] == "nearly sorted"  # A few swaps
+
+def test_smart_sort_buffers_and_out():
+    from array import array
+    for table in ({}, {class_key(cls): "Merge Sort" for cls in all_classes()}):
+        values = array("q", [random.randint(-1000, 1000) for _ in range(300)])
+        expected = sorted(values)
+        assert smart_sort(values, table=table) is values  # Buffers are sorted in place by any sort
+        assert values.tolist() == expected
+        out = [0] * 300
+        items = [random.random() for _ in range(300)]
+        assert smart_sort(items, table=table, out=out) is out  # out is filled, the input left alone
+        assert out == sorted(items) and out != items
+    assert smart_sort([7], out=[0]) == [7]  # Also for tiny inputs
+
+def test_default_table_covers_every_class():
+    for cls in all_classes():
+        assert choose_algorithm(cls, {}) == default_algorithm(cls)  # Uncalibrated classes use the defaults
+
+def test_calibrate():
+    classes = [("tiny", "int", "random", "distinct"), ("small", "other", "sorted", "distinct")]
+    timings = {}
+    table = calibrate(classes, trials=1, timings=timings)
+    assert set(table) == {class_key(cls) for cls in classes}
+    assert table[class_key(classes[0])] in timings[class_key(classes[0])]  # The fastest timed candidate
+    assert "Selection Sort" not in calibrate([("medium", "int", "random", "distinct")], trials=1).values()  # No quadratic sorts for larger sizes
+
+def test_save_and_load_dispatch_table(tmp_path):
+    path = str(tmp_path / "table.json")
+    assert load_dispatch_table(path) == {}  # No table yet
+    save_dispatch_table({"tiny/int/random/distinct": "Heap Sort"}, path)
+    assert load_dispatch_table(path) == {"tiny/int/random/distinct": "Heap Sort"}  # Reloaded after saving
@@ -0,0 +1,274 @@
+import os
+import sys
+from bisect import bisect_left, bisect_right
+from itertools import chain
+
+# Add root directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.merge_sort.merge_sort import merge
+from sorting.timsort.timsort import timsort
+
+# chunks are split in half once they hold twice this many items, and joined with a
+# neighbour once they hold less than half of it
+DEFAULT_CHUNK_SIZE = 1000
+# a chunk is merged with the part of a batch that falls into it if that part has at least
+# 1/MERGE_RATIO as many items, smaller parts are inserted one by one with bisect
+MERGE_RATIO = 4
+
+
+class SortedList:
+    """A list that stays sorted while items are added and removed, for data that keeps arriving.
+
+    The items are kept in a list of sorted chunks of about chunk_size items, along with the
+    largest key of every chunk. An add bisects the chunk maxima and then the chunk, and
+    inserts into a list of at most 2 * chunk_size items, so it costs O(log n) comparisons
+    plus a short memmove instead of a sort of the whole list. update() sorts a batch with
+    timsort and merges it into the chunks it falls into with merge.
+
+    Equal keys keep their insertion order, so the list is stable like the sorts. With key,
+    items are ordered by key(item), and the lookups take keys, as in bisect.
+    """
+
+    def __init__(self, iterable=(), key=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        if chunk_size < 2:
+            raise ValueError("chunk_size must be at least 2")
+        self.key = key
+        self.chunk_size = chunk_size
+        self.chunks = []
+        self.maxes = []
+        self.size = 0
+        self.update(iterable)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        # streams the items chunk by chunk, without building one list of all of them
+        return chain.from_iterable(self.chunks)
+
+    def __reversed__(self):
+        return chain.from_iterable(reversed(chunk) for chunk in reversed(self.chunks))
+
+    def __contains__(self, item):
+        return self.locate_item(item)[0] is not None
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("SortedList index out of range")
+        for chunk in self.chunks:
+            if index < len(chunk):
+                return chunk[index]
+            index -= len(chunk)
+
+    def __repr__(self):
+        return f"SortedList({list(self)!r})"
+
+    def key_of(self, item):
+        return item if self.key is None else self.key(item)
+
+    def keys_of(self, items):
+        return items if self.key is None else [self.key(x) for x in items]
+
+    def add(self, item):
+        """Insert item after any items with an equal key."""
+        k = self.key_of(item)
+        if not self.chunks:
+            self.chunks.append([item])
+            self.maxes.append(k)
+            self.size = 1
+            return
+
+        chunk_index = min(bisect_right(self.maxes, k), len(self.chunks) - 1)
+        chunk = self.chunks[chunk_index]
+        chunk.insert(bisect_right(chunk, k, key=self.key), item)
+        if not k < self.maxes[chunk_index]:
+            self.maxes[chunk_index] = k
+        self.size += 1
+        if len(chunk) >= 2 * self.chunk_size:
+            self.split(chunk_index)
+
+    def update(self, items):
+        """Sort a batch of items and merge it in, after any items with equal keys.
+
+        Each chunk is merged only with the part of the batch that falls into it, and only
+        if that part is large enough to pay for the merge. A batch at least as large as the
+        list is merged with the whole list at once.
+        """
+        batch = list(items)
+        if not batch:
+            return
+        timsort(batch, key=self.key)
+
+        if len(batch) >= self.size:
+            self.rebuild(merge(list(self), batch, key=self.key))
+            return
+
+        batch_keys = self.keys_of(batch)
+        last = len(self.chunks) - 1
+        start = 0
+        while start < len(batch):
+            # the run of the batch that falls into one chunk; keys equal to the chunk's
+            # largest go after it, where add puts them too
+            chunk_index = min(bisect_right(self.maxes, batch_keys[start]), last)
+            stop = len(batch) if chunk_index == last else bisect_left(batch_keys, self.maxes[chunk_index], start)
+            chunk = self.chunks[chunk_index]
+            if (stop - start) * MERGE_RATIO >= len(chunk):
+                self.chunks[chunk_index] = merge(chunk, batch[start:stop], key=self.key)
+            else:
+                for i in range(start, stop):
+                    chunk.insert(bisect_right(chunk, batch_keys[i], key=self.key), batch[i])
+            if self.maxes[chunk_index] < batch_keys[stop - 1]:
+                self.maxes[chunk_index] = batch_keys[stop - 1]
+            start = stop
+        self.size += len(batch)
+
+        # split the chunks that grew too large, from the end so the indexes stay valid
+        for chunk_index in reversed(range(len(self.chunks))):
+            if len(self.chunks[chunk_index]) >= 2 * self.chunk_size:
+                self.split(chunk_index)
+
+    def rebuild(self, items):
+        # replace the contents with the sorted list items, cut into chunks
+        self.chunks = [items[i:i + self.chunk_size] for i in range(0, len(items), self.chunk_size)]
+        self.maxes = [self.key_of(chunk[-1]) for chunk in self.chunks]
+        self.size = len(items)
+
+    def split(self, chunk_index):
+        # cut a chunk into pieces of chunk_size items
+        chunk = self.chunks[chunk_index]
+        pieces = [chunk[i:i + self.chunk_size] for i in range(0, len(chunk), self.chunk_size)]
+        self.chunks[chunk_index:chunk_index + 1] = pieces
+        self.maxes[chunk_index:chunk_index + 1] = [self.key_of(piece[-1]) for piece in pieces]
+
+    def remove(self, item):
+        """Remove the first item equal to item, or raise ValueError if there is none."""
+        chunk_index, offset = self.locate_item(item)
+        if chunk_index is None:
+            raise ValueError(f"{item!r} not in SortedList")
+        self.delete(chunk_index, offset)
+
+    def discard(self, item):
+        """Remove the first item equal to item, if there is one."""
+        chunk_index, offset = self.locate_item(item)
+        if chunk_index is not None:
+            self.delete(chunk_index, offset)
+
+    def pop(self, index=-1):
+        """Remove and return the item at index, by default the largest."""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("pop index out of range")
+        for chunk_index, chunk in enumerate(self.chunks):
+            if index < len(chunk):
+                item = chunk[index]
+                self.delete(chunk_index, index)
+                return item
+            index -= len(chunk)
+
+    def delete(self, chunk_index, offset):
+        # remove one item, then drop the chunk if it is empty or join it with a neighbour
+        # if it got too small
+        chunk = self.chunks[chunk_index]
+        del chunk[offset]
+        self.size -= 1
+        if not chunk:
+            del self.chunks[chunk_index]
+            del self.maxes[chunk_index]
+            return
+        if offset == len(chunk):
+            self.maxes[chunk_index] = self.key_of(chunk[-1])
+        if len(chunk) < self.chunk_size // 2 and len(self.chunks) > 1:
+            left = chunk_index - 1 if chunk_index == len(self.chunks) - 1 else chunk_index
+            self.chunks[left:left + 2] = [self.chunks[left] + self.chunks[left + 1]]
+            self.maxes[left:left + 2] = [self.maxes[left + 1]]
+            if len(self.chunks[left]) >= 2 * self.chunk_size:
+                self.split(left)
+
+    def locate_item(self, item):
+        # (chunk index, offset) of the first item equal to item, or (None, None)
+        k = self.key_of(item)
+        chunk_index = bisect_left(self.maxes, k)
+        while chunk_index < len(self.chunks):
+            chunk = self.chunks[chunk_index]
+            offset = bisect_left(chunk, k, key=self.key)
+            for offset in range(offset, len(chunk)):
+                if chunk[offset] == item:
+                    return chunk_index, offset
+                if self.key is None or self.key(chunk[offset]) != k:
+                    return None, None
+            chunk_index += 1
+        return None, None
+
+    def position(self, chunk_index, offset):
+        # index in the whole list of an offset into a chunk
+        return sum(len(chunk) for chunk in self.chunks[:chunk_index]) + offset
+
+    def bisect_left(self, k):
+        """Number of items with a key strictly less than k."""
+        chunk_index = bisect_left(self.maxes, k)
+        if chunk_index == len(self.chunks):
+            return self.size
+        chunk = self.chunks[chunk_index]
+        offset = bisect_left(chunk, k, key=self.key)
+        return self.position(chunk_index, offset)
+
+    def bisect_right(self, k):
+        """Number of items with a key less than or equal to k."""
+        chunk_index = bisect_right(self.maxes, k)
+        if chunk_index == len(self.chunks):
+            return self.size
+        chunk = self.chunks[chunk_index]
+        offset = bisect_right(chunk, k, key=self.key)
+        return self.position(chunk_index, offset)
+
+    def find(self, k):
+        """Index of the leftmost item with key k, or None, like binary_search."""
+        i = self.bisect_left(k)
+        if i < self.size and self.key_of(self[i]) == k:
+            return i
+        return None
+
+    def count(self, k):
+        return self.bisect_right(k) - self.bisect_left(k)
+
+    def count_range(self, low, high, inclusive=(True, True)):
+        """Number of items with a key between low and high, including the ends selected by inclusive."""
+        start = self.bisect_left(low) if inclusive[0] else self.bisect_right(low)
+        stop = self.bisect_right(high) if inclusive[1] else self.bisect_left(high)
+        return max(0, stop - start)
+
+    def irange(self, low=None, high=None, inclusive=(True, True)):
+        """Yield the items with a key between low and high in sorted order, one chunk at a time.
+
+        low=None and high=None leave that end of the range open.
+        """
+        if low is None:
+            chunk_index, offset = 0, 0
+        else:
+            find = bisect_left if inclusive[0] else bisect_right
+            chunk_index = find(self.maxes, low)
+            if chunk_index == len(self.chunks):
+                return
+            chunk = self.chunks[chunk_index]
+            offset = find(chunk, low, key=self.key)
+
+        while chunk_index < len(self.chunks):
+            chunk = self.chunks[chunk_index]
+            # equal keys can continue in the next chunk, so an inclusive range only ends in
+            # a chunk with a larger key
+            if high is not None and (high < self.maxes[chunk_index] if inclusive[1] else not self.maxes[chunk_index] < high):
+                find = bisect_right if inclusive[1] else bisect_left
+                stop = find(chunk, high, offset, key=self.key)
+                yield from chunk[offset:stop]
+                return
+            yield from chunk[offset:]
+            chunk_index += 1
+            offset = 0
+
+    def range(self, low, high):
+        """Items with low <= key <= high, like SortedIndex.range."""
+        return list(self.irange(low, high))
@@ -0,0 +1,88 @@
+import pytest
+import random
+from sorted_list import SortedList
+
+def test_sorted_list_add():
+    items = SortedList(chunk_size=4)
+    for x in [5, 3, 8, 1, 9, 2, 7, 3]:
+        items.add(x)
+    assert list(items) == [1, 2, 3, 3, 5, 7, 8, 9]
+    assert len(items) == 8
+    assert len(items.chunks) > 1  # Split into chunks
+
+def test_sorted_list_update_merges_batches():
+    random.seed(1)
+    items = SortedList(chunk_size=8)
+    expected = []
+    for _ in range(20):
+        batch = [random.randint(0, 50) for _ in range(random.randint(0, 15))]
+        items.update(batch)
+        expected.extend(batch)
+        assert list(items) == sorted(expected)  # Sorted after every batch
+    assert all(len(chunk) < 16 for chunk in items.chunks)  # Large chunks were split
+
+def test_sorted_list_is_stable():
+    items = SortedList(key=lambda r: r[0], chunk_size=4)
+    records = [(random.randint(0, 3), i) for i in range(100)]
+    for record in records[:50]:
+        items.add(record)
+    items.update(records[50:60])
+    items.update(records[60:])
+    assert list(items) == sorted(records, key=lambda r: r[0])  # Equal keys in insertion order
+
+def test_sorted_list_remove():
+    items = SortedList([5, 1, 3, 3, 9], chunk_size=2)
+    items.remove(3)
+    assert list(items) == [1, 3, 5, 9]
+    items.discard(4)  # Missing items are ignored by discard
+    with pytest.raises(ValueError):
+        items.remove(4)
+    assert items.pop() == 9
+    assert items.pop(0) == 1
+    assert list(items) == [3, 5]
+
+def test_sorted_list_remove_everything():
+    random.seed(2)
+    values = [random.randint(0, 100) for _ in range(300)]
+    items = SortedList(values, chunk_size=8)
+    for value in random.sample(values, len(values)):
+        items.remove(value)
+        assert value not in items or values.count(value) > 1
+    assert list(items) == [] and items.chunks == []  # Empty chunks are dropped
+
+def test_sorted_list_remove_with_key():
+    items = SortedList([("a", 1), ("b", 1), ("c", 2)], key=lambda r: r[1])
+    items.remove(("b", 1))
+    assert list(items) == [("a", 1), ("c", 2)]  # Only the equal item, not the equal key
+    assert ("b", 1) not in items
+
+def test_sorted_list_lookups():
+    items = SortedList([1, 3, 3, 3, 5, 7], chunk_size=2)
+    assert items.find(3) == 1  # Leftmost match, like binary_search
+    assert items.find(4) is None
+    assert items.bisect_left(3) == 1
+    assert items.bisect_right(3) == 4
+    assert items.count(3) == 3
+    assert items[0] == 1 and items[-1] == 7
+    with pytest.raises(IndexError):
+        items[6]
+
+def test_sorted_list_range_queries():
+    items = SortedList(range(100), chunk_size=4)
+    assert items.range(10, 15) == [10, 11, 12, 13, 14, 15]
+    assert list(items.irange(10, 15, inclusive=(False, False))) == [11, 12, 13, 14]
+    assert list(items.irange(high=2)) == [0, 1, 2]  # Open low end
+    assert list(items.irange(97)) == [97, 98, 99]  # Open high end
+    assert items.count_range(10, 19) == 10
+    assert items.range(200, 300) == []
+
+def test_sorted_list_range_spanning_equal_keys():
+    items = SortedList([1] + [2] * 10 + [3], chunk_size=2)
+    assert items.range(2, 2) == [2] * 10  # Equal keys across several chunks
+    assert items.count_range(1, 2) == 11
+
+def test_sorted_list_streams_lazily():
+    items = SortedList(range(10000), chunk_size=100)
+    stream = iter(items)
+    assert [next(stream) for _ in range(3)] == [0, 1, 2]  # No full copy
+    assert list(reversed(items))[:2] == [9999, 9998]
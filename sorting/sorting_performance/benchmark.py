@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Benchmark engine for timings that are stable enough to compare between runs.
+
+test_sorting_algorithm times a single call, which is fine for charts but too noisy to
+catch small regressions. This engine:
+
+- times with time.perf_counter_ns, the highest resolution monotonic clock available
+- calibrates the number of calls per round so a round lasts at least min_time, so fast
+  sorts aren't measured at the resolution of the clock
+- runs warmup rounds that are thrown away before the measured rounds
+- sorts fresh copies of the same seeded input every call, made before the clock starts
+- optionally disables the garbage collector while a round is timed, like timeit
+- reports the median with a distribution-free confidence interval, the median absolute
+  deviation and the interquartile range, which outliers from a noisy machine barely move
+
+Results can be saved to JSON and compared against a saved baseline. A change only counts
+as a regression when the median slows down by more than the threshold (3% by default)
+and the confidence intervals of the two runs don't overlap. The script exits with
+status 1 on a regression, so it can gate CI.
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+# Add parent directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.algorithms import SORTING_ALGORITHMS
+
+# each measured round lasts at least this long, in seconds
+DEFAULT_MIN_TIME = 0.02
+DEFAULT_ROUNDS = 20
+DEFAULT_WARMUP = 2
+DEFAULT_THRESHOLD = 0.03
+# upper bound on calls per round, so tiny inputs don't need millions of copies
+MAX_LOOPS = 100000
+
+def generate_benchmark_array(size: int, seed: int = 0) -> List[int]:
+    """Generate the same random array for a given size and seed on every run."""
+    rng = random.Random(seed * 1000003 + size)
+    return [rng.randint(0, size * 10) for _ in range(size)]
+
+def time_round(sort_func: Callable, array: List, loops: int, disable_gc: bool = True) -> float:
+    """Time `loops` calls of sort_func, each on a fresh copy of array.
+    
+    Args:
+        sort_func: The sorting function to time
+        array: The input, copied before the clock starts
+        loops: Number of calls in the round
+        disable_gc: Disable the garbage collector while the round is timed
+    
+    Returns:
+        float: Average time per call in nanoseconds
+    """
+    copies = [array.copy() for _ in range(loops)]
+    
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    if disable_gc:
+        gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        for copy in copies:
+            sort_func(copy)
+        end = time.perf_counter_ns()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    
+    return (end - start) / loops
+
+def calibrate(sort_func: Callable, array: List, min_time: float = DEFAULT_MIN_TIME, disable_gc: bool = True) -> int:
+    """Find the number of calls per round needed for a round to last at least min_time seconds.
+    
+    The rounds are timed with the garbage collector set as by disable_gc, like the rounds they size.
+    """
+    min_time_ns = min_time * 1e9
+    loops = 1
+    
+    # grow the round tenfold until it is long enough to measure, then scale to the target
+    while True:
+        total = time_round(sort_func, array, loops, disable_gc) * loops
+        if total >= min_time_ns / 10 or loops >= MAX_LOOPS:
+            break
+        loops *= 10
+    
+    return max(1, min(MAX_LOOPS, math.ceil(loops * min_time_ns / max(total, 1))))
+
+def median_confidence_interval(samples: List[float], confidence: float = 0.95) -> tuple:
+    """Confidence interval of the median from the order statistics of the samples.
+    
+    The number of samples below the true median is Binomial(n, 1/2), which gives the ranks
+    of the interval bounds without assuming anything about the distribution of timings.
+    With fewer than 6 samples no pair of ranks reaches 95%, and the full range is returned.
+    """
+    ordered = sorted(samples)
+    n = len(ordered)
+    tail = (1 - confidence) / 2
+    
+    k = 0
+    cumulative = 0.0
+    while k < n and cumulative + math.comb(n, k) / 2 ** n <= tail:
+        cumulative += math.comb(n, k) / 2 ** n
+        k += 1
+    
+    if k == 0:
+        return ordered[0], ordered[-1]
+    return ordered[k - 1], ordered[n - k]
+
+def robust_statistics(samples: List[float], confidence: float = 0.95) -> Dict[str, float]:
+    """Summarize timing samples with statistics that tolerate outliers.
+    
+    Args:
+        samples: Time per call of every measured round
+        confidence: Confidence level of the interval around the median
+    
+    Returns:
+        Dict with min, max, mean, median and stdev like calculate_statistics, plus the
+        confidence interval of the median (ci_low, ci_high), the median absolute deviation
+        (mad), the quartiles (q1, q3, iqr), the number of rounds outside the Tukey fences
+        (outliers) and the relative spread mad / median (rsd)
+    """
+    median = statistics.median(samples)
+    mad = statistics.median(abs(x - median) for x in samples)
+    if len(samples) > 1:
+        q1, _, q3 = statistics.quantiles(samples, n=4)
+    else:
+        q1 = q3 = median
+    iqr = q3 - q1
+    ci_low, ci_high = median_confidence_interval(samples, confidence)
+    
+    return {
+        "min": min(samples),
+        "max": max(samples),
+        "mean": statistics.mean(samples),
+        "median": median,
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0,
+        "ci_low": ci_low,
+        "ci_high": ci_high,
+        "mad": mad,
+        "q1": q1,
+        "q3": q3,
+        "iqr": iqr,
+        "outliers": sum(1 for x in samples if x < q1 - 1.5 * iqr or x > q3 + 1.5 * iqr),
+        "rsd": mad / median if median else 0,
+    }
+
+def benchmark(sort_func: Callable, array: List, rounds: int = DEFAULT_ROUNDS, warmup: int = DEFAULT_WARMUP,
+              min_time: float = DEFAULT_MIN_TIME, disable_gc: bool = True,
+              loops: Optional[int] = None) -> Dict:
+    """Benchmark one sorting function on one input.
+    
+    Args:
+        sort_func: The sorting function to time
+        array: The input, every call sorts a fresh copy of it
+        rounds: Number of measured rounds
+        warmup: Number of rounds run and thrown away before measuring
+        min_time: Minimum duration of a round in seconds, used to calibrate loops
+        disable_gc: Disable the garbage collector while a round is timed
+        loops: Calls per round, calibrated from min_time if not given
+    
+    Returns:
+        Dict with the calls per round (loops), the time per call of every round in
+        seconds (samples) and their robust_statistics
+    """
+    if loops is None:
+        loops = calibrate(sort_func, array, min_time, disable_gc)
+    
+    for _ in range(warmup):
+        time_round(sort_func, array, loops, disable_gc)
+    
+    samples = [time_round(sort_func, array, loops, disable_gc) / 1e9 for _ in range(rounds)]
+    
+    result = {"loops": loops, "rounds": rounds, "samples": samples}
+    result.update(robust_statistics(samples))
+    return result
+
+def run_benchmarks(algorithms: Dict[str, Callable], sizes: List[int], seed: int = 0, **options) -> List[Dict]:
+    """Benchmark every algorithm at every size on seeded random arrays.
+    
+    Args:
+        algorithms: Dict mapping algorithm names to sorting functions
+        sizes: List of array sizes to test
+        seed: Seed of the input arrays, the same seed gives the same inputs on every run
+        **options: Passed to benchmark (rounds, warmup, min_time, disable_gc)
+    
+    Returns:
+        List of records, one per (algorithm, size), with the result of benchmark
+    """
+    records = []
+    for size in sizes:
+        array = generate_benchmark_array(size, seed)
+        for name, sort_func in algorithms.items():
+            result = benchmark(sort_func, array, **options)
+            records.append({"algorithm": name, "size": size, "seed": seed, **result})
+            print(f"{name} (n={size}): {format_time(result['median'])} "
+                  f"[{format_time(result['ci_low'])}, {format_time(result['ci_high'])}]")
+    return records
+
+def compare_to_baseline(baseline: List[Dict], current: List[Dict],
+                        threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """Compare the medians of two benchmark runs.
+    
+    A change is reported as a regression (or an improvement) only if the median changed by
+    more than threshold and the confidence intervals of the two runs don't overlap, so
+    noise alone doesn't fail the comparison.
+    
+    Args:
+        baseline: Records from an earlier run_benchmarks
+        current: Records from the run being checked
+        threshold: Relative change of the median that counts as significant
+    
+    Returns:
+        List of dicts with the algorithm, size, both medians, their ratio and a status of
+        "regression", "improvement" or "unchanged", for the records found in both runs
+    """
+    baseline_records = {(r["algorithm"], r["size"]): r for r in baseline}
+    comparisons = []
+    
+    for record in current:
+        base = baseline_records.get((record["algorithm"], record["size"]))
+        if base is None:
+            continue
+    
+        ratio = record["median"] / base["median"]
+        if ratio > 1 + threshold and record["ci_low"] > base["ci_high"]:
+            status = "regression"
+        elif ratio < 1 - threshold and record["ci_high"] < base["ci_low"]:
+            status = "improvement"
+        else:
+            status = "unchanged"
+    
+        comparisons.append({
+            "algorithm": record["algorithm"],
+            "size": record["size"],
+            "baseline": base["median"],
+            "current": record["median"],
+            "ratio": ratio,
+            "status": status,
+        })
+    
+    return comparisons
+
+def format_time(seconds: float) -> str:
+    """Format a duration with a unit that suits its magnitude."""
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+def print_results(records: List[Dict]) -> None:
+    """Print a table of the robust statistics of every record."""
+    print(f"\n{'Algorithm':<22} {'Size':>8} {'Loops':>6} {'Median':>12} {'95% CI':>27} {'MAD':>12} "
+          f"{'RSD':>6} {'Outliers':>8}")
+    for r in records:
+        ci = f"[{format_time(r['ci_low'])}, {format_time(r['ci_high'])}]"
+        print(f"{r['algorithm']:<22} {r['size']:>8} {r['loops']:>6} {format_time(r['median']):>12} {ci:>27} "
+              f"{format_time(r['mad']):>12} {r['rsd']:>6.1%} {r['outliers']:>8}")
+
+def print_comparison(comparisons: List[Dict]) -> None:
+    """Print the change of every median against the baseline."""
+    print(f"\n{'Algorithm':<22} {'Size':>8} {'Baseline':>12} {'Current':>12} {'Change':>8}  Status")
+    for c in comparisons:
+        print(f"{c['algorithm']:<22} {c['size']:>8} {format_time(c['baseline']):>12} "
+              f"{format_time(c['current']):>12} {c['ratio'] - 1:>+8.1%}  {c['status']}")
+
+def save_results(records: List[Dict], path: str) -> None:
+    """Save benchmark records as JSON, along with the interpreter and machine they ran on."""
+    data = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": records,
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+def load_results(path: str) -> List[Dict]:
+    """Load benchmark records saved by save_results."""
+    with open(path) as f:
+        return json.load(f)["results"]
+
+def main():
+    """Run the benchmarks and optionally compare them to a baseline."""
+    parser = argparse.ArgumentParser(description="Benchmark sorting algorithms with calibrated, repeated rounds.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000],
+                        help="List of array sizes to test (default: 1000 10000)")
+    parser.add_argument("--algorithms", nargs="+", choices=list(SORTING_ALGORITHMS), default=None,
+                        help="Algorithms to benchmark (default: all)")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS,
+                        help=f"Number of measured rounds (default: {DEFAULT_ROUNDS})")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP,
+                        help=f"Number of warmup rounds (default: {DEFAULT_WARMUP})")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                        help=f"Minimum duration of a round in seconds (default: {DEFAULT_MIN_TIME})")
+    parser.add_argument("--keep-gc", action="store_true", help="Leave the garbage collector enabled while timing")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the input arrays (default: 0)")
+    parser.add_argument("--save", default=None, help="Save the results to this JSON file")
+    parser.add_argument("--baseline", default=None, help="Compare against results saved with --save")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Slowdown of the median that fails the comparison (default: {DEFAULT_THRESHOLD})")
+    args = parser.parse_args()
+    
+    names = args.algorithms or list(SORTING_ALGORITHMS)
+    algorithms = {name: SORTING_ALGORITHMS[name] for name in names}
+    
+    records = run_benchmarks(algorithms, args.sizes, args.seed, rounds=args.rounds, warmup=args.warmup,
+                             min_time=args.min_time, disable_gc=not args.keep_gc)
+    print_results(records)
+    
+    if args.save:
+        save_results(records, args.save)
+        print(f"\nResults have been saved to {args.save}")
+    
+    if args.baseline:
+        comparisons = compare_to_baseline(load_results(args.baseline), records, args.threshold)
+        print_comparison(comparisons)
+        regressions = [c for c in comparisons if c["status"] == "regression"]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) slower than the {args.threshold:.0%} threshold")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
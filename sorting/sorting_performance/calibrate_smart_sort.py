@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Calibrate the dispatch table of smart_sort on this machine.
+
+smart_sort profiles its input and looks up the fastest sort for the input's class in a
+dispatch table. This script times the candidate sorts on a seeded input of every class,
+prints the fastest and the runner-up of each class next to the built-in default, and
+caches the table for this host, where smart_sort picks it up.
+"""
+
+import argparse
+import os
+import sys
+from typing import Dict
+
+# Add parent directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.smart_sort.smart_sort import (calibrate, save_dispatch_table, default_algorithm, all_classes,
+                                           class_key, CALIBRATION_SIZES, DEFAULT_TABLE_PATH, SIZE_CLASSES)
+
+def print_table(table: Dict[str, str], timings: Dict[str, Dict[str, float]]) -> None:
+    """Print the fastest and the runner-up sort of every class, and the default for the class.
+    
+    Args:
+        table: Dispatch table mapping class keys to algorithm names
+        timings: Best time in seconds of every candidate, keyed by class key and algorithm name
+    """
+    print(f"\n{'Class':<42} {'Fastest':<22} {'Time':>10} {'Runner-up':<30} {'Default':<22}")
+    for key, name in table.items():
+        times = sorted(timings[key].items(), key=lambda item: item[1])
+        runner_up = f"{times[1][0]} ({times[1][1] / times[0][1]:.2f}x)" if len(times) > 1 else "-"
+        default = default_algorithm(tuple(key.split("/")))
+        print(f"{key:<42} {name:<22} {times[0][1]:>10.6f} {runner_up:<30} {default:<22}")
+    
+    changed = sum(name != default_algorithm(tuple(key.split("/"))) for key, name in table.items())
+    print(f"\n{changed} of {len(table)} classes differ from the defaults")
+
+def main():
+    """Calibrate the dispatch table of smart_sort and cache it for this host."""
+    parser = argparse.ArgumentParser(description="Calibrate the dispatch table of smart_sort on this machine.")
+    parser.add_argument("--trials", type=int, default=3, help="Number of times each sort is timed per class (default: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated inputs (default: 0)")
+    parser.add_argument("--size-classes", nargs="+", default=[name for name, _ in SIZE_CLASSES],
+                        choices=[name for name, _ in SIZE_CLASSES], help="Only calibrate these size classes")
+    parser.add_argument("--output", default=DEFAULT_TABLE_PATH,
+                        help=f"Where to cache the table (default: {DEFAULT_TABLE_PATH})")
+    parser.add_argument("--dry-run", action="store_true", help="Print the table without caching it")
+    args = parser.parse_args()
+    
+    classes = [cls for cls in all_classes() if cls[0] in args.size_classes]
+    sizes = ", ".join(f"{name}={CALIBRATION_SIZES[name]}" for name in args.size_classes)
+    print(f"Calibrating {len(classes)} classes ({sizes}), {args.trials} trials each...")
+    
+    timings = {}
+    table = calibrate(classes, trials=args.trials, seed=args.seed, timings=timings)
+    print_table(table, timings)
+    
+    if not args.dry_run:
+        save_dispatch_table(table, args.output)
+        print(f"\nDispatch table saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
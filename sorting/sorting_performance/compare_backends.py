@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Script to compare the pure-Python and NumPy backends of the sorting algorithms on the same inputs.
+"""
+
+import argparse
+import os
+import matplotlib.pyplot as plt
+import numpy as np
+from typing import Dict
+from performance_test import (test_sorting_algorithm, calculate_statistics,
+                              print_statistics, SORTING_ALGORITHMS)
+from sorting.algorithms import NUMPY_SORTING_ALGORITHMS
+from distributions import generate_array
+
+def compare_backends(size: int, num_tests: int = 5, seed: int = 0) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Time every algorithm that has a NumPy backend with both backends.
+    
+    Both backends sort the same random arrays. The Python backend gets a list and the NumPy
+    backend gets an int64 ndarray, converted before timing starts.
+    
+    Args:
+        size: Size of the random arrays to generate
+        num_tests: Number of tests to run
+        
+    Returns:
+        Dict mapping backend names ("python", "numpy") to dictionaries mapping algorithm names to statistics
+    """
+    results = {"python": {}, "numpy": {}}
+    times = {backend: {algo: [] for algo in NUMPY_SORTING_ALGORITHMS} for backend in results}
+    
+    for i in range(num_tests):
+        print(f"\nTest {i+1}/{num_tests}")
+        array = generate_array("Random", size, seed, i)
+        typed_array = np.array(array, dtype=np.int64)
+        
+        for algo_name, numpy_sort in NUMPY_SORTING_ALGORITHMS.items():
+            python_time = test_sorting_algorithm(SORTING_ALGORITHMS[algo_name], array)
+            numpy_time = test_sorting_algorithm(numpy_sort, typed_array)
+            times["python"][algo_name].append(python_time)
+            times["numpy"][algo_name].append(numpy_time)
+            print(f"{algo_name}: python {python_time:.6f} seconds, numpy {numpy_time:.6f} seconds "
+                  f"({python_time / numpy_time:.1f}x)")
+    
+    for backend, backend_times in times.items():
+        results[backend] = calculate_statistics(backend_times)
+    return results
+
+def plot_backend_comparison(results: Dict[str, Dict[str, Dict[str, float]]], metric: str = "mean") -> None:
+    """Plot the Python and NumPy backends side by side for each algorithm."""
+    # Create output directory if it doesn't exist
+    os.makedirs("output", exist_ok=True)
+    
+    algorithms = list(NUMPY_SORTING_ALGORITHMS.keys())
+    positions = list(range(len(algorithms)))
+    bar_width = 0.35
+    
+    fig, ax = plt.subplots(figsize=(10, 6))
+    for i, backend in enumerate(results):
+        offset = (i - 0.5) * bar_width
+        ax.bar([p + offset for p in positions], [results[backend][algo][metric] for algo in algorithms],
+               bar_width, label=backend)
+    
+    ax.set_xlabel('Algorithm')
+    ax.set_ylabel(f'Time ({metric}, seconds)')
+    ax.set_title(f'Python vs NumPy Backend ({metric})')
+    ax.set_xticks(positions)
+    ax.set_xticklabels(algorithms, rotation=45)
+    ax.legend()
+    
+    plt.tight_layout()
+    plt.savefig(f"output/backend_comparison_{metric}.png")
+    plt.close()
+
+def main():
+    """Compare the Python and NumPy backends of the sorting algorithms."""
+    parser = argparse.ArgumentParser(description="Compare the Python and NumPy backends of the sorting algorithms.")
+    parser.add_argument("--size", type=int, default=10000, help="Size of the random arrays to generate (default: 10000)")
+    parser.add_argument("--tests", type=int, default=5, help="Number of tests to run (default: 5)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the input arrays (default: 0)")
+    args = parser.parse_args()
+    
+    print(f"Comparing Python and NumPy backends with arrays of size {args.size}")
+    
+    results = compare_backends(args.size, args.tests, args.seed)
+    
+    for backend, stats in results.items():
+        print(f"\nStatistics for the {backend} backend:")
+        print_statistics(stats)
+    
+    for metric in ["mean", "median", "min", "max"]:
+        plot_backend_comparison(results, metric)
+    
+    print("\nDone! Comparison results have been saved to the output directory.")
+
+if __name__ == "__main__":
+    main()
@@ -4,83 +4,102 @@ Script to compare sorting algorithm performance with different data distribution
 """
 
 import argparse
-import random
 import os
 import matplotlib.pyplot as plt
-from typing import List, Dict, Callable, Tuple
+from typing import List, Dict, Callable, Tuple, Optional
 from performance_test import test_sorting_algorithm, SORTING_ALGORITHMS, calculate_statistics, print_statistics
+# The array generators live in distributions.py, which worker processes can import without matplotlib
+from distributions import ARRAY_GENERATORS, ADVERSARIES, generate_array, generate_adversarial_array
+from results_store import save_times
+from scheduler import can_sort
+from profiling import CellProfiler, add_profile_arguments, profiler_from_args, save_profiles
 
-def generate_random_array(size: int) -> List[int]:
-    """Generate a random array of integers."""
-    return [random.randint(0, 1000) for _ in range(size)]
-
-def generate_nearly_sorted_array(size: int) -> List[int]:
-    """Generate a nearly sorted array of integers."""
-    arr = list(range(size))
-    # Swap a few elements to make it nearly sorted
-    swaps = size // 20  # 5% of elements will be out of place
-    for _ in range(swaps):
-        i, j = random.sample(range(size), 2)
-        arr[i], arr[j] = arr[j], arr[i]
-    return arr
-
-def generate_reverse_sorted_array(size: int) -> List[int]:
-    """Generate a reverse sorted array of integers."""
-    return list(range(size, 0, -1))
-
-def generate_few_unique_array(size: int) -> List[int]:
-    """Generate an array with few unique values."""
-    unique_values = [random.randint(0, 100) for _ in range(10)]
-    return [random.choice(unique_values) for _ in range(size)]
-
-def generate_sorted_with_outliers_array(size: int) -> List[int]:
-    """Generate a mostly sorted array with a few outliers."""
-    arr = list(range(size))
-    # Add a few outliers
-    outliers = size // 50  # 2% of elements will be outliers
-    for _ in range(outliers):
-        i = random.randint(0, size - 1)
-        arr[i] = random.randint(size, size * 2)
-    return arr
-
-# Dictionary of array generators
-ARRAY_GENERATORS: Dict[str, Callable[[int], List[int]]] = {
-    "Random": generate_random_array,
-    "Nearly Sorted": generate_nearly_sorted_array,
-    "Reverse Sorted": generate_reverse_sorted_array,
-    "Few Unique Values": generate_few_unique_array,
-    "Sorted with Outliers": generate_sorted_with_outliers_array,
-}
-
-def compare_distributions(size: int, num_tests: int = 5) -> Dict[str, Dict[str, Dict[str, float]]]:
+def compare_distributions(size: int, num_tests: int = 5, raw_times: Optional[Dict] = None,
+                          seed: int = 0, distributions: Optional[List[str]] = None,
+                          profiler: Optional[CellProfiler] = None) -> Dict[str, Dict[str, Dict[str, float]]]:
     """Compare sorting algorithm performance with different data distributions.
     
+    The inputs of an adversary are built against each algorithm once and sorted in every
+    test. Algorithms that can't sort a distribution (see scheduler.can_sort), like the
+    integer-only radix and counting sorts on floats and strings, are left out of its results.
+    
     Args:
         size: Size of the arrays to generate
         num_tests: Number of tests to run for each distribution
+        raw_times: If given, filled with the times of every test, keyed by (distribution, size)
+        seed: Seed of the input arrays, see distributions.generate_array
+        distributions: Names from ARRAY_GENERATORS and ADVERSARIES (default: all)
+        profiler: If given, profiles each algorithm once more on each distribution (see profiling.py)
         
     Returns:
         Dict mapping distribution names to dictionaries mapping algorithm names to statistics
     """
     results = {}
+    if distributions is None:
+        distributions = list(ARRAY_GENERATORS) + list(ADVERSARIES)
     
-    for dist_name, generator in ARRAY_GENERATORS.items():
+    for dist_name in distributions:
         print(f"\nTesting with distribution: {dist_name}")
         dist_results = {algo: [] for algo in SORTING_ALGORITHMS.keys()}
+        skipped = [algo for algo in SORTING_ALGORITHMS if not can_sort(algo, dist_name)]
+        
+        adversarial_arrays = {}
+        if dist_name in ADVERSARIES:
+            for algo_name, sort_func in SORTING_ALGORITHMS.items():
+                if algo_name not in skipped:
+                    adversarial_arrays[algo_name] = generate_adversarial_array(dist_name, sort_func, size, seed)
         
         for i in range(num_tests):
             print(f"  Test {i+1}/{num_tests}")
-            array = generator(size)
+            array = None if adversarial_arrays else generate_array(dist_name, size, seed, i)
             
             for algo_name, sort_func in SORTING_ALGORITHMS.items():
-                execution_time = test_sorting_algorithm(sort_func, array)
+                if algo_name in skipped:
+                    continue
+                execution_time = test_sorting_algorithm(sort_func, adversarial_arrays.get(algo_name, array))
                 dist_results[algo_name].append(execution_time)
                 print(f"    {algo_name}: {execution_time:.6f} seconds")
+                if profiler is not None:
+                    profiler.profile(algo_name, dist_name, size, sort_func, adversarial_arrays.get(algo_name, array))
         
+        for algo_name in skipped:
+            print(f"    {algo_name}: skipped, it can't sort this distribution")
+            del dist_results[algo_name]
         results[dist_name] = calculate_statistics(dist_results)
+        if raw_times is not None:
+            raw_times[dist_name, size] = dist_results
     
     return results
 
+def worst_cases(results: Dict[str, Dict[str, Dict[str, float]]],
+                average_case: str = "Random") -> Dict[str, Tuple[Optional[float], float, str]]:
+    """Find the distribution on which each algorithm has the largest mean time.
+    
+    Args:
+        results: Dict mapping distribution names to dictionaries mapping algorithm names to statistics
+        average_case: The distribution whose mean time is the average case
+        
+    Returns:
+        Dict mapping algorithm names to the average-case time (None if average_case wasn't
+        tested), the worst-case time and the worst distribution
+    """
+    cases = {}
+    for algo in SORTING_ALGORITHMS:
+        tested = {dist: stats[algo]["mean"] for dist, stats in results.items() if algo in stats}
+        if not tested:
+            continue
+        worst = max(tested, key=tested.get)
+        cases[algo] = (tested.get(average_case), tested[worst], worst)
+    return cases
+
+def print_worst_cases(cases: Dict[str, Tuple[Optional[float], float, str]]) -> None:
+    """Print the average-case and worst-case time of every algorithm side by side."""
+    print(f"\n{'Algorithm':<22} {'Average (s)':>12} {'Worst (s)':>12} {'Ratio':>7}  Worst distribution")
+    for algo, (average, worst, dist_name) in cases.items():
+        average_text = f"{average:>12.6f}" if average is not None else f"{'n/a':>12}"
+        ratio_text = f"{worst / average:>6.1f}x" if average else f"{'n/a':>7}"
+        print(f"{algo:<22} {average_text} {worst:>12.6f} {ratio_text}  {dist_name}")
+
 def plot_distribution_comparison(results: Dict[str, Dict[str, Dict[str, float]]], metric: str = "mean") -> None:
     """Plot the comparison of sorting algorithms with different data distributions.
     
@@ -97,13 +116,14 @@ def plot_distribution_comparison(results: Dict[str, Dict[str, Dict[str, float]]]
     # Prepare data for plotting
     data = {}
     for algo in algorithms:
-        data[algo] = [results[dist][algo][metric] for dist in distributions]
+        data[algo] = [results[dist][algo][metric] if algo in results[dist] else float("nan")
+                      for dist in distributions]
     
     # Set up the plot
     fig, ax = plt.subplots(figsize=(14, 8))
     
-    # Set width of bars
-    bar_width = 0.15
+    # Set width of bars so every algorithm fits in its group
+    bar_width = 0.8 / len(algorithms)
     
     # Set position of bars on x axis
     positions = list(range(len(distributions)))
@@ -118,7 +138,7 @@ def plot_distribution_comparison(results: Dict[str, Dict[str, Dict[str, float]]]
     ax.set_ylabel(f'Time ({metric}, seconds)')
     ax.set_title(f'Sorting Algorithm Performance by Data Distribution ({metric})')
     ax.set_xticks(positions)
-    ax.set_xticklabels(distributions, rotation=45)
+    ax.set_xticklabels(distributions, rotation=45, ha="right")
     ax.legend()
     
     plt.tight_layout()
@@ -130,6 +150,11 @@ def main():
     parser = argparse.ArgumentParser(description="Compare sorting algorithm performance with different data distributions.")
     parser.add_argument("--size", type=int, default=10000, help="Size of the arrays to generate (default: 10000)")
     parser.add_argument("--tests", type=int, default=5, help="Number of tests to run for each distribution (default: 5)")
+    parser.add_argument("--no-store", action="store_true", help="Don't save the raw times to the result store")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the input arrays (default: 0)")
+    add_profile_arguments(parser)
+    parser.add_argument("--distributions", nargs="+", choices=list(ARRAY_GENERATORS) + list(ADVERSARIES),
+                        default=None, help="Distributions to test (default: all)")
     args = parser.parse_args()
     
     print(f"Comparing sorting algorithm performance with different data distributions")
@@ -137,12 +162,18 @@ def main():
     print(f"Number of tests per distribution: {args.tests}")
     
     # Run comparison
-    results = compare_distributions(args.size, args.tests)
+    raw_times = {}
+    profiler = profiler_from_args(args)
+    results = compare_distributions(args.size, args.tests, raw_times, args.seed, args.distributions, profiler)
+    if not args.no_store:
+        save_times(raw_times, "compare_distributions")
+    save_profiles(profiler)
     
     # Print statistics for each distribution
     for dist_name, dist_results in results.items():
         print(f"\nStatistics for {dist_name} distribution:")
         print_statistics(dist_results)
+    print_worst_cases(worst_cases(results))
     
     # Plot results
     for metric in ["mean", "median", "min", "max"]:
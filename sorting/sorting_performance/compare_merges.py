@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Script to compare ways of merging k sorted streams: kway_merge's loser tree, heapq.merge,
+and collecting every item and sorting them.
+"""
+
+import argparse
+import heapq
+import itertools
+import os
+import random
+import statistics
+import sys
+import time
+import matplotlib.pyplot as plt
+from typing import Callable, Dict, List, Optional
+from instrumentation import CountingKey
+
+# Add parent directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.merge_sort.kway_merge import kway_merge
+
+def collect_and_sort(*iterables):
+    """Read every source to the end and sort everything, the baseline the lazy merges avoid."""
+    return iter(sorted(itertools.chain(*iterables)))
+
+# Ways to produce the merged stream of k sorted iterables
+MERGE_METHODS: Dict[str, Callable] = {
+    "kway_merge (loser tree)": kway_merge,
+    "heapq.merge": heapq.merge,
+    "Collect and sort": collect_and_sort,
+}
+
+def generate_sources(num_sources: int, items_per_source: int, seed: int = 0) -> List[List[float]]:
+    """Generate num_sources sorted lists of random floats."""
+    rng = random.Random(seed)
+    return [sorted(rng.random() for _ in range(items_per_source)) for _ in range(num_sources)]
+
+def time_merge(merge: Callable, sources: List[List], take: Optional[int] = None) -> float:
+    """Time how long merge takes to produce the first take items (all items if take is None).
+    
+    Each source is wrapped in a generator, so the merge can only pull from it like from a file.
+    
+    Args:
+        merge: The merge function, called with the iterables
+        sources: The sorted sources
+        take: Number of merged items to consume
+        
+    Returns:
+        float: The time taken in seconds
+    """
+    streams = [(item for item in source) for source in sources]
+    start_time = time.perf_counter()
+    for _ in itertools.islice(merge(*streams), take):
+        pass
+    return time.perf_counter() - start_time
+
+def count_comparisons(merge: Callable, sources: List[List], take: Optional[int] = None) -> int:
+    """Count the comparisons merge makes to produce the first take items."""
+    streams = [(CountingKey(item) for item in source) for source in sources]
+    CountingKey.comparisons = 0
+    for _ in itertools.islice(merge(*streams), take):
+        pass
+    return CountingKey.comparisons
+
+def compare_merges(source_counts: List[int], items_per_source: int, take: int, num_tests: int = 3,
+                   instrument: bool = False) -> Dict[str, Dict[int, Dict[str, float]]]:
+    """Time every merge method on the same sources, for the first take items and for all of them.
+    
+    Args:
+        source_counts: List of numbers of sources k to test
+        items_per_source: Number of items in each source
+        take: Number of merged items consumed in the early termination test
+        num_tests: Number of times each method is timed
+        instrument: Also count the comparisons of each method
+        
+    Returns:
+        Dict mapping method names to dictionaries mapping k to the median times "first" and "all",
+        and with instrument the comparisons "first_comparisons" and "all_comparisons"
+    """
+    results = {name: {} for name in MERGE_METHODS}
+    
+    for k in source_counts:
+        print(f"\nMerging {k} sources of {items_per_source} items")
+        sources = generate_sources(k, items_per_source, seed=k)
+        for name, merge in MERGE_METHODS.items():
+            row = {
+                "first": statistics.median(time_merge(merge, sources, take) for _ in range(num_tests)),
+                "all": statistics.median(time_merge(merge, sources) for _ in range(num_tests)),
+            }
+            if instrument:
+                row["first_comparisons"] = count_comparisons(merge, sources, take)
+                row["all_comparisons"] = count_comparisons(merge, sources)
+            results[name][k] = row
+            print(f"  {name}: first {take} in {row['first']:.6f}s, all in {row['all']:.6f}s")
+    
+    return results
+
+def print_merges(results: Dict[str, Dict[int, Dict[str, float]]], take: int) -> None:
+    """Print a table of the median times (and comparisons) of every method for every k."""
+    instrumented = any("all_comparisons" in row for rows in results.values() for row in rows.values())
+    header = f"\n{'Method':<26} {'Sources':>8} {f'First {take} (s)':>16} {'All (s)':>12}"
+    if instrumented:
+        header += f" {f'First {take} cmp':>16} {'All cmp':>12}"
+    print(header)
+    for name, rows in results.items():
+        for k, row in rows.items():
+            line = f"{name:<26} {k:>8} {row['first']:>16.6f} {row['all']:>12.6f}"
+            if instrumented:
+                line += f" {row['first_comparisons']:>16} {row['all_comparisons']:>12}"
+            print(line)
+
+def plot_merges(results: Dict[str, Dict[int, Dict[str, float]]], take: int) -> None:
+    """Plot the median time of each method against the number of sources."""
+    # Create output directory if it doesn't exist
+    os.makedirs("output", exist_ok=True)
+    
+    plt.figure(figsize=(12, 8))
+    for name, rows in results.items():
+        counts = list(rows.keys())
+        line = plt.plot(counts, [rows[k]["all"] for k in counts], marker='o', label=f"{name} (all)")
+        plt.plot(counts, [rows[k]["first"] for k in counts], marker='o', linestyle='--',
+                 color=line[0].get_color(), label=f"{name} (first {take})")
+    plt.xscale("log")
+    plt.yscale("log")
+    plt.title("Merging k Sorted Streams")
+    plt.xlabel("Number of sources")
+    plt.ylabel("Time (median, seconds)")
+    plt.legend()
+    plt.grid(True, which="both")
+    plt.tight_layout()
+    
+    # Save the plot to the output directory
+    plt.savefig("output/merge_comparison.png")
+    plt.close()
+
+def main():
+    """Compare kway_merge, heapq.merge and collecting and sorting everything."""
+    parser = argparse.ArgumentParser(description="Compare ways of merging k sorted streams.")
+    parser.add_argument("--sources", type=int, nargs="+", default=[10, 100, 500],
+                        help="List of numbers of sources to test (default: 10 100 500)")
+    parser.add_argument("--items", type=int, default=2000, help="Number of items in each source (default: 2000)")
+    parser.add_argument("--take", type=int, default=5000,
+                        help="Number of merged items consumed in the early termination test (default: 5000)")
+    parser.add_argument("--tests", type=int, default=3, help="Number of times each method is timed (default: 3)")
+    parser.add_argument("--instrument", action="store_true", help="Also count the comparisons of each method")
+    args = parser.parse_args()
+    
+    results = compare_merges(args.sources, args.items, args.take, args.tests, args.instrument)
+    print_merges(results, args.take)
+    plot_merges(results, args.take)
+    
+    print("\nDone! Merge comparison chart has been saved to the output directory.")
+
+if __name__ == "__main__":
+    main()
@@ -6,25 +6,65 @@ Script to compare sorting algorithm performance with different array sizes.
 import argparse
 import os
 import matplotlib.pyplot as plt
-from typing import List, Dict
-from performance_test import run_multiple_tests, calculate_statistics
+from typing import List, Dict, Optional
+from performance_test import run_multiple_tests, calculate_statistics, average_counts, SORTING_ALGORITHMS
+from results_store import save_times
+from complexity import fit_complexity, exceeds_budget, predict, print_fits
+from profiling import CellProfiler, add_profile_arguments, profiler_from_args, save_profiles
 
-def compare_sizes(sizes: List[int], num_tests: int = 5) -> Dict[str, Dict[str, List[float]]]:
+# y axis labels of the operation counts recorded with --instrument
+COUNT_LABELS = {
+    "comparisons": "Comparisons",
+    "writes": "Element writes",
+    "allocations": "Allocated blocks",
+    "peak_memory": "Peak memory (bytes)",
+}
+
+def compare_sizes(sizes: List[int], num_tests: int = 5, raw_times: Optional[Dict] = None,
+                  time_budget: Optional[float] = None, raw_counts: Optional[Dict] = None,
+                  seed: int = 0, profiler: Optional[CellProfiler] = None) -> Dict[str, Dict[str, List[float]]]:
     """Compare sorting algorithm performance with different array sizes.
     
+    With a time budget, sizes are tested in increasing order and an algorithm is dropped
+    from the remaining sizes as soon as one sort took longer than the budget on average,
+    or is predicted to at the next size, so quadratic sorts don't stall the sweep.
+    
     Args:
         sizes: List of array sizes to test
         num_tests: Number of tests to run for each size
+        raw_times: If given, filled with the times of every test, keyed by ("Random", size)
+        time_budget: Maximum mean time of one sort in seconds (default: no limit)
+        raw_counts: If given, filled with the operation counts of every test, keyed by ("Random", size),
+            and the results get the average comparisons, writes and peak_memory at each size
+        seed: Seed of the input arrays, see distributions.generate_array
+        profiler: If given, profiles each algorithm once more at each size (see profiling.py)
         
     Returns:
         Dict mapping algorithm names to dictionaries mapping metrics to lists of values
     """
     results = {}
+    algorithms = dict(SORTING_ALGORITHMS)
+    if time_budget is not None:
+        sizes = sorted(sizes)
     
     for size in sizes:
         print(f"\nTesting with array size: {size}")
-        test_results = run_multiple_tests(num_tests, size)
+        if time_budget is not None:
+            for algo in [a for a in algorithms if a in results]:
+                if exceeds_budget(results[algo]["sizes"], results[algo]["mean"], size, time_budget):
+                    print(f"Stopping {algo}: over the {time_budget:g}s budget at size {size}")
+                    del algorithms[algo]
+            if not algorithms:
+                break
+        counts = {} if raw_counts is not None else None
+        test_results = run_multiple_tests(num_tests, size, algorithms, counts, seed, profiler)
+        if raw_times is not None:
+            raw_times["Random", size] = test_results
         stats = calculate_statistics(test_results)
+        if counts is not None:
+            raw_counts["Random", size] = counts
+            for algo, algo_counts in average_counts(counts).items():
+                stats[algo].update(algo_counts)
         
         for algo, algo_stats in stats.items():
             if algo not in results:
@@ -36,6 +76,9 @@ def compare_sizes(sizes: List[int], num_tests: int = 5) -> Dict[str, Dict[str, L
             results[algo]["min"].append(algo_stats["min"])
             results[algo]["max"].append(algo_stats["max"])
             results[algo]["stdev"].append(algo_stats["stdev"])
+            for field in COUNT_LABELS:
+                if field in algo_stats:
+                    results[algo].setdefault(field, []).append(algo_stats[field])
     
     return results
 
@@ -44,7 +87,8 @@ def plot_comparison(results: Dict[str, Dict[str, List[float]]], metric: str = "m
     
     Args:
         results: Dict mapping algorithm names to dictionaries mapping metrics to lists of values
-        metric: The metric to plot (mean, median, min, max, stdev)
+        metric: The metric to plot (mean, median, min, max, stdev, or comparisons, writes,
+            allocations, peak_memory with --instrument)
     """
     # Create output directory if it doesn't exist
     os.makedirs("output", exist_ok=True)
@@ -52,11 +96,14 @@ def plot_comparison(results: Dict[str, Dict[str, List[float]]], metric: str = "m
     plt.figure(figsize=(12, 8))
     
     for algo, algo_results in results.items():
-        plt.plot(algo_results["sizes"], algo_results[metric], marker='o', label=algo)
+        # counts are None where they aren't measured, like the writes of sorts that return a new list
+        if metric in algo_results and any(value is not None for value in algo_results[metric]):
+            values = [float("nan") if value is None else value for value in algo_results[metric]]
+            plt.plot(algo_results["sizes"], values, marker='o', label=algo)
     
     plt.title(f"Sorting Algorithm Performance Comparison ({metric})")
     plt.xlabel("Array Size")
-    plt.ylabel(f"Time ({metric}, seconds)")
+    plt.ylabel(COUNT_LABELS.get(metric, f"Time ({metric}, seconds)"))
     plt.legend()
     plt.grid(True)
     plt.tight_layout()
@@ -65,23 +112,97 @@ def plot_comparison(results: Dict[str, Dict[str, List[float]]], metric: str = "m
     plt.savefig(f"output/comparison_{metric}.png")
     plt.close()
 
+def analyze_complexity(results: Dict[str, Dict[str, List[float]]], metric: str = "median") -> Dict[str, Dict]:
+    """Fit the growth models of complexity.py to the results of every algorithm tested at two or more sizes.
+    
+    Args:
+        results: Dict mapping algorithm names to dictionaries mapping metrics to lists of values
+        metric: The metric to fit (mean, median, min, max)
+        
+    Returns:
+        Dict mapping algorithm names to the result of fit_complexity
+    """
+    return {algo: fit_complexity(algo_results["sizes"], algo_results[metric])
+            for algo, algo_results in results.items() if len(set(algo_results["sizes"])) >= 2}
+
+def plot_fits(results: Dict[str, Dict[str, List[float]]], fits: Dict[str, Dict], metric: str = "median",
+              target_size: Optional[int] = None) -> None:
+    """Plot the measured times and the best fitting model of each algorithm on log-log axes.
+    
+    Args:
+        results: Dict mapping algorithm names to dictionaries mapping metrics to lists of values
+        fits: Dict mapping algorithm names to the result of fit_complexity
+        metric: The metric that was fitted
+        target_size: Extend the fitted curves up to this size
+    """
+    # Create output directory if it doesn't exist
+    os.makedirs("output", exist_ok=True)
+    
+    plt.figure(figsize=(12, 8))
+    
+    for algo, fit in fits.items():
+        sizes = results[algo]["sizes"]
+        points = plt.plot(sizes, results[algo][metric], marker='o', linestyle='none', label=f"{algo} (measured)")
+        end = max(max(sizes), target_size or 0)
+        curve = [min(sizes) * (end / min(sizes)) ** (i / 50) for i in range(51)]
+        plt.plot(curve, [predict(fit, n) for n in curve], color=points[0].get_color(), label=f"{algo} ~ {fit['best']}")
+    
+    plt.xscale("log")
+    plt.yscale("log")
+    plt.title(f"Fitted Complexity ({metric})")
+    plt.xlabel("Array Size")
+    plt.ylabel(f"Time ({metric}, seconds)")
+    plt.legend()
+    plt.grid(True, which="both")
+    plt.tight_layout()
+    
+    # Save the plot to the output directory
+    plt.savefig("output/complexity_fit.png")
+    plt.close()
+
 def main():
     """Compare sorting algorithm performance with different array sizes."""
     parser = argparse.ArgumentParser(description="Compare sorting algorithm performance with different array sizes.")
     parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000, 20000, 50000],
                         help="List of array sizes to test (default: 1000 5000 10000 20000 50000)")
     parser.add_argument("--tests", type=int, default=5, help="Number of tests to run for each size (default: 5)")
+    parser.add_argument("--no-store", action="store_true", help="Don't save the raw times to the result store")
+    parser.add_argument("--analyze", action="store_true",
+                        help="Fit O(n), O(n log n), O(n²) and a power law to the median times of each algorithm")
+    parser.add_argument("--target-size", type=int, default=None,
+                        help="With --analyze, predict the time of each algorithm at this size")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="Stop growing the size for an algorithm once one sort takes, or is predicted to take, "
+                             "longer than this many seconds")
+    parser.add_argument("--instrument", action="store_true",
+                        help="Also count comparisons, element writes, allocations and peak memory, and plot them against size")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the input arrays (default: 0)")
+    add_profile_arguments(parser)
     args = parser.parse_args()
     
     print(f"Comparing sorting algorithm performance with array sizes: {args.sizes}")
     print(f"Running {args.tests} tests for each size...")
     
     # Run comparison
-    results = compare_sizes(args.sizes, args.tests)
+    raw_times = {}
+    raw_counts = {} if args.instrument else None
+    profiler = profiler_from_args(args)
+    results = compare_sizes(args.sizes, args.tests, raw_times, args.time_budget, raw_counts, args.seed, profiler)
+    if not args.no_store:
+        save_times(raw_times, "compare_sizes", counts=raw_counts)
+    save_profiles(profiler)
     
     # Plot results
     for metric in ["mean", "median", "min", "max"]:
         plot_comparison(results, metric)
+    if args.instrument:
+        for metric in COUNT_LABELS:
+            plot_comparison(results, metric)
+    
+    if args.analyze:
+        fits = analyze_complexity(results)
+        print_fits(fits, args.target_size, args.time_budget)
+        plot_fits(results, fits, target_size=args.target_size)
     
     print("\nDone! Comparison results have been saved to the output directory.")
 
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Script to measure the speedup of parallel_sort against the number of worker processes.
+"""
+
+import argparse
+import os
+import statistics
+import time
+import matplotlib.pyplot as plt
+from typing import List, Dict
+from performance_test import generate_random_array, SORTING_ALGORITHMS
+from sorting.parallel_sort.parallel_sort import parallel_sort
+
+def compare_workers(size: int, worker_counts: List[int], algorithm: str = "Tim Sort",
+                    num_tests: int = 3) -> Dict[int, Dict[str, float]]:
+    """Time parallel_sort with different numbers of workers on the same arrays.
+    
+    Args:
+        size: Size of the random arrays to generate
+        worker_counts: List of worker counts to test
+        algorithm: Name of the algorithm in SORTING_ALGORITHMS used to sort each chunk
+        num_tests: Number of arrays to test for each worker count
+        
+    Returns:
+        Dict mapping worker counts to the median time and the speedup against one worker
+    """
+    arrays = [generate_random_array(size, 0, size * 10) for _ in range(num_tests)]
+    times = {}
+    
+    # the single worker run sorts in-process, so it is the serial baseline
+    worker_counts = sorted(set(worker_counts) | {1})
+    for workers in worker_counts:
+        print(f"\nTesting with {workers} worker(s)")
+        times[workers] = []
+        for i, array in enumerate(arrays):
+            start_time = time.perf_counter()
+            parallel_sort(array, workers=workers, algorithm=algorithm)
+            execution_time = time.perf_counter() - start_time
+            times[workers].append(execution_time)
+            print(f"  Test {i+1}/{num_tests}: {execution_time:.6f} seconds")
+    
+    baseline = statistics.median(times[1])
+    
+    results = {}
+    for workers, worker_times in times.items():
+        median = statistics.median(worker_times)
+        results[workers] = {
+            "median": median,
+            "speedup": baseline / median,
+            "efficiency": baseline / median / workers,
+        }
+    return results
+
+def print_speedup(results: Dict[int, Dict[str, float]]) -> None:
+    """Print a table of median time, speedup and parallel efficiency per worker count."""
+    print(f"\n{'Workers':>8} {'Median (s)':>12} {'Speedup':>9} {'Efficiency':>11}")
+    for workers, row in results.items():
+        print(f"{workers:>8} {row['median']:>12.6f} {row['speedup']:>8.2f}x {row['efficiency']:>10.0%}")
+
+def plot_speedup(results: Dict[int, Dict[str, float]], algorithm: str) -> None:
+    """Plot the measured speedup against the ideal linear speedup."""
+    # Create output directory if it doesn't exist
+    os.makedirs("output", exist_ok=True)
+    
+    workers = list(results.keys())
+    plt.figure(figsize=(10, 6))
+    plt.plot(workers, [results[w]["speedup"] for w in workers], marker='o', label=f"parallel_sort ({algorithm})")
+    plt.plot(workers, workers, linestyle='--', label="Ideal")
+    plt.title("Parallel Sort Speedup")
+    plt.xlabel("Workers")
+    plt.ylabel("Speedup over 1 worker")
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+    
+    # Save the plot to the output directory
+    plt.savefig("output/parallel_speedup.png")
+    plt.close()
+
+def main():
+    """Measure parallel_sort speedup against the number of workers."""
+    default_workers = sorted({1, 2, 4, 8, os.cpu_count() or 1})
+    parser = argparse.ArgumentParser(description="Measure parallel sort speedup against the number of workers.")
+    parser.add_argument("--size", type=int, default=1000000, help="Size of the arrays to generate (default: 1000000)")
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers,
+                        help=f"List of worker counts to test (default: {' '.join(map(str, default_workers))})")
+    parser.add_argument("--algorithm", default="Tim Sort", choices=list(SORTING_ALGORITHMS),
+                        help="Algorithm used to sort each chunk (default: Tim Sort)")
+    parser.add_argument("--tests", type=int, default=3, help="Number of tests to run for each worker count (default: 3)")
+    args = parser.parse_args()
+    
+    print(f"Measuring parallel sort speedup with array size {args.size} using {args.algorithm}")
+    
+    results = compare_workers(args.size, args.workers, args.algorithm, args.tests)
+    print_speedup(results)
+    plot_speedup(results, args.algorithm)
+    
+    print("\nDone! Speedup chart has been saved to the output directory.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Empirical complexity analysis of measured sorting times.
+
+fit_complexity fits times measured at several sizes against the usual growth models and
+a free power law t = a * n^k, so the scaling of an algorithm can be read off instead of
+eyeballed from a chart. The fitted model can then predict the time at a size that wasn't
+measured, or the largest size that fits in a time budget. This module doesn't import
+matplotlib.
+"""
+
+import math
+from typing import Callable, Dict, List, Optional
+
+# size_for_time doesn't search past this size
+MAX_SIZE = 1 << 60
+
+# candidate growth models, t = c * f(n)
+MODELS: Dict[str, Callable[[float], float]] = {
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n²)": lambda n: n * n,
+}
+
+def fit_model(sizes: List[int], times: List[float], f: Callable[[float], float]) -> Dict[str, float]:
+    """Fit t = c * f(n) by least squares on the relative error.
+
+    Minimizing the relative rather than the absolute error keeps the largest size from
+    dominating the fit, since the times span several orders of magnitude.
+
+    Returns:
+        Dict with the coefficient c, the R² of the fit and the root mean square relative error
+    """
+    features = [f(n) for n in sizes]
+    c = sum(x / t for x, t in zip(features, times)) / sum((x / t) ** 2 for x, t in zip(features, times))
+
+    predicted = [c * x for x in features]
+    mean = sum(times) / len(times)
+    ss_res = sum((t - p) ** 2 for t, p in zip(times, predicted))
+    ss_tot = sum((t - mean) ** 2 for t in times)
+    return {
+        "coefficient": c,
+        "r2": 1 - ss_res / ss_tot if ss_tot else 1.0,
+        "rms_error": math.sqrt(sum(((t - p) / t) ** 2 for t, p in zip(times, predicted)) / len(times)),
+    }
+
+def fit_power_law(sizes: List[int], times: List[float]) -> Dict[str, float]:
+    """Fit t = a * n^k by linear regression of log t on log n.
+
+    Returns:
+        Dict with the exponent k, the coefficient a and the R² in log-log space
+    """
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(t) for t in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    syy = sum((y - mean_y) ** 2 for y in ys)
+
+    k = sxy / sxx if sxx else 0.0
+    return {
+        "exponent": k,
+        "coefficient": math.exp(mean_y - k * mean_x),
+        "r2": sxy * sxy / (sxx * syy) if sxx and syy else 1.0,
+    }
+
+def fit_complexity(sizes: List[int], times: List[float]) -> Dict:
+    """Fit measured times against every model in MODELS and a power law.
+
+    Args:
+        sizes: Array sizes, at least two different ones
+        times: Time measured at each size in seconds
+
+    Returns:
+        Dict with the fit of every model ("models"), the name of the model with the lowest
+        relative error ("best") and the power law fit ("power_law")
+    """
+    points = [(n, t) for n, t in zip(sizes, times) if n > 1 and t > 0]
+    if len({n for n, _ in points}) < 2:
+        raise ValueError("At least two different sizes with positive times are needed to fit a model")
+    sizes, times = zip(*points)
+
+    models = {name: fit_model(sizes, times, f) for name, f in MODELS.items()}
+    return {
+        "models": models,
+        "best": min(models, key=lambda name: models[name]["rms_error"]),
+        "power_law": fit_power_law(sizes, times),
+    }
+
+def predict(fit: Dict, size: int, model: Optional[str] = None) -> float:
+    """Predicted time at size from a fit_complexity result, with its best model by default."""
+    if model == "power law":
+        return fit["power_law"]["coefficient"] * size ** fit["power_law"]["exponent"]
+    model = model or fit["best"]
+    return fit["models"][model]["coefficient"] * MODELS[model](size)
+
+def size_for_time(fit: Dict, budget: float, model: Optional[str] = None) -> Optional[int]:
+    """Largest size whose predicted time is within budget seconds, found by bisection.
+
+    Returns None if even one element is predicted to take longer, and MAX_SIZE if no size
+    up to it does.
+    """
+    if predict(fit, 1, model) > budget:
+        return None
+    low, high = 1, 2
+    while predict(fit, high, model) <= budget:
+        if high == MAX_SIZE:
+            return MAX_SIZE
+        low, high = high, min(high * 2, MAX_SIZE)
+    while high - low > 1:
+        mid = (low + high) // 2
+        if predict(fit, mid, model) <= budget:
+            low = mid
+        else:
+            high = mid
+    return low
+
+def exceeds_budget(sizes: List[int], times: List[float], next_size: int, budget: float) -> bool:
+    """Whether an algorithm should skip next_size because it took, or will take, longer than budget.
+
+    The prediction uses a power law through the measured points, which follows the local
+    growth rate without having to pick a model from only two or three sizes.
+    """
+    if not times:
+        return False
+    if times[-1] > budget:
+        return True
+    if len(set(sizes)) < 2:
+        return times[-1] * next_size / sizes[-1] > budget  # assume at least linear growth
+    return predict({"power_law": fit_power_law(sizes, times)}, next_size, "power law") > budget
+
+def print_fits(fits: Dict[str, Dict], target_size: Optional[int] = None, budget: Optional[float] = None) -> None:
+    """Print the goodness of fit of every model per algorithm, and the predictions."""
+    names = list(MODELS)
+    header = f"\n{'Algorithm':<22} {'Best fit':<11} {'n^k':>6} " + " ".join(f"{'R² ' + name:>14}" for name in names)
+    if target_size:
+        header += f" {f'Time at n={target_size}':>20}"
+    if budget:
+        header += f" {f'Max n in {budget:g}s':>16}"
+    print(header)
+
+    for algo, fit in fits.items():
+        line = f"{algo:<22} {fit['best']:<11} {fit['power_law']['exponent']:>6.2f} "
+        line += " ".join(f"{fit['models'][name]['r2']:>14.4f}" for name in names)
+        if target_size:
+            line += f" {predict(fit, target_size):>18.3f} s"
+        if budget:
+            max_size = size_for_time(fit, budget)
+            line += f" {'-' if max_size is None else max_size:>16}"
+        print(line)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Benchmark input arrays, generated with NumPy and cached on disk.
+
+The generators in distributions.py draw one Python random number per element, which at
+millions of elements takes longer than the fast sorts. The generators here build the same
+distributions with a few vectorized calls on a seeded numpy.random.Generator, and every
+array is saved as a .npy file keyed by (distribution, size, seed, dtype). Later runs, and
+the other scripts, memory-map the file instead of generating the array again, so they all
+sort byte-identical inputs.
+
+The cache lives in ~/.cache/sorting/datasets, or in the directory named by
+$SORTING_DATASET_CACHE. Files are written to a temporary name and renamed, so parallel
+runs never read a partial file. Delete the directory, or run this script with --clear,
+to regenerate everything.
+"""
+
+import argparse
+import os
+import re
+import shutil
+import tempfile
+import numpy as np
+from typing import Callable, Dict, Optional
+from distributions import DISTRIBUTION_KINDS, ZIPF_EXPONENT
+
+DEFAULT_CACHE_DIR = os.environ.get("SORTING_DATASET_CACHE",
+                                   os.path.join(os.path.expanduser("~"), ".cache", "sorting", "datasets"))
+
+def random_dataset(size: int, rng: np.random.Generator) -> np.ndarray:
+    """Random integers between 0 and 1000."""
+    return rng.integers(0, 1000, size, endpoint=True)
+
+def nearly_sorted_dataset(size: int, rng: np.random.Generator) -> np.ndarray:
+    """Sorted integers with 5% of the elements swapped in pairs."""
+    arr = np.arange(size)
+    # distinct positions, so that no element is swapped twice
+    positions = rng.choice(size, 2 * (size // 20), replace=False).reshape(2, -1)
+    arr[positions[0]], arr[positions[1]] = arr[positions[1]], arr[positions[0]]
+    return arr
+
+def reverse_sorted_dataset(size: int, rng: np.random.Generator) -> np.ndarray:
+    """Integers from size down to 1."""
+    return np.arange(size, 0, -1)
+
+def few_unique_dataset(size: int, rng: np.random.Generator) -> np.ndarray:
+    """Integers drawn from 10 random values between 0 and 100."""
+    unique_values = rng.integers(0, 100, 10, endpoint=True)
+    return unique_values[rng.integers(0, 10, size)]
+
+def sorted_with_outliers_dataset(size: int, rng: np.random.Generator) -> np.ndarray:
+    """Sorted integers with 2% of the elements replaced by values between size and 2 * size."""
+    arr = np.arange(size)
+    outliers = size // 50
+    if outliers:
+        arr[rng.integers(0, size, outliers)] = rng.integers(size, 2 * size, outliers, endpoint=True)
+    return arr
+
+def organ_pipe_dataset(size: int, rng: np.random.Generator) -> np.ndarray:
+    """Integers that rise to the middle and fall again."""
+    arr = np.arange(size)
+    return np.minimum(arr, arr[::-1])
+
+def sawtooth_dataset(size: int, rng: np.random.Generator) -> np.ndarray:
+    """About sqrt(size) ascending runs of the same values."""
+    return np.arange(size) % max(1, int(size ** 0.5))
+
+def interleaved_runs_dataset(size: int, rng: np.random.Generator) -> np.ndarray:
+    """Sorted runs of 16 to 2 * sqrt(size) random integers, whose values overlap."""
+    values = rng.integers(0, size, size, endpoint=True)
+    longest = max(16, 2 * int(size ** 0.5))
+    # enough run lengths to cover the array, then the run number of every position
+    lengths = rng.integers(16, longest, size // 16 + 1, endpoint=True)
+    runs = np.repeat(np.arange(len(lengths)), lengths)[:size]
+    return values[np.lexsort((values, runs))]
+
+def zipf_dataset(size: int, rng: np.random.Generator) -> np.ndarray:
+    """Zipf-distributed keys, where a few keys make up most of the array."""
+    if size == 0:
+        return np.arange(0)
+    weights = 1 / np.arange(1, size + 1) ** ZIPF_EXPONENT
+    return rng.choice(size, size, p=weights / weights.sum())
+
+def floats_with_infinities_dataset(size: int, rng: np.random.Generator) -> np.ndarray:
+    """Random floats, 1% of them inf and 1% -inf."""
+    arr = rng.uniform(-1e6, 1e6, size)
+    arr[rng.integers(0, size, size // 100)] = np.inf
+    arr[rng.integers(0, size, size // 100)] = -np.inf
+    return arr
+
+# Vectorized versions of the numeric generators in distributions.ARRAY_GENERATORS, by the
+# same names. Distributions without one, like the strings, are generated in Python and not cached
+DATASET_GENERATORS: Dict[str, Callable[[int, np.random.Generator], np.ndarray]] = {
+    "Random": random_dataset,
+    "Nearly Sorted": nearly_sorted_dataset,
+    "Reverse Sorted": reverse_sorted_dataset,
+    "Few Unique Values": few_unique_dataset,
+    "Sorted with Outliers": sorted_with_outliers_dataset,
+    "Organ Pipe": organ_pipe_dataset,
+    "Sawtooth": sawtooth_dataset,
+    "Interleaved Runs": interleaved_runs_dataset,
+    "Zipf": zipf_dataset,
+    "Floats with Infinities": floats_with_infinities_dataset,
+}
+
+def default_dtype(distribution: str) -> str:
+    """The dtype of a distribution's elements: float64 for the "float" kind, else int64."""
+    return "float64" if DISTRIBUTION_KINDS.get(distribution) == "float" else "int64"
+
+def generate_dataset(distribution: str, size: int, seed: int = 0, dtype: Optional[str] = None) -> np.ndarray:
+    """Generate an array of a distribution from a seed, without the cache.
+
+    Uses PCG64, so the array only depends on the arguments and the NumPy version. dtype
+    defaults to default_dtype(distribution); a dtype that can't hold every element, like
+    int64 for the infinities of "Floats with Infinities", raises ValueError.
+    """
+    if distribution not in DATASET_GENERATORS:
+        raise ValueError(f"Unknown distribution {distribution!r}, expected one of {list(DATASET_GENERATORS)}")
+    dtype = np.dtype(dtype or default_dtype(distribution))
+    rng = np.random.Generator(np.random.PCG64(seed))
+    arr = DATASET_GENERATORS[distribution](size, rng)
+    with np.errstate(invalid="ignore"):
+        converted = arr.astype(dtype, copy=False)
+    if not np.array_equal(converted, arr, equal_nan=True):
+        raise ValueError(f"{distribution} can't be stored as {dtype.name} without changing its values")
+    return converted
+
+def dataset_path(distribution: str, size: int, seed: int = 0, dtype: Optional[str] = None,
+                 cache_dir: Optional[str] = None) -> str:
+    """Path of the cache file of an array, e.g. nearly-sorted-n10000-s0-int64.npy."""
+    name = re.sub(r"[^a-z0-9]+", "-", distribution.lower()).strip("-")
+    dtype = np.dtype(dtype or default_dtype(distribution))
+    return os.path.join(cache_dir or DEFAULT_CACHE_DIR, f"{name}-n{size}-s{seed}-{dtype.name}.npy")
+
+def load_dataset(distribution: str, size: int, seed: int = 0, dtype: Optional[str] = None,
+                 cache_dir: Optional[str] = None) -> np.ndarray:
+    """Return an array of a distribution, memory-mapped from the cache.
+
+    The array is generated and saved first if it isn't cached yet. It is read-only, copy it
+    (or call tolist()) before sorting it.
+
+    Args:
+        distribution: Name in DATASET_GENERATORS
+        size: Number of elements
+        seed: Seed of the generator
+        dtype: NumPy dtype of the elements (default: default_dtype(distribution))
+        cache_dir: Directory of the cache files (default: DEFAULT_CACHE_DIR)
+
+    Returns:
+        A read-only memory-mapped ndarray
+    """
+    path = dataset_path(distribution, size, seed, dtype, cache_dir)
+    if not os.path.exists(path):
+        arr = generate_dataset(distribution, size, seed, dtype)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix=".npy", dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, arr)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    if size == 0:
+        # empty files can't be memory-mapped
+        return np.load(path)
+    return np.load(path, mmap_mode="r")
+
+def main():
+    """Generate the cached datasets ahead of a benchmark run."""
+    parser = argparse.ArgumentParser(description="Generate and cache benchmark input arrays.")
+    parser.add_argument("--distributions", nargs="+", choices=list(DATASET_GENERATORS),
+                        default=list(DATASET_GENERATORS), help="Distributions to generate (default: all)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000], help="Array sizes (default: 10000)")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0], help="Seeds (default: 0)")
+    parser.add_argument("--dtype", default=None,
+                        help="NumPy dtype of the elements (default: float64 for float distributions, else int64)")
+    parser.add_argument("--cache-dir", default=None, help=f"Cache directory (default: {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--clear", action="store_true", help="Delete the cache directory instead")
+    args = parser.parse_args()
+    
+    cache_dir = args.cache_dir or DEFAULT_CACHE_DIR
+    if args.clear:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        print(f"Deleted {cache_dir}")
+        return
+    
+    for distribution in args.distributions:
+        for size in args.sizes:
+            for seed in args.seeds:
+                arr = load_dataset(distribution, size, seed, args.dtype, cache_dir)
+                print(f"{dataset_path(distribution, size, seed, args.dtype, cache_dir)}: {arr.nbytes} bytes")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+"""
+Data distributions used by the performance tests.
+
+Every generator takes the array size and an optional random number generator. Passing
+a seeded random.Random makes the array reproducible without touching the global state
+of the random module. generate_array uses the vectorized, cached versions in datasets.py
+when NumPy is installed. This module doesn't import matplotlib, so worker processes can
+use it.
+
+More distributions can be plugged in with register_distribution, from any module:
+
+    @register_distribution("Primes", kind="int")
+    def generate_primes_array(size, rng=random): ...
+
+Adversaries are generators that build the input for the algorithm under test: they take
+the sort function as their first argument and are registered with adversary=True.
+"""
+
+import random
+import sys
+import zlib
+from typing import Any, Callable, Dict, List
+
+def generate_random_array(size: int, rng: random.Random = random) -> List[int]:
+    """Generate a random array of integers."""
+    return [rng.randint(0, 1000) for _ in range(size)]
+
+def generate_nearly_sorted_array(size: int, rng: random.Random = random) -> List[int]:
+    """Generate a nearly sorted array of integers."""
+    arr = list(range(size))
+    # Swap a few elements to make it nearly sorted
+    swaps = size // 20  # 5% of elements will be out of place
+    for _ in range(swaps):
+        i, j = rng.sample(range(size), 2)
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+def generate_reverse_sorted_array(size: int, rng: random.Random = random) -> List[int]:
+    """Generate a reverse sorted array of integers."""
+    return list(range(size, 0, -1))
+
+def generate_few_unique_array(size: int, rng: random.Random = random) -> List[int]:
+    """Generate an array with few unique values."""
+    unique_values = [rng.randint(0, 100) for _ in range(10)]
+    return [rng.choice(unique_values) for _ in range(size)]
+
+def generate_sorted_with_outliers_array(size: int, rng: random.Random = random) -> List[int]:
+    """Generate a mostly sorted array with a few outliers."""
+    arr = list(range(size))
+    # Add a few outliers
+    outliers = size // 50  # 2% of elements will be outliers
+    for _ in range(outliers):
+        i = rng.randint(0, size - 1)
+        arr[i] = rng.randint(size, size * 2)
+    return arr
+
+# Dictionary of array generators
+ARRAY_GENERATORS: Dict[str, Callable[..., List[Any]]] = {
+    "Random": generate_random_array,
+    "Nearly Sorted": generate_nearly_sorted_array,
+    "Reverse Sorted": generate_reverse_sorted_array,
+    "Few Unique Values": generate_few_unique_array,
+    "Sorted with Outliers": generate_sorted_with_outliers_array,
+}
+
+# Generators that build an input against a given sort: (sort_func, size, rng) -> array
+ADVERSARIES: Dict[str, Callable[..., List[int]]] = {}
+
+# Type of the elements of each distribution, "int", "float" or "str". Integer-only sorts
+# (radix and counting sort) raise TypeError on the others
+DISTRIBUTION_KINDS: Dict[str, str] = dict.fromkeys(ARRAY_GENERATORS, "int")
+
+def register_distribution(name: str, kind: str = "int", adversary: bool = False) -> Callable:
+    """Decorator that adds a generator to ARRAY_GENERATORS, or to ADVERSARIES with adversary=True.
+
+    Args:
+        name: Name of the distribution, as shown in the results
+        kind: Type of the elements, "int", "float" or "str"
+        adversary: The generator builds its input against a sort, see ADVERSARIES
+    """
+    def decorator(generator: Callable) -> Callable:
+        (ADVERSARIES if adversary else ARRAY_GENERATORS)[name] = generator
+        DISTRIBUTION_KINDS[name] = kind
+        return generator
+    return decorator
+
+@register_distribution("Organ Pipe")
+def generate_organ_pipe_array(size: int, rng: random.Random = random) -> List[int]:
+    """Generate integers that rise to the middle and fall again, like 0 1 2 3 2 1 0."""
+    return [min(i, size - 1 - i) for i in range(size)]
+
+@register_distribution("Sawtooth")
+def generate_sawtooth_array(size: int, rng: random.Random = random) -> List[int]:
+    """Generate about sqrt(size) ascending runs of the same values, like 0 1 2 0 1 2 0 1 2."""
+    period = max(1, int(size ** 0.5))
+    return [i % period for i in range(size)]
+
+@register_distribution("Interleaved Runs")
+def generate_interleaved_runs_array(size: int, rng: random.Random = random) -> List[int]:
+    """Generate sorted runs of random lengths, whose values overlap, so every run has to be merged.
+
+    The runs are between 16 and 2 * sqrt(size) items long, longer than timsort's minimum run,
+    so the merges rather than the insertion sort of short runs dominate.
+    """
+    values = [rng.randint(0, size) for _ in range(size)]
+    longest = max(16, 2 * int(size ** 0.5))
+    start = 0
+    while start < size:
+        stop = min(size, start + rng.randint(16, longest))
+        values[start:stop] = sorted(values[start:stop])
+        start = stop
+    return values
+
+# exponent of the Zipf distribution: the k-th most frequent key occurs about 1 / k**s as often
+ZIPF_EXPONENT = 1.2
+
+@register_distribution("Zipf")
+def generate_zipf_array(size: int, rng: random.Random = random) -> List[int]:
+    """Generate Zipf-distributed keys, where a few keys make up most of the array."""
+    if size == 0:
+        return []
+    weights = [1 / k ** ZIPF_EXPONENT for k in range(1, size + 1)]
+    return rng.choices(range(size), weights=weights, k=size)
+
+@register_distribution("Floats with Infinities", kind="float")
+def generate_floats_with_infinities_array(size: int, rng: random.Random = random) -> List[float]:
+    """Generate random floats, 1% of them inf and 1% -inf."""
+    arr = [rng.uniform(-1e6, 1e6) for _ in range(size)]
+    for _ in range(size // 100):
+        arr[rng.randrange(size)] = float("inf")
+        arr[rng.randrange(size)] = float("-inf")
+    return arr
+
+# length of the prefix shared by every string of "Long Prefix Strings"
+STRING_PREFIX_LENGTH = 64
+
+@register_distribution("Long Prefix Strings", kind="str")
+def generate_long_prefix_strings_array(size: int, rng: random.Random = random) -> List[str]:
+    """Generate strings that share a long prefix, so every comparison has to scan past it."""
+    prefix = "/var/lib/records/" + "x" * (STRING_PREFIX_LENGTH - 17)
+    return [f"{prefix}{rng.randrange(10 * size + 1):010d}" for _ in range(size)]
+
+class AdversaryItem:
+    """An element whose value the antiqsort adversary only fixes once a comparison needs it."""
+
+    __slots__ = ("adversary", "index")
+
+    def __init__(self, adversary: "Antiqsort", index: int):
+        self.adversary = adversary
+        self.index = index
+
+    def __lt__(self, other):
+        return self.adversary.compare(self.index, other.index) < 0
+
+    def __le__(self, other):
+        return self.adversary.compare(self.index, other.index) <= 0
+
+    def __gt__(self, other):
+        return self.adversary.compare(self.index, other.index) > 0
+
+    def __ge__(self, other):
+        return self.adversary.compare(self.index, other.index) >= 0
+
+    def __eq__(self, other):
+        return self.adversary.compare(self.index, other.index) == 0
+
+    def __ne__(self, other):
+        return self.adversary.compare(self.index, other.index) != 0
+    __hash__ = None
+
+class Antiqsort:
+    """McIlroy's adversary: "A Killer Adversary for Quicksort", 1999.
+
+    Every element starts out as "gas", larger than anything solid. When two gas elements
+    are compared, the pivot candidate (the gas element that survived the last comparison)
+    is frozen to the next smallest solid value, or the second element if neither is the
+    candidate. A quicksort compares its pivot with every other element, so the pivot is
+    frozen on its second comparison, below everything still gas, and every partition
+    peels off a single element: n(n-1)/2 comparisons in all. Run on any comparison sort,
+    the frozen values are an input on which that sort makes the same choices again. For
+    a quicksort they are the worst pivots; for other sorts the input is usually no harder
+    than a random one.
+    """
+
+    def __init__(self, size: int):
+        # at least one element stays gas, so the solid values end at size - 2 and the
+        # frozen input is a permutation of range(size)
+        self.gas = size - 1
+        self.values = [self.gas] * size
+        self.solid = 0
+        self.candidate = -1
+
+    def freeze(self, i: int) -> None:
+        self.values[i] = self.solid
+        self.solid += 1
+
+    def compare(self, x: int, y: int) -> int:
+        values, gas = self.values, self.gas
+        if values[x] == gas and values[y] == gas:
+            self.freeze(x if x == self.candidate else y)
+        if values[x] == gas:
+            self.candidate = x
+        elif values[y] == gas:
+            self.candidate = y
+        return values[x] - values[y]
+
+@register_distribution("Antiqsort Adversary", adversary=True)
+def generate_antiqsort_array(sort_func: Callable, size: int, rng: random.Random = random) -> List[int]:
+    """Generate a worst-case input for sort_func by running it against McIlroy's adversary.
+
+    sort_func has to be a comparison sort, others raise TypeError. Against a sort with a
+    random pivot the input only defeats the random choices made while it was built, so it
+    is as good as random for the next run, which is what the randomness is for.
+    """
+    adversary = Antiqsort(size)
+    # a recursive quicksort recurses once per element against the adversary
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(recursion_limit + size)
+    try:
+        sort_func([AdversaryItem(adversary, i) for i in range(size)])
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+    return adversary.values
+
+def input_seed(seed: int, distribution: str, size: int, trial: int) -> int:
+    """Derive the seed of one input array from the run seed.
+
+    Uses crc32 rather than hash(), which is randomized per process for strings.
+    """
+    return zlib.crc32(f"{seed}:{distribution}:{size}:{trial}".encode())
+
+def generate_array(distribution: str, size: int, seed: int = 0, trial: int = 0) -> List[Any]:
+    """Generate the same array for a given distribution, size, seed and trial on every run.
+
+    With NumPy installed, the numeric distributions are generated by datasets.py and cached
+    on disk, so later runs and other scripts load the identical array instead of generating it.
+    """
+    try:
+        from datasets import DATASET_GENERATORS, load_dataset
+    except ImportError:
+        DATASET_GENERATORS = {}
+    seed = input_seed(seed, distribution, size, trial)
+    if distribution in DATASET_GENERATORS:
+        return load_dataset(distribution, size, seed).tolist()
+    return ARRAY_GENERATORS[distribution](size, random.Random(seed))
+
+def generate_adversarial_array(distribution: str, sort_func: Callable, size: int, seed: int = 0,
+                               trial: int = 0) -> List[Any]:
+    """Generate the input of an adversary in ADVERSARIES against sort_func.
+
+    Not cached, since the input depends on the sort and, for randomized sorts, on the run.
+    """
+    rng = random.Random(input_seed(seed, distribution, size, trial))
+    return ADVERSARIES[distribution](sort_func, size, rng)
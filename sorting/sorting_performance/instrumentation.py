@@ -0,0 +1,160 @@
+"""
+Operation counts for sorting algorithms: comparisons, element writes, allocations and peak memory.
+
+Wall time alone can't tell whether a slowdown comes from more comparisons, more element
+moves or more memory churn. count_operations runs a sort once more on an instrumented copy
+of the input:
+
+- every element is wrapped in a CountingKey, whose comparison operators count calls
+- the list is a CountingList, which counts the elements stored into it by item
+  assignment, append, insert and extend. Sorts that return a new list, like merge_sort,
+  do their writes in plain lists that aren't counted, so their writes are None rather
+  than a misleading 0; their cost shows up in the allocations and peak memory instead
+- tracemalloc records the peak memory allocated during the sort, and snapshots taken
+  before and after it give the number of memory blocks the sort allocated and still
+  held when it returned, like the new list and its nodes or buffers
+
+The instrumented run is separate from the timed runs, so timings never pay for the
+wrappers. Nothing is wrapped or traced unless count_operations is called.
+"""
+
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+class CountingKey:
+    """Wraps a value and counts every comparison made between wrapped values."""
+
+    __slots__ = ("value",)
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        CountingKey.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        CountingKey.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        CountingKey.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        CountingKey.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        CountingKey.comparisons += 1
+        return self.value == other.value
+
+    def __ne__(self, other):
+        CountingKey.comparisons += 1
+        return self.value != other.value
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"CountingKey({self.value!r})"
+
+class CountingList(list):
+    """A list that counts the elements written into it."""
+
+    writes = 0
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            CountingList.writes += len(value)
+        else:
+            CountingList.writes += 1
+        super().__setitem__(index, value)
+
+    def append(self, value):
+        CountingList.writes += 1
+        super().append(value)
+
+    def insert(self, index, value):
+        CountingList.writes += 1
+        super().insert(index, value)
+
+    def extend(self, values):
+        values = list(values)
+        CountingList.writes += len(values)
+        super().extend(values)
+
+def count_operations(sort_func: Callable, array: List, measure_memory: bool = True) -> Dict[str, Optional[int]]:
+    """Run sort_func once on an instrumented copy of array and count what it did.
+
+    Args:
+        sort_func: The sorting function to instrument
+        array: The input, which is not modified
+        measure_memory: Trace memory allocations with tracemalloc during the sort
+
+    Returns:
+        Dict with the number of comparisons, the number of element writes to the input list
+        (None if the sort returned a new list instead), the number of memory blocks allocated
+        by the sort and still held when it returned, and the peak memory in bytes allocated
+        during the sort. The last two are None if memory isn't measured.
+        Sorts that need the integers themselves, like the radix sorts, can't run on wrapped
+        elements. They are run on a CountingList of the plain values instead, and their
+        comparisons are None.
+    """
+    CountingKey.comparisons = 0
+    try:
+        writes, allocations, peak_memory = run_instrumented(
+            sort_func, CountingList(CountingKey(x) for x in array), measure_memory)
+        comparisons = CountingKey.comparisons
+    except TypeError:
+        writes, allocations, peak_memory = run_instrumented(sort_func, CountingList(array), measure_memory)
+        comparisons = None
+
+    return {
+        "comparisons": comparisons,
+        "writes": writes,
+        "allocations": allocations,
+        "peak_memory": peak_memory,
+    }
+
+def run_instrumented(sort_func: Callable, instrumented: "CountingList", measure_memory: bool) -> tuple:
+    # sort the instrumented list, returning the writes into it, the blocks allocated by the
+    # sort and the peak traced memory
+    CountingList.writes = 0
+    allocations = peak_memory = None
+
+    was_tracing = tracemalloc.is_tracing()
+    if measure_memory:
+        if not was_tracing:
+            tracemalloc.start()
+        before = traced_snapshot()
+        tracemalloc.reset_peak()
+        start, _ = tracemalloc.get_traced_memory()
+    try:
+        result = sort_func(instrumented)
+        if measure_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            peak_memory = peak - start
+            # taken while result is alive, so the blocks of a returned list are counted
+            after = traced_snapshot()
+            allocations = sum(max(0, stat.count_diff) for stat in after.compare_to(before, "lineno"))
+    finally:
+        if measure_memory and not was_tracing:
+            tracemalloc.stop()
+
+    writes = CountingList.writes if result is instrumented else None
+    return writes, allocations, peak_memory
+
+def traced_snapshot() -> tracemalloc.Snapshot:
+    # snapshot of the traced blocks, without the ones tracemalloc allocates for earlier snapshots
+    return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+
+def print_counts(counts: Dict[str, Dict[str, Optional[int]]]) -> None:
+    """Print a table of the operation counts of every algorithm."""
+    print(f"\n{'Algorithm':<22} {'Comparisons':>14} {'Writes':>14} {'Allocations':>12} {'Peak memory (bytes)':>20}")
+    for name, algo_counts in counts.items():
+        comparisons, writes, allocations, peak = (
+            '-' if algo_counts[field] is None else f"{algo_counts[field]:.0f}"
+            for field in ("comparisons", "writes", "allocations", "peak_memory"))
+        print(f"{name:<22} {comparisons:>14} {writes:>14} {allocations:>12} {peak:>20}")
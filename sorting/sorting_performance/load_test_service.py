@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Script to load-test the micro-batching search and sort service on localhost.
+
+Many concurrent clients send search and sort requests, each waiting for the answer before
+sending its next one, to a BatchService in the same process or over a Unix socket. The
+same requests are run unbatched (every request answered on its own) and with each latency
+window, and the throughput, client-side p50/p99 latency and mean batch size are compared.
+In unix mode the clients and the server share one event loop and one CPU, so the numbers
+include the JSON encoding on both sides of the socket.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+import matplotlib.pyplot as plt
+from typing import Dict, List, Tuple
+
+# Add parent directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.batch_service.batch_service import BatchService, BatchClient, ServiceMetrics, serve_unix, batch_sort
+
+LOAD_MODES = ["inprocess", "unix"]
+
+def generate_requests(num_requests: int, table_size: int, sort_size: int, search_fraction: float,
+                      seed: int = 0) -> List[Tuple[str, object]]:
+    """Generate a mix of ("search", item) and ("sort", items) requests.
+    
+    Searches look up random integers below 2 * table_size, half of which are in the table of
+    even numbers. Sorts get between 1 and sort_size random integers.
+    """
+    rng = random.Random(seed)
+    requests = []
+    for _ in range(num_requests):
+        if rng.random() < search_fraction:
+            requests.append(("search", rng.randrange(2 * table_size)))
+        else:
+            requests.append(("sort", [rng.randint(0, 1000) for _ in range(rng.randint(1, sort_size))]))
+    return requests
+
+async def run_clients(target, requests: List[Tuple[str, object]], clients: int) -> ServiceMetrics:
+    """Send the requests from concurrent clients to target, a BatchService or BatchClient.
+    
+    Returns:
+        ServiceMetrics with the latency of every request as seen by its client
+    """
+    metrics = ServiceMetrics()
+    
+    async def client(own_requests):
+        for op, payload in own_requests:
+            submitted = time.perf_counter_ns()
+            if op == "search":
+                await target.search(payload)
+            else:
+                await target.sort(payload)
+            metrics.record_batch([submitted], time.perf_counter_ns())
+    
+    await asyncio.gather(*(client(requests[i::clients]) for i in range(clients)))
+    return metrics
+
+async def load_test(mode: str, requests: List[Tuple[str, object]], clients: int, table,
+                    window: float, max_batch: int) -> Dict[str, float]:
+    """Run the requests against a new BatchService.
+    
+    Args:
+        mode: "inprocess" to call the service directly, "unix" to go through a Unix socket
+        requests: Requests from generate_requests
+        clients: Number of concurrent clients
+        table: Sorted table of the searches
+        window: Latency window of the service in seconds
+        max_batch: Largest batch of the service; 1 answers every request on its own
+    
+    Returns:
+        Dict with the throughput (requests per second), the client-side p50 and p99 latency
+        (seconds) and the mean batch size
+    """
+    service = BatchService(table, window=window, max_batch=max_batch)
+    if mode == "inprocess":
+        metrics = await run_clients(service, requests, clients)
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            server = await serve_unix(service, os.path.join(directory, "batch_service.sock"))
+            client = await BatchClient.connect(os.path.join(directory, "batch_service.sock"))
+            try:
+                metrics = await run_clients(client, requests, clients)
+            finally:
+                await client.close()
+                server.close()
+                await server.wait_closed()
+    
+    served = service.metrics()
+    batches = served["search"]["batches"] + served["sort"]["batches"]
+    return {
+        "throughput": metrics.throughput(),
+        "p50": metrics.percentile(50),
+        "p99": metrics.percentile(99),
+        "mean_batch": len(requests) / batches,
+    }
+
+def compare_windows(mode: str, windows: List[float], clients: int, num_requests: int, table_size: int,
+                    sort_size: int, search_fraction: float, max_batch: int, table_backend: str = "numpy",
+                    seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """Load-test the service unbatched and with every latency window on the same requests.
+    
+    Args:
+        windows: Latency windows to test, in seconds
+        table_backend: "numpy" to search an int64 array with searchsorted, "list" for bisect on a list
+        (see load_test and generate_requests for the other arguments)
+    
+    Returns:
+        Dict mapping configuration names to the results of load_test
+    """
+    table = list(range(0, 2 * table_size, 2))
+    if table_backend == "numpy":
+        import numpy as np
+        table = np.array(table, dtype=np.int64)
+    requests = generate_requests(num_requests, table_size, sort_size, search_fraction, seed)
+    # import NumPy and warm up the batched paths before anything is timed
+    batch_sort([[2, 1]])
+    
+    configurations = [("Unbatched", 0, 1)] + [(f"Window {window * 1e6:g} us", window, max_batch) for window in windows]
+    results = {}
+    for name, window, batch_limit in configurations:
+        results[name] = asyncio.run(load_test(mode, requests, clients, table, window, batch_limit))
+        row = results[name]
+        print(f"  {name}: {row['throughput']:.0f} requests/s, p50 {row['p50'] * 1e3:.3f} ms, "
+              f"p99 {row['p99'] * 1e3:.3f} ms, mean batch {row['mean_batch']:.1f}")
+    return results
+
+def print_load_test(results: Dict[str, Dict[str, float]]) -> None:
+    """Print the throughput, latencies and batch size of every configuration."""
+    print(f"\n{'Configuration':<22} {'Requests/s':>12} {'p50 (ms)':>10} {'p99 (ms)':>10} {'Mean batch':>11}")
+    for name, row in results.items():
+        print(f"{name:<22} {row['throughput']:>12.0f} {row['p50'] * 1e3:>10.3f} "
+              f"{row['p99'] * 1e3:>10.3f} {row['mean_batch']:>11.1f}")
+
+def plot_load_test(results: Dict[str, Dict[str, float]], mode: str) -> None:
+    """Plot the throughput and the p50/p99 latency of every configuration side by side."""
+    # Create output directory if it doesn't exist
+    os.makedirs("output", exist_ok=True)
+    
+    names = list(results.keys())
+    positions = list(range(len(names)))
+    fig, (throughput_ax, latency_ax) = plt.subplots(1, 2, figsize=(14, 6))
+    
+    throughput_ax.bar(positions, [results[name]["throughput"] for name in names])
+    throughput_ax.set_ylabel("Requests per second")
+    throughput_ax.set_title(f"Throughput ({mode})")
+    
+    latency_ax.bar([p - 0.2 for p in positions], [results[name]["p50"] * 1e3 for name in names], 0.4, label="p50")
+    latency_ax.bar([p + 0.2 for p in positions], [results[name]["p99"] * 1e3 for name in names], 0.4, label="p99")
+    latency_ax.set_ylabel("Latency (ms)")
+    latency_ax.set_title(f"Client-side latency ({mode})")
+    latency_ax.legend()
+    
+    for ax in (throughput_ax, latency_ax):
+        ax.set_xticks(positions)
+        ax.set_xticklabels(names, rotation=45, ha="right")
+    
+    plt.tight_layout()
+    plt.savefig(f"output/service_load_test_{mode}.png")
+    plt.close()
+
+def main():
+    """Load-test the micro-batching service with and without batching."""
+    parser = argparse.ArgumentParser(description="Load-test the micro-batching search and sort service on localhost.")
+    parser.add_argument("--mode", choices=LOAD_MODES, default="inprocess",
+                        help="Call the service directly or through a Unix socket (default: inprocess)")
+    parser.add_argument("--windows", type=float, nargs="+", default=[0, 200, 1000],
+                        help="Latency windows to test, in microseconds (default: 0 200 1000)")
+    parser.add_argument("--clients", type=int, default=200, help="Number of concurrent clients (default: 200)")
+    parser.add_argument("--requests", type=int, default=20000, help="Total number of requests (default: 20000)")
+    parser.add_argument("--max-batch", type=int, default=1024, help="Largest batch of the service (default: 1024)")
+    parser.add_argument("--table-size", type=int, default=100000,
+                        help="Number of items in the searched table (default: 100000)")
+    parser.add_argument("--table-backend", choices=["numpy", "list"], default="numpy",
+                        help="Search an int64 array or a list (default: numpy)")
+    parser.add_argument("--sort-size", type=int, default=50,
+                        help="Largest number of items in a sort request (default: 50)")
+    parser.add_argument("--search-fraction", type=float, default=0.8,
+                        help="Fraction of the requests that are searches (default: 0.8)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the requests (default: 0)")
+    args = parser.parse_args()
+    
+    if args.mode == "unix" and not hasattr(asyncio, "start_unix_server"):
+        parser.error("--mode unix needs Unix sockets")
+    
+    print(f"Load-testing the batch service ({args.mode}) with {args.clients} clients and {args.requests} requests")
+    results = compare_windows(args.mode, [window / 1e6 for window in args.windows], args.clients, args.requests,
+                              args.table_size, args.sort_size, args.search_fraction, args.max_batch,
+                              args.table_backend, args.seed)
+    print_load_test(results)
+    plot_load_test(results, args.mode)
+    
+    print("\nDone! Load test chart has been saved to the output directory.")
+
+if __name__ == "__main__":
+    main()
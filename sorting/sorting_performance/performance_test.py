@@ -4,33 +4,30 @@ import statistics
 import sys
 import os
 import matplotlib.pyplot as plt
-from typing import Callable, Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 # Add parent directory to path to import sorting modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-# Import sorting algorithms
-from sorting.insertion_sort.insertion_sort import insertion_sort
-from sorting.quick_sort.quick_sort import quick_sort
-from sorting.merge_sort.merge_sort import merge_sort
-from sorting.selection_sort.selection_sort import selection_sort
-from sorting.timsort.simplified_timsort import simplified_timsort
-
-# Dictionary of sorting algorithms
-SORTING_ALGORITHMS: Dict[str, Callable] = {
-    "Insertion Sort": insertion_sort,
-    "Quick Sort": quick_sort,
-    "Merge Sort": merge_sort,
-    "Selection Sort": selection_sort,
-    "Tim Sort": simplified_timsort,
-    # Add new sorting algorithms here as you implement them
-    # "Heap Sort": heap_sort,
-    # "Intro Sort": intro_sort,
-}
+# Dictionary of sorting algorithms, see sorting/algorithms.py
+from sorting.algorithms import SORTING_ALGORITHMS
+from results_store import save_times
+from instrumentation import count_operations, print_counts
+from distributions import generate_array
+from profiling import CellProfiler
 
 def generate_random_array(size: int, min_val: int = 0, max_val: int = 1000) -> List[int]:
-    """Generate a random array of integers."""
-    return [random.randint(min_val, max_val) for _ in range(size)]
+    """Generate a random array of integers, with NumPy if it is installed.
+    
+    The NumPy generator is seeded from the random module, so random.seed() still makes
+    the arrays reproducible. Use distributions.generate_array for cached, seeded inputs.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return [random.randint(min_val, max_val) for _ in range(size)]
+    rng = np.random.default_rng(random.getrandbits(64))
+    return rng.integers(min_val, max_val, size, endpoint=True).tolist()
 
 def test_sorting_algorithm(sort_func: Callable, array: List[int]) -> float:
     """Test the performance of a sorting algorithm on a given array.
@@ -45,24 +42,30 @@ def test_sorting_algorithm(sort_func: Callable, array: List[int]) -> float:
     # Create a copy of the array to avoid modifying the original
     test_array = array.copy()
     
-    # Measure the time taken to sort the array
-    start_time = time.time()
+    # Measure the time taken to sort the array. perf_counter_ns is monotonic and has the
+    # highest available resolution, unlike time.time(); see benchmark.py for repeated,
+    # calibrated measurements
+    start_time = time.perf_counter_ns()
     sort_func(test_array)
-    end_time = time.time()
+    end_time = time.perf_counter_ns()
     
-    return end_time - start_time
+    return (end_time - start_time) / 1e9
 
-def run_single_test(array_size: int = 10000) -> Dict[str, float]:
+def run_single_test(array_size: int = 10000, instrument: bool = False, seed: int = 0,
+                    profiler: Optional[CellProfiler] = None) -> Dict[str, float]:
     """Run a single test for all sorting algorithms on the same random array.
     
     Args:
         array_size: The size of the random array to generate
+        instrument: Also count comparisons, writes, allocations and peak memory, in a separate run
+        seed: Seed of the random array, see distributions.generate_array
+        profiler: If given, profiles each algorithm once more on the array (see profiling.py)
         
     Returns:
         Dict[str, float]: A dictionary mapping algorithm names to execution times
     """
-    # Generate a random array
-    array = generate_random_array(array_size)
+    # Load the random array of this seed, generating it on the first run
+    array = generate_array("Random", array_size, seed)
     
     # Test each sorting algorithm
     results = {}
@@ -71,33 +74,64 @@ def run_single_test(array_size: int = 10000) -> Dict[str, float]:
         results[name] = execution_time
         print(f"{name}: {execution_time:.6f} seconds")
     
+    if instrument:
+        print_counts({name: count_operations(sort_func, array) for name, sort_func in SORTING_ALGORITHMS.items()})
+    if profiler is not None:
+        for name, sort_func in SORTING_ALGORITHMS.items():
+            profiler.profile(name, "Random", array_size, sort_func, array)
+    
     return results
 
-def run_multiple_tests(num_tests: int = 100, array_size: int = 10000) -> Dict[str, List[float]]:
+def run_multiple_tests(num_tests: int = 100, array_size: int = 10000,
+                       algorithms: Optional[Dict[str, Callable]] = None,
+                       counts: Optional[Dict[str, List[Dict]]] = None, seed: int = 0,
+                       profiler: Optional[CellProfiler] = None) -> Dict[str, List[float]]:
     """Run multiple tests for all sorting algorithms and collect execution times.
     
     Args:
         num_tests: The number of tests to run
         array_size: The size of the random arrays to generate
+        algorithms: The sorting algorithms to test (default: SORTING_ALGORITHMS)
+        counts: If given, filled with the operation counts of every test (see instrumentation.py),
+            measured in a separate run so they don't affect the timings
+        seed: Seed of the random arrays; test i sorts the array of trial i, see distributions.generate_array
+        profiler: If given, profiles each algorithm once more on the first array (see profiling.py)
         
     Returns:
         Dict[str, List[float]]: A dictionary mapping algorithm names to lists of execution times
     """
+    if algorithms is None:
+        algorithms = SORTING_ALGORITHMS
+    
     # Initialize results dictionary
-    results = {name: [] for name in SORTING_ALGORITHMS.keys()}
+    results = {name: [] for name in algorithms.keys()}
     
     # Run tests
     for i in range(num_tests):
         print(f"\nTest {i+1}/{num_tests}")
-        array = generate_random_array(array_size)
+        array = generate_array("Random", array_size, seed, i)
         
-        for name, sort_func in SORTING_ALGORITHMS.items():
+        for name, sort_func in algorithms.items():
             execution_time = test_sorting_algorithm(sort_func, array)
             results[name].append(execution_time)
             print(f"{name}: {execution_time:.6f} seconds")
+            if counts is not None:
+                counts.setdefault(name, []).append(count_operations(sort_func, array))
+            if profiler is not None:
+                profiler.profile(name, "Random", array_size, sort_func, array)
     
     return results
 
+def average_counts(counts: Dict[str, List[Dict]]) -> Dict[str, Dict[str, float]]:
+    """Average the operation counts of every test for each algorithm."""
+    averages = {}
+    for name, tests in counts.items():
+        averages[name] = {}
+        for field in tests[0]:
+            values = [test[field] for test in tests if test[field] is not None]
+            averages[name][field] = statistics.mean(values) if values else None
+    return averages
+
 def calculate_statistics(results: Dict[str, List[float]]) -> Dict[str, Dict[str, float]]:
     """Calculate statistics for the test results.
     
@@ -174,6 +208,9 @@ def main() -> None:
     stats = calculate_statistics(results)
     print_statistics(stats)
     
+    # Keep the raw times for comparisons across commits
+    save_times({("Random", array_size): results}, "performance_test")
+    
     # Plot results
     for metric in ["mean", "median", "min", "max", "stdev"]:
         plot_results(stats, metric)
@@ -0,0 +1,239 @@
+"""
+Profiles of the sorting algorithms in the benchmark cells, as flame graphs and hot functions.
+
+A slow cell doesn't say whether the time goes to the list comprehensions of quick_sort,
+the slices of merge_sort or the list.pop calls of selection_sort. With --profile, the
+benchmark scripts run every algorithm once more per (algorithm, distribution, size) cell
+under one of two profilers:
+
+- sampling: a background thread records the Python stack of the sort every interval
+  seconds. The overhead grows as the interval shrinks; at the default of 1 ms it is a
+  few percent. Time spent in C functions is attributed to the Python function calling them
+- deterministic: sys.setprofile records every Python and C call with its exact time, so
+  calls like list.pop show up on their own. Every call pays for a Python callback, so
+  call-heavy sorts run several times slower, and short functions look more expensive
+
+The stacks of each cell are saved to output/profiles as a speedscope file (open it at
+https://www.speedscope.app) and as collapsed stacks (for flamegraph.pl or inferno), and
+the functions with the most self time are written to output/profiles/hot_functions.txt.
+
+The profiled run is separate from the timed runs, so timings are unaffected, and nothing
+is profiled unless --profile is given.
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+PROFILE_MODES = ["sampling", "deterministic"]
+# seconds between two samples of the sampling profiler
+DEFAULT_INTERVAL = 0.001
+# number of functions per cell in the hot-function table
+DEFAULT_TOP = 10
+
+def frame_label(code) -> str:
+    # semicolons separate the frames of a collapsed stack
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ",")
+
+def sample_stacks(sort_func: Callable, array: List, interval: float = DEFAULT_INTERVAL) -> Counter:
+    """Sort array with sort_func while a thread samples its stack every interval seconds.
+
+    Returns:
+        Counter mapping stacks, tuples of frame labels from the sort down, to the
+        nanoseconds between the sample that saw them and the one before
+    """
+    stacks = Counter()
+    target = threading.get_ident()
+    done = threading.Event()
+
+    def run():
+        sort_func(array)
+
+    def sampler():
+        last = time.perf_counter_ns()
+        while not done.wait(interval):
+            frame = sys._current_frames().get(target)
+            stack = []
+            while frame is not None and frame.f_code is not run.__code__:
+                stack.append(frame_label(frame.f_code))
+                frame = frame.f_back
+            now = time.perf_counter_ns()
+            # only the frames below run belong to the sort
+            if frame is not None and stack:
+                stacks[tuple(reversed(stack))] += now - last
+            last = now
+
+    # the sampler only runs when the sorting thread releases the GIL, which it is asked
+    # to do at least once per interval
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(switch_interval, interval))
+    thread = threading.Thread(target=sampler, daemon=True)
+    thread.start()
+    try:
+        run()
+    finally:
+        done.set()
+        thread.join()
+        sys.setswitchinterval(switch_interval)
+    return stacks
+
+def trace_stacks(sort_func: Callable, array: List) -> Counter:
+    """Sort array with sort_func under sys.setprofile, timing every Python and C call.
+
+    Returns:
+        Counter mapping stacks, tuples of frame labels from the sort down, to the
+        nanoseconds spent in the last frame of the stack itself
+    """
+    stacks = Counter()
+    stack = []
+    last = time.perf_counter_ns()
+
+    def tracer(frame, event, arg):
+        nonlocal last
+        if stack:
+            stacks[tuple(stack)] += time.perf_counter_ns() - last
+        if event == "call":
+            stack.append(frame_label(frame.f_code))
+        elif event == "c_call":
+            stack.append(getattr(arg, "__qualname__", repr(arg)).replace(";", ","))
+        elif stack:
+            # return, c_return or c_exception
+            stack.pop()
+        # the tracer's own time isn't charged to the sort
+        last = time.perf_counter_ns()
+
+    sys.setprofile(tracer)
+    try:
+        sort_func(array)
+    finally:
+        sys.setprofile(None)
+    return stacks
+
+def hot_functions(stacks: Counter, top: int = DEFAULT_TOP) -> List[Tuple[str, int, int]]:
+    """The functions with the most self time, with their self and total time in nanoseconds.
+
+    Total time counts a function once per stack it appears in, so recursion isn't counted twice.
+    """
+    self_time = Counter()
+    total_time = Counter()
+    for stack, weight in stacks.items():
+        self_time[stack[-1]] += weight
+        for label in set(stack):
+            total_time[label] += weight
+    return [(label, ns, total_time[label]) for label, ns in self_time.most_common(top)]
+
+def write_collapsed(stacks: Counter, path: str) -> None:
+    """Write the stacks in the collapsed format of flamegraph.pl: frames joined by ';', then the weight."""
+    with open(path, "w") as f:
+        for stack, weight in sorted(stacks.items()):
+            f.write(f"{';'.join(stack)} {weight}\n")
+
+def write_speedscope(stacks: Counter, path: str, name: str) -> None:
+    """Write the stacks as a sampled speedscope profile, with one weighted sample per stack."""
+    frames = {}
+    samples = []
+    for stack in stacks:
+        samples.append([frames.setdefault(label, len(frames)) for label in stack])
+    total = sum(stacks.values())
+    document = {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "sorting_performance/profiling.py",
+        "shared": {"frames": [{"name": label} for label in frames]},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "nanoseconds",
+            "startValue": 0,
+            "endValue": total,
+            "samples": samples,
+            "weights": list(stacks.values()),
+        }],
+    }
+    with open(path, "w") as f:
+        json.dump(document, f)
+
+def slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+def cell_name(algorithm: str, distribution: str, size: int) -> str:
+    """File name stem of a cell, e.g. quick-sort-random-n10000."""
+    return f"{slugify(algorithm)}-{slugify(distribution)}-n{size}"
+
+class CellProfiler:
+    """Profiles one sort per benchmark cell and saves the stacks of every cell.
+
+    Args:
+        mode: "sampling" or "deterministic", see the module docstring
+        interval: Seconds between two samples in sampling mode
+    """
+
+    def __init__(self, mode: str = "sampling", interval: float = DEFAULT_INTERVAL):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode {mode!r}, expected one of {PROFILE_MODES}")
+        self.mode = mode
+        self.interval = interval
+        # (algorithm, distribution, size) -> (stacks, seconds the profiled sort took)
+        self.cells: Dict[Tuple[str, str, int], Tuple[Counter, float]] = {}
+
+    def profile(self, algorithm: str, distribution: str, size: int, sort_func: Callable, array: List) -> None:
+        """Profile sort_func on a copy of array, unless the cell has a profile already."""
+        if (algorithm, distribution, size) in self.cells:
+            return
+        start = time.perf_counter()
+        if self.mode == "sampling":
+            stacks = sample_stacks(sort_func, array.copy(), self.interval)
+        else:
+            stacks = trace_stacks(sort_func, array.copy())
+        self.cells[algorithm, distribution, size] = (stacks, time.perf_counter() - start)
+
+    def save(self, output_dir: str = "output/profiles", top: int = DEFAULT_TOP) -> str:
+        """Write the flame graphs of every cell and the hot-function table, returning the table's path."""
+        os.makedirs(output_dir, exist_ok=True)
+        for (algorithm, distribution, size), (stacks, _) in self.cells.items():
+            name = cell_name(algorithm, distribution, size)
+            write_collapsed(stacks, os.path.join(output_dir, f"{name}.collapsed.txt"))
+            write_speedscope(stacks, os.path.join(output_dir, f"{name}.speedscope.json"),
+                             f"{algorithm}, {distribution}, n={size}")
+        path = os.path.join(output_dir, "hot_functions.txt")
+        with open(path, "w") as f:
+            f.write(self.format_summary(top))
+        return path
+
+    def format_summary(self, top: int = DEFAULT_TOP) -> str:
+        """The hot-function table of every cell."""
+        lines = []
+        for (algorithm, distribution, size), (stacks, seconds) in self.cells.items():
+            total = sum(stacks.values()) or 1
+            lines.append(f"\n{algorithm}, {distribution}, n={size}: {seconds:.6f} seconds profiled ({self.mode})")
+            lines.append(f"  {'Function':<60} {'Self (ms)':>10} {'Self %':>7} {'Total (ms)':>11} {'Total %':>8}")
+            for label, self_ns, total_ns in hot_functions(stacks, top):
+                lines.append(f"  {label[:60]:<60} {self_ns / 1e6:>10.3f} {100 * self_ns / total:>6.1f}% "
+                             f"{total_ns / 1e6:>11.3f} {100 * total_ns / total:>7.1f}%")
+        return "\n".join(lines) + "\n"
+
+def add_profile_arguments(parser) -> None:
+    """Add --profile and --profile-interval to the argument parser of a benchmark script."""
+    parser.add_argument("--profile", choices=PROFILE_MODES, default=None,
+                        help="Profile each algorithm once per cell and save flame graphs and hot functions "
+                             "to output/profiles (default: off)")
+    parser.add_argument("--profile-interval", type=float, default=DEFAULT_INTERVAL,
+                        help=f"Seconds between samples with --profile sampling; smaller is more detailed and "
+                             f"slower (default: {DEFAULT_INTERVAL})")
+
+def profiler_from_args(args) -> Optional[CellProfiler]:
+    """The CellProfiler asked for on the command line, or None."""
+    return CellProfiler(args.profile, args.profile_interval) if args.profile else None
+
+def save_profiles(profiler: Optional[CellProfiler]) -> None:
+    """Save and print the profiles of a script run, if it was profiled."""
+    if profiler is None or not profiler.cells:
+        return
+    path = profiler.save()
+    print(profiler.format_summary(top=5))
+    print(f"Flame graphs and the hot-function table have been saved to {os.path.dirname(path)}")
@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+"""
+Persistent store of benchmark samples, with regression checks between commits.
+
+Every raw time measured by the performance scripts is written to a SQLite database,
+together with the git commit, Python version and host it was measured on, so results
+from different commits can be compared after the fact:
+
+    python results_store.py runs
+    python results_store.py compare <base commit> <new commit>
+    python results_store.py trend --algorithm "Tim Sort"
+
+compare only pairs samples with the same algorithm, size, distribution, Python version
+and host. It flags a slowdown when a one-sided Mann-Whitney U test finds the new samples
+slower and the median slowed down by more than the threshold. The command exits with
+status 1 if there is one, so it can gate CI.
+"""
+
+import argparse
+import math
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_DB = "output/results.db"
+DEFAULT_THRESHOLD = 0.03
+DEFAULT_ALPHA = 0.05
+# git commands run in this directory, so the commit is found wherever the scripts are run from
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    git_commit TEXT NOT NULL,
+    dirty INTEGER NOT NULL,
+    script TEXT NOT NULL,
+    python TEXT NOT NULL,
+    host TEXT NOT NULL,
+    created TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    algorithm TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    distribution TEXT NOT NULL,
+    trial INTEGER NOT NULL,
+    time REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS counts (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    algorithm TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    distribution TEXT NOT NULL,
+    trial INTEGER NOT NULL,
+    comparisons INTEGER,
+    writes INTEGER,
+    peak_memory INTEGER,
+    allocations INTEGER
+);
+CREATE INDEX IF NOT EXISTS samples_run ON samples(run_id);
+CREATE INDEX IF NOT EXISTS runs_commit ON runs(git_commit);
+"""
+
+def connect(db_path: str = DEFAULT_DB) -> sqlite3.Connection:
+    """Open the store, creating the database and its tables if needed."""
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    connection = sqlite3.connect(db_path)
+    connection.executescript(SCHEMA)
+    # stores created before allocations were counted
+    if "allocations" not in [row[1] for row in connection.execute("PRAGMA table_info(counts)")]:
+        connection.execute("ALTER TABLE counts ADD COLUMN allocations INTEGER")
+    return connection
+
+def git_commit() -> Tuple[str, bool]:
+    """Return the current commit hash and whether tracked files have uncommitted changes."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, cwd=REPO_DIR).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                capture_output=True, text=True, check=True, cwd=REPO_DIR).stdout
+        return commit, bool(status.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+def resolve_commit(connection: sqlite3.Connection, ref: str) -> str:
+    """Expand a ref (a branch, tag, HEAD~1 or a hash prefix) to a commit hash that has runs in the store."""
+    try:
+        ref = subprocess.run(["git", "rev-parse", "--verify", f"{ref}^{{commit}}"],
+                             capture_output=True, text=True, check=True, cwd=REPO_DIR).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        pass  # not a git ref, try it as a prefix of a stored hash
+    
+    commits = [row[0] for row in connection.execute(
+        "SELECT DISTINCT git_commit FROM runs WHERE git_commit LIKE ?", (ref + "%",))]
+    if len(commits) != 1:
+        found = "no runs" if not commits else f"{len(commits)} commits"
+        raise ValueError(f"{ref!r} matches {found} in the store")
+    return commits[0]
+
+def save_times(times: Dict[Tuple[str, int], Dict[str, List[float]]], script: str,
+               db_path: str = DEFAULT_DB, counts: Optional[Dict] = None) -> int:
+    """Store the raw times of one run of a performance script.
+    
+    Args:
+        times: Dict mapping (distribution, size) to dictionaries mapping algorithm names to
+            the list of times measured for them, one per trial, like scheduler.times_by_cell
+        script: Name of the script that measured them
+        db_path: Path of the SQLite database
+        counts: Operation counts from instrumentation.count_operations, in the same shape as
+            times with a dict of counts in place of each time
+    
+    Returns:
+        int: The id of the new run
+    """
+    commit, dirty = git_commit()
+    connection = connect(db_path)
+    with connection:
+        cursor = connection.execute(
+            "INSERT INTO runs (git_commit, dirty, script, python, host, created) VALUES (?, ?, ?, ?, ?, ?)",
+            (commit, int(dirty), script, platform.python_version(), platform.node(),
+             time.strftime("%Y-%m-%dT%H:%M:%S")))
+        run_id = cursor.lastrowid
+        connection.executemany(
+            "INSERT INTO samples (run_id, algorithm, size, distribution, trial, time) VALUES (?, ?, ?, ?, ?, ?)",
+            [(run_id, algorithm, size, distribution, trial, t)
+             for (distribution, size), algorithms in times.items()
+             for algorithm, algorithm_times in algorithms.items()
+             for trial, t in enumerate(algorithm_times)])
+        if counts:
+            connection.executemany(
+                "INSERT INTO counts (run_id, algorithm, size, distribution, trial, comparisons, writes, peak_memory, "
+                "allocations) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, algorithm, size, distribution, trial, c["comparisons"], c["writes"], c["peak_memory"],
+                  c["allocations"])
+                 for (distribution, size), algorithms in counts.items()
+                 for algorithm, algorithm_counts in algorithms.items()
+                 for trial, c in enumerate(algorithm_counts)])
+    connection.close()
+    return run_id
+
+def load_samples(connection: sqlite3.Connection, commit: str) -> Dict[Tuple, List[float]]:
+    """All times of a commit, keyed by (algorithm, size, distribution, python, host)."""
+    samples = {}
+    rows = connection.execute(
+        "SELECT s.algorithm, s.size, s.distribution, r.python, r.host, s.time "
+        "FROM samples s JOIN runs r ON s.run_id = r.id WHERE r.git_commit = ?", (commit,))
+    for *key, t in rows:
+        samples.setdefault(tuple(key), []).append(t)
+    return samples
+
+def mann_whitney_greater(x: List[float], y: List[float]) -> float:
+    """One-sided p-value of the Mann-Whitney U test that x tends to be larger than y.
+    
+    Uses the normal approximation with a tie correction and a continuity correction,
+    which is accurate enough from about 5 samples per side.
+    """
+    n1, n2 = len(x), len(y)
+    n = n1 + n2
+    combined = sorted([(v, 0) for v in x] + [(v, 1) for v in y])
+    
+    # average ranks over ties
+    rank_sum_x = 0.0
+    tie_term = 0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        rank_sum_x += rank * sum(1 for k in range(i, j + 1) if combined[k][1] == 0)
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+    
+    u = rank_sum_x - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 1 - statistics.NormalDist().cdf(z)
+
+def compare_commits(connection: sqlite3.Connection, base: str, new: str, threshold: float = DEFAULT_THRESHOLD,
+                    alpha: float = DEFAULT_ALPHA) -> List[Dict]:
+    """Compare the samples of two commits measured under the same conditions.
+    
+    Args:
+        connection: Open store
+        base: Commit hash of the baseline
+        new: Commit hash being checked
+        threshold: Relative slowdown of the median that counts as a regression
+        alpha: Significance level of the Mann-Whitney U test
+    
+    Returns:
+        List of dicts with the key fields, both medians, their ratio, the p-values of the
+        new commit being slower and faster, and a status of "slower", "faster" or "unchanged"
+    """
+    base_samples = load_samples(connection, base)
+    new_samples = load_samples(connection, new)
+    comparisons = []
+    
+    for key in sorted(base_samples.keys() & new_samples.keys()):
+        x = new_samples[key]
+        y = base_samples[key]
+        ratio = statistics.median(x) / statistics.median(y)
+        p_slower = mann_whitney_greater(x, y)
+        p_faster = mann_whitney_greater(y, x)
+    
+        if p_slower < alpha and ratio > 1 + threshold:
+            status = "slower"
+        elif p_faster < alpha and ratio < 1 - threshold:
+            status = "faster"
+        else:
+            status = "unchanged"
+    
+        algorithm, size, distribution, python, host = key
+        comparisons.append({
+            "algorithm": algorithm,
+            "size": size,
+            "distribution": distribution,
+            "python": python,
+            "host": host,
+            "base": statistics.median(y),
+            "new": statistics.median(x),
+            "ratio": ratio,
+            "p_slower": p_slower,
+            "p_faster": p_faster,
+            "status": status,
+        })
+    
+    return comparisons
+
+def trend(connection: sqlite3.Connection, algorithm: Optional[str] = None, size: Optional[int] = None,
+          distribution: Optional[str] = None) -> List[Dict]:
+    """Median time per commit for every key, in the order the commits were first measured."""
+    query = ("SELECT r.git_commit, MIN(r.created), s.algorithm, s.size, s.distribution, r.python, r.host, "
+             "GROUP_CONCAT(s.time) FROM samples s JOIN runs r ON s.run_id = r.id")
+    conditions, params = [], []
+    for column, value in (("s.algorithm", algorithm), ("s.size", size), ("s.distribution", distribution)):
+        if value is not None:
+            conditions.append(f"{column} = ?")
+            params.append(value)
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " GROUP BY r.git_commit, s.algorithm, s.size, s.distribution, r.python, r.host"
+    
+    rows = []
+    for commit, created, *key, times in connection.execute(query, params):
+        samples = [float(t) for t in times.split(",")]
+        rows.append({"commit": commit, "created": created, "key": tuple(key),
+                     "median": statistics.median(samples), "samples": len(samples)})
+    
+    # per key, in the order commits were first measured, with the change since the previous commit
+    rows.sort(key=lambda row: (row["key"], row["created"]))
+    previous = {}
+    for row in rows:
+        before = previous.get(row["key"])
+        row["change"] = row["median"] / before - 1 if before else None
+        previous[row["key"]] = row["median"]
+    return rows
+
+def print_runs(connection: sqlite3.Connection) -> None:
+    print(f"{'Run':>5}  {'Commit':<12} {'Script':<24} {'Python':<8} {'Host':<20} {'Created':<19} {'Samples':>8}")
+    rows = connection.execute(
+        "SELECT r.id, r.git_commit, r.dirty, r.script, r.python, r.host, r.created, COUNT(s.run_id) "
+        "FROM runs r LEFT JOIN samples s ON s.run_id = r.id GROUP BY r.id ORDER BY r.id")
+    for run_id, commit, dirty, script, python, host, created, count in rows:
+        label = commit[:10] + ("+" if dirty else "")
+        print(f"{run_id:>5}  {label:<12} {script:<24} {python:<8} {host[:20]:<20} {created:<19} {count:>8}")
+
+def print_comparison(comparisons: List[Dict]) -> None:
+    print(f"{'Algorithm':<22} {'Distribution':<22} {'Size':>8} {'Base (s)':>12} {'New (s)':>12} "
+          f"{'Change':>8} {'p':>8}  Status")
+    for c in comparisons:
+        p = c["p_slower"] if c["ratio"] >= 1 else c["p_faster"]
+        print(f"{c['algorithm']:<22} {c['distribution']:<22} {c['size']:>8} {c['base']:>12.6f} {c['new']:>12.6f} "
+              f"{c['ratio'] - 1:>+8.1%} {p:>8.4f}  {c['status']}")
+
+def print_trend(rows: List[Dict]) -> None:
+    print(f"{'Algorithm':<22} {'Distribution':<22} {'Size':>8} {'Commit':<10} {'First run':<19} "
+          f"{'Median (s)':>12} {'Change':>8}")
+    for row in rows:
+        algorithm, size, distribution, _, _ = row["key"]
+        change = f"{row['change']:+.1%}" if row["change"] is not None else ""
+        print(f"{algorithm:<22} {distribution:<22} {size:>8} {row['commit'][:10]:<10} {row['created']:<19} "
+              f"{row['median']:>12.6f} {change:>8}")
+
+def main():
+    """Inspect the result store and compare commits."""
+    parser = argparse.ArgumentParser(description="Inspect stored benchmark results and compare commits.")
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"Path of the SQLite database (default: {DEFAULT_DB})")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    commands.add_parser("runs", help="List the stored runs")
+    
+    compare_parser = commands.add_parser("compare", help="Flag significant slowdowns between two commits")
+    compare_parser.add_argument("base", help="Baseline commit (any git ref or a stored hash prefix)")
+    compare_parser.add_argument("new", help="Commit to check (any git ref or a stored hash prefix)")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help=f"Slowdown of the median that counts (default: {DEFAULT_THRESHOLD})")
+    compare_parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA,
+                                help=f"Significance level of the Mann-Whitney U test (default: {DEFAULT_ALPHA})")
+    
+    trend_parser = commands.add_parser("trend", help="Show the median time of every commit in the history")
+    trend_parser.add_argument("--algorithm", default=None, help="Only this algorithm")
+    trend_parser.add_argument("--size", type=int, default=None, help="Only this array size")
+    trend_parser.add_argument("--distribution", default=None, help="Only this distribution")
+    
+    args = parser.parse_args()
+    connection = connect(args.db)
+    
+    if args.command == "runs":
+        print_runs(connection)
+    elif args.command == "compare":
+        try:
+            base = resolve_commit(connection, args.base)
+            new = resolve_commit(connection, args.new)
+        except ValueError as e:
+            sys.exit(str(e))
+        comparisons = compare_commits(connection, base, new, args.threshold, args.alpha)
+        if not comparisons:
+            sys.exit("The two commits have no samples measured under the same conditions")
+        print_comparison(comparisons)
+        slower = [c for c in comparisons if c["status"] == "slower"]
+        if slower:
+            print(f"\n{len(slower)} significant slowdown(s) of more than {args.threshold:.0%}")
+            sys.exit(1)
+    elif args.command == "trend":
+        print_trend(trend(connection, args.algorithm, args.size, args.distribution))
+
+if __name__ == "__main__":
+    main()
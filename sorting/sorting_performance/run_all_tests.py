@@ -7,6 +7,45 @@ import argparse
 import subprocess
 import os
 
+def run_parallel(args) -> None:
+    """Run the size and distribution comparisons as one matrix on a process pool.
+    
+    Every input array is generated once and the charts of compare_sizes and
+    compare_distributions are drawn from the merged results.
+    """
+    from performance_test import calculate_statistics
+    from compare_sizes import plot_comparison
+    from compare_distributions import plot_distribution_comparison
+    from distributions import ARRAY_GENERATORS
+    from scheduler import run_matrix, times_by_cell, print_matrix
+    from benchmark import save_results
+    from results_store import save_times
+    
+    cells = [("Random", size) for size in args.sizes]
+    cells += [(distribution, args.size) for distribution in ARRAY_GENERATORS]
+    records = run_matrix(cells, num_tests=args.tests, workers=args.workers, seed=args.seed)
+    print_matrix(records)
+    os.makedirs("output", exist_ok=True)
+    save_results(records, "output/dataset.json")
+    
+    times = times_by_cell(records)
+    save_times(times, "run_all_tests")
+    
+    size_results = {}
+    for size in args.sizes:
+        for algo, algo_stats in calculate_statistics(times["Random", size]).items():
+            algo_results = size_results.setdefault(algo, {"sizes": [], "mean": [], "median": [], "min": [], "max": [], "stdev": []})
+            algo_results["sizes"].append(size)
+            for metric in ["mean", "median", "min", "max", "stdev"]:
+                algo_results[metric].append(algo_stats[metric])
+    
+    distribution_results = {distribution: calculate_statistics(times[distribution, args.size])
+                            for distribution in ARRAY_GENERATORS}
+    
+    for metric in ["mean", "median", "min", "max"]:
+        plot_comparison(size_results, metric)
+        plot_distribution_comparison(distribution_results, metric)
+
 def main():
     """Run all performance tests."""
     parser = argparse.ArgumentParser(description="Run all sorting algorithm performance tests.")
@@ -14,6 +53,9 @@ def main():
     parser.add_argument("--tests", type=int, default=5, help="Number of tests to run for each test type (default: 5)")
     parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000, 20000],
                         help="List of array sizes for comparison (default: 1000 5000 10000 20000)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Run the size and distribution comparisons on this many processes, with shared inputs")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the input arrays (default: 0)")
     args = parser.parse_args()
     
     # Create the output directory if it doesn't exist
@@ -21,22 +63,30 @@ def main():
     
     print("Running all sorting algorithm performance tests...")
     
+    if args.workers:
+        print(f"\nComparing sizes and distributions on {args.workers} worker process(es)...")
+        run_parallel(args)
+        print("\nAll tests completed! Results have been saved to the output directory.")
+        return
+    
     # Run a single test
     print("\n1. Running a single test...")
-    subprocess.run(["python", "sorting_performance/run_single_test.py", "--size", str(args.size)])
+    subprocess.run(["python", "sorting_performance/run_single_test.py", "--size", str(args.size), "--seed", str(args.seed)])
     
     # Run multiple tests
     print("\n2. Running multiple tests...")
-    subprocess.run(["python", "sorting_performance/run_multiple_tests.py", "--size", str(args.size), "--tests", str(args.tests)])
+    subprocess.run(["python", "sorting_performance/run_multiple_tests.py", "--size", str(args.size), "--tests", str(args.tests),
+                    "--seed", str(args.seed)])
     
     # Compare sizes
     print("\n3. Comparing different array sizes...")
     sizes_str = [str(size) for size in args.sizes]
-    subprocess.run(["python", "sorting_performance/compare_sizes.py", "--sizes"] + sizes_str + ["--tests", str(args.tests)])
+    subprocess.run(["python", "sorting_performance/compare_sizes.py", "--sizes"] + sizes_str + ["--tests", str(args.tests), "--seed", str(args.seed)])
     
     # Compare distributions
     print("\n4. Comparing different data distributions...")
-    subprocess.run(["python", "sorting_performance/compare_distributions.py", "--size", str(args.size), "--tests", str(args.tests)])
+    subprocess.run(["python", "sorting_performance/compare_distributions.py", "--size", str(args.size), "--tests", str(args.tests),
+                    "--seed", str(args.seed)])
     
     print("\nAll tests completed! Results have been saved to the sorting_performance/output directory.")
 
@@ -4,23 +4,40 @@ Script to run multiple performance tests and generate statistics.
 """
 
 import argparse
-from performance_test import run_multiple_tests, calculate_statistics, print_statistics, plot_results
+from performance_test import run_multiple_tests, calculate_statistics, print_statistics, plot_results, average_counts
+from instrumentation import print_counts
+from results_store import save_times
+from profiling import add_profile_arguments, profiler_from_args, save_profiles
 
 def main():
     """Run multiple performance tests and generate statistics."""
     parser = argparse.ArgumentParser(description="Run multiple sorting algorithm performance tests.")
     parser.add_argument("--size", type=int, default=10000, help="Size of the random arrays to generate (default: 10000)")
     parser.add_argument("--tests", type=int, default=10, help="Number of tests to run (default: 10)")
+    parser.add_argument("--no-store", action="store_true", help="Don't save the raw times to the result store")
+    parser.add_argument("--instrument", action="store_true",
+                        help="Also count comparisons, element writes, allocations and peak memory of each algorithm")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the input arrays (default: 0)")
+    add_profile_arguments(parser)
     args = parser.parse_args()
     
     print(f"Running {args.tests} tests with arrays of size {args.size}...")
     
     # Run tests
-    results = run_multiple_tests(args.tests, args.size)
+    counts = {} if args.instrument else None
+    profiler = profiler_from_args(args)
+    results = run_multiple_tests(args.tests, args.size, counts=counts, seed=args.seed, profiler=profiler)
     
     # Calculate and print statistics
     stats = calculate_statistics(results)
     print_statistics(stats)
+    if counts:
+        print_counts(average_counts(counts))
+    save_profiles(profiler)
+    
+    if not args.no_store:
+        save_times({("Random", args.size): results}, "run_multiple_tests",
+                   counts={("Random", args.size): counts} if counts else None)
     
     # Plot results
     for metric in ["mean", "median", "min", "max", "stdev"]:
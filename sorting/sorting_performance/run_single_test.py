@@ -5,15 +5,22 @@ Script to run a single performance test with a specific array size.
 
 import argparse
 from performance_test import run_single_test
+from profiling import add_profile_arguments, profiler_from_args, save_profiles
 
 def main():
     """Run a single performance test with a specific array size."""
     parser = argparse.ArgumentParser(description="Run a single sorting algorithm performance test.")
     parser.add_argument("--size", type=int, default=10000, help="Size of the random array to generate (default: 10000)")
+    parser.add_argument("--instrument", action="store_true",
+                        help="Also count comparisons, element writes, allocations and peak memory of each algorithm")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the input arrays (default: 0)")
+    add_profile_arguments(parser)
     args = parser.parse_args()
     
     print(f"Running a single test with an array of size {args.size}...")
-    run_single_test(args.size)
+    profiler = profiler_from_args(args)
+    run_single_test(args.size, args.instrument, args.seed, profiler)
+    save_profiles(profiler)
     print("\nDone!")
 
 if __name__ == "__main__":
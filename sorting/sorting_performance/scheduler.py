@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Run the benchmark matrix (algorithm x distribution x size x trial) on a pool of processes.
+
+compare_sizes and compare_distributions time every cell one after the other on one core.
+This scheduler:
+
+- generates every input array once, from a seed derived from (seed, distribution, size,
+  trial), so every algorithm sorts identical data and reruns see identical data too
+- sends each (algorithm, input) cell to a process pool, largest inputs first, so that the
+  slow cells don't end up alone at the tail of the run
+- pins each worker process to its own CPU, where the platform supports it, so workers
+  don't migrate between cores and disturb each other's caches
+- merges every measurement into a single list of records, which can be saved to JSON
+
+Each cell is still a single timed call, as in test_sorting_algorithm, so with N idle
+cores the wall-clock time of the matrix drops close to N-fold.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import Value
+from typing import Dict, List, Optional, Tuple
+
+# Add parent directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.algorithms import SORTING_ALGORITHMS, INTEGER_SORTING_ALGORITHMS
+from benchmark import time_round, save_results
+from distributions import ARRAY_GENERATORS, ADVERSARIES, DISTRIBUTION_KINDS, generate_array, input_seed
+
+def available_cpus() -> List[int]:
+    """CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+def pin_worker(counter, cpus: List[int]) -> None:
+    # pool initializer: give each worker the next CPU from the list
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+
+def can_sort(algorithm: str, distribution: str) -> bool:
+    """Whether an algorithm can sort a distribution.
+
+    The integer-only sorts need "int" elements, and an adversary can't be built against
+    them, since it has to see the comparisons.
+    """
+    if algorithm not in INTEGER_SORTING_ALGORITHMS:
+        return True
+    return DISTRIBUTION_KINDS[distribution] == "int" and distribution not in ADVERSARIES
+
+def time_cell(algorithm: str, array: List[int], disable_gc: bool) -> Tuple[float, Optional[int]]:
+    """Time one call of an algorithm on a copy of array in a worker, returning seconds and the CPU used."""
+    seconds = time_round(SORTING_ALGORITHMS[algorithm], array, 1, disable_gc) / 1e9
+    cpu = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else None
+    return seconds, min(cpu) if cpu and len(cpu) == 1 else None
+
+def run_matrix(cells: List[Tuple[str, int]], algorithms: Optional[List[str]] = None, num_tests: int = 5,
+               workers: Optional[int] = None, seed: int = 0, pin: bool = True,
+               disable_gc: bool = True) -> List[Dict]:
+    """Time every algorithm on every (distribution, size) cell in parallel.
+
+    Args:
+        cells: List of (distribution, size) pairs to test
+        algorithms: Names from SORTING_ALGORITHMS (default: all)
+        num_tests: Number of input arrays (trials) per cell
+        workers: Number of worker processes (default: one per available CPU)
+        seed: Seed of the input arrays
+        pin: Pin each worker to one CPU
+        disable_gc: Disable the garbage collector while a sort is timed
+
+    Returns:
+        List of records with the algorithm, distribution, size, trial, input seed, time in
+        seconds and the CPU the worker was pinned to. Algorithms that can't sort a
+        distribution (see can_sort) have no records for it
+    """
+    algorithms = algorithms or list(SORTING_ALGORITHMS)
+    cpus = available_cpus()
+    workers = workers or len(cpus)
+
+    # one array per (distribution, size, trial), shared by every algorithm
+    inputs = {}
+    for distribution, size in dict.fromkeys(cells):
+        for trial in range(num_tests):
+            inputs[distribution, size, trial] = generate_array(distribution, size, seed, trial)
+
+    for distribution in dict.fromkeys(distribution for distribution, _ in cells):
+        for algorithm in algorithms:
+            if not can_sort(algorithm, distribution):
+                print(f"{algorithm} ({distribution}): skipped, it can't sort this distribution")
+
+    # largest inputs first, the longest cells should start early
+    tasks = [(algorithm, key) for key in inputs for algorithm in algorithms if can_sort(algorithm, key[0])]
+    tasks.sort(key=lambda task: -task[1][1])
+
+    initializer, initargs = None, ()
+    if pin and hasattr(os, "sched_setaffinity"):
+        initializer, initargs = pin_worker, (Value("i", 0), cpus)
+
+    records = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as executor:
+        futures = {executor.submit(time_cell, algorithm, inputs[key], disable_gc): (algorithm, key)
+                   for algorithm, key in tasks}
+        for done, future in enumerate(as_completed(futures), 1):
+            algorithm, (distribution, size, trial) = futures[future]
+            seconds, cpu = future.result()
+            records.append({
+                "algorithm": algorithm,
+                "distribution": distribution,
+                "size": size,
+                "trial": trial,
+                "seed": input_seed(seed, distribution, size, trial),
+                "time": seconds,
+                "cpu": cpu,
+            })
+            print(f"[{done}/{len(futures)}] {algorithm} ({distribution}, n={size}, trial {trial+1}): "
+                  f"{seconds:.6f} seconds")
+
+    # completion order depends on scheduling, sort so the dataset doesn't
+    records.sort(key=lambda r: (r["distribution"], r["size"], r["algorithm"], r["trial"]))
+    return records
+
+def times_by_cell(records: List[Dict]) -> Dict[Tuple[str, int], Dict[str, List[float]]]:
+    """Group the times of the records by (distribution, size), then by algorithm."""
+    grouped = {}
+    for r in records:
+        grouped.setdefault((r["distribution"], r["size"]), {}).setdefault(r["algorithm"], []).append(r["time"])
+    return grouped
+
+def print_matrix(records: List[Dict]) -> None:
+    """Print the median and the worst time of every algorithm in every cell."""
+    print(f"\n{'Distribution':<22} {'Size':>8} {'Algorithm':<22} {'Median (s)':>12} {'Worst (s)':>12} {'Trials':>7}")
+    for (distribution, size), algorithms in times_by_cell(records).items():
+        for algorithm, times in algorithms.items():
+            print(f"{distribution:<22} {size:>8} {algorithm:<22} {statistics.median(times):>12.6f} "
+                  f"{max(times):>12.6f} {len(times):>7}")
+
+def main():
+    """Run the benchmark matrix on a process pool."""
+    parser = argparse.ArgumentParser(description="Run the sorting benchmark matrix on a pool of processes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000, 20000],
+                        help="List of array sizes to test (default: 1000 5000 10000 20000)")
+    parser.add_argument("--distributions", nargs="+", choices=list(ARRAY_GENERATORS), default=list(ARRAY_GENERATORS),
+                        help="Distributions to test (default: all)")
+    parser.add_argument("--algorithms", nargs="+", choices=list(SORTING_ALGORITHMS), default=None,
+                        help="Algorithms to test (default: all)")
+    parser.add_argument("--tests", type=int, default=5, help="Number of input arrays per cell (default: 5)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"Number of worker processes (default: {len(available_cpus())})")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the input arrays (default: 0)")
+    parser.add_argument("--no-pin", action="store_true", help="Don't pin workers to CPUs")
+    parser.add_argument("--save", default=None, help="Save the merged dataset to this JSON file")
+    args = parser.parse_args()
+
+    cells = [(distribution, size) for distribution in args.distributions for size in args.sizes]
+
+    start_time = time.perf_counter()
+    records = run_matrix(cells, args.algorithms, args.tests, args.workers, args.seed, not args.no_pin)
+    print_matrix(records)
+    print(f"\nRan {len(records)} cells in {time.perf_counter() - start_time:.1f} seconds")
+
+    if args.save:
+        save_results(records, args.save)
+        print(f"Dataset has been saved to {args.save}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+import gc
+from benchmark import benchmark
+
+def test_calibrate_keeps_the_gc_setting():
+    states = []
+    def sort_func(arr):
+        states.append(gc.isenabled())
+        return sorted(arr)
+    benchmark(sort_func, [3, 1, 2], rounds=1, warmup=0, min_time=0.001, disable_gc=False)
+    assert all(states)  # The calibration rounds ran with the collector on too
+    states.clear()
+    benchmark(sort_func, [3, 1, 2], rounds=1, warmup=0, min_time=0.001)
+    assert not any(states)
@@ -0,0 +1,45 @@
+import math
+import pytest
+from complexity import MAX_SIZE, fit_complexity, predict, size_for_time, exceeds_budget
+
+SIZES = [1000, 2000, 4000, 8000, 16000]
+
+@pytest.mark.parametrize("model, f", [
+    ("O(n)", lambda n: 2e-7 * n),
+    ("O(n log n)", lambda n: 3e-8 * n * math.log2(n)),
+    ("O(n²)", lambda n: 1e-9 * n * n),
+])
+def test_fit_picks_the_model_of_synthetic_timings(model, f):
+    noise = [1.02, 0.98, 1.01, 0.99, 1.0]  # 2% noise doesn't change the choice
+    fit = fit_complexity(SIZES, [f(n) * e for n, e in zip(SIZES, noise)])
+    assert fit["best"] == model
+    assert predict(fit, 64000) == pytest.approx(f(64000), rel=0.05)
+
+def test_power_law_exponent():
+    fit = fit_complexity(SIZES, [1e-9 * n * n for n in SIZES])
+    assert fit["power_law"]["exponent"] == pytest.approx(2)
+    assert fit["models"]["O(n²)"]["r2"] == pytest.approx(1)
+
+def test_size_for_time():
+    fit = fit_complexity(SIZES, [1e-9 * n * n for n in SIZES])
+    size = size_for_time(fit, 1.0)
+    assert size == 31622  # sqrt(1e9)
+    assert predict(fit, size) <= 1.0 < predict(fit, size + 1)  # The largest size within budget
+    assert size_for_time(fit, 1.0, "O(n)") > size  # Another model extrapolates differently
+
+def test_size_for_time_limits():
+    fit = fit_complexity(SIZES, [1e-9 * n for n in SIZES])
+    assert size_for_time(fit, 1e-12) is None  # Not even one element fits
+    assert size_for_time(fit, 1e30) == MAX_SIZE  # Never over budget, and not a size beyond the search
+    assert predict(fit, size_for_time(fit, 1e9)) <= 1e9
+
+def test_exceeds_budget():
+    assert not exceeds_budget([], [], 1000, 1.0)
+    assert exceeds_budget([1000], [2.0], 2000, 1.0)  # Already over budget
+    assert exceeds_budget([1000], [0.6], 2000, 1.0)  # At least linear growth
+    assert exceeds_budget([1000, 2000], [0.1, 0.4], 4000, 1.0)  # Quadratic: 1.6 s predicted
+    assert not exceeds_budget([1000, 2000], [0.1, 0.2], 4000, 1.0)  # Linear: 0.4 s predicted
+
+def test_fit_needs_two_sizes():
+    with pytest.raises(ValueError):
+        fit_complexity([1000, 1000], [0.1, 0.2])
@@ -0,0 +1,34 @@
+import os
+import pytest
+
+np = pytest.importorskip("numpy")
+import datasets
+from datasets import load_dataset, dataset_path
+
+def test_second_load_reads_the_cached_file(tmp_path, monkeypatch):
+    first = load_dataset("Random", 1000, seed=3, cache_dir=str(tmp_path))
+    path = dataset_path("Random", 1000, seed=3, cache_dir=str(tmp_path))
+    modified = os.stat(path).st_mtime_ns
+
+    def fail(*args, **kwargs):
+        raise AssertionError("generated again instead of read from the cache")
+    monkeypatch.setattr(datasets, "generate_dataset", fail)
+    second = load_dataset("Random", 1000, seed=3, cache_dir=str(tmp_path))
+    assert isinstance(second, np.memmap)  # Memory-mapped from the file
+    assert second.tobytes() == first.tobytes()  # Byte-identical input
+    assert os.stat(path).st_mtime_ns == modified  # The file wasn't rewritten
+    assert [p.name for p in tmp_path.iterdir()] == ["random-n1000-s3-int64.npy"]
+
+def test_other_seed_or_dtype_gets_its_own_file(tmp_path):
+    base = load_dataset("Random", 1000, seed=3, cache_dir=str(tmp_path))
+    other_seed = load_dataset("Random", 1000, seed=4, cache_dir=str(tmp_path))
+    other_dtype = load_dataset("Random", 1000, seed=3, dtype="int32", cache_dir=str(tmp_path))
+    assert other_seed.tobytes() != base.tobytes()
+    assert other_dtype.dtype == np.int32 and other_dtype.tolist() == base.tolist()  # Same values, new file
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "random-n1000-s3-int32.npy", "random-n1000-s3-int64.npy", "random-n1000-s4-int64.npy"]
+
+def test_dataset_is_read_only(tmp_path):
+    arr = load_dataset("Zipf", 100, cache_dir=str(tmp_path))
+    with pytest.raises(ValueError):
+        arr[0] = 1  # Copy it before sorting
@@ -0,0 +1,52 @@
+import pytest
+from distributions import Antiqsort, AdversaryItem, generate_antiqsort_array
+
+def middle_pivot_quicksort(arr, counter):
+    # textbook Lomuto quicksort with the middle element as pivot, counting comparisons
+    stack = [(0, len(arr) - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        if lo >= hi:
+            continue
+        mid = (lo + hi) // 2
+        arr[mid], arr[hi] = arr[hi], arr[mid]
+        pivot = arr[hi]
+        store = lo
+        for i in range(lo, hi):
+            counter[0] += 1
+            if arr[i] < pivot:
+                arr[i], arr[store] = arr[store], arr[i]
+                store += 1
+        arr[store], arr[hi] = arr[hi], arr[store]
+        stack.append((lo, store - 1))
+        stack.append((store + 1, hi))
+    return arr
+
+def test_antiqsort_forces_quadratic_comparisons():
+    import random
+    n = 500
+    array = generate_antiqsort_array(lambda arr: middle_pivot_quicksort(arr, [0]), n)
+    assert sorted(array) == list(range(n))  # A permutation, like McIlroy's
+    counter = [0]
+    assert middle_pivot_quicksort(array.copy(), counter) == list(range(n))
+    assert counter[0] == n * (n - 1) // 2  # Every partition peels off one element
+    random.seed(7)
+    counter = [0]
+    middle_pivot_quicksort(random.sample(range(n), n), counter)
+    assert counter[0] < n * (n - 1) // 10  # Far more than a random input takes
+
+def test_antiqsort_freezes_the_pivot_candidate():
+    adversary = Antiqsort(3)
+    assert AdversaryItem(adversary, 0) > AdversaryItem(adversary, 1)  # Neither is the candidate, the second is frozen
+    assert adversary.values == [2, 0, 2]
+    assert AdversaryItem(adversary, 0) < AdversaryItem(adversary, 2)  # 0 survived, so it is the candidate and is frozen
+    assert adversary.values == [1, 0, 2]
+
+def test_dataset_dtype_follows_distribution_kind(tmp_path):
+    np = pytest.importorskip("numpy")
+    from datasets import generate_dataset, load_dataset
+    arr = load_dataset("Floats with Infinities", 1000, cache_dir=str(tmp_path))
+    assert arr.dtype == np.float64 and np.isinf(arr).any()  # Infinities survive the default dtype
+    assert load_dataset("Zipf", 100, cache_dir=str(tmp_path)).dtype == np.int64
+    with pytest.raises(ValueError):
+        generate_dataset("Floats with Infinities", 1000, dtype="int64")  # Would turn the infinities into ints
@@ -0,0 +1,46 @@
+import pytest
+import tracemalloc
+from instrumentation import CountingKey, CountingList, count_operations
+from sorting.algorithms import SORTING_ALGORITHMS
+
+def test_comparisons_on_a_known_input():
+    counts = count_operations(SORTING_ALGORITHMS["Selection Sort"], [5, 4, 3, 2, 1])
+    assert counts["comparisons"] == 10  # 4 + 3 + 2 + 1 scans for the smallest
+    counts = count_operations(SORTING_ALGORITHMS["Insertion Sort"], [1, 2, 3, 4, 5])
+    assert counts["comparisons"] == 4  # One comparison per element on sorted input
+
+def test_writes_of_in_place_sorts():
+    counts = count_operations(SORTING_ALGORITHMS["Heap Sort"], list(range(100, 0, -1)))
+    assert counts["writes"] > 100
+    assert counts["allocations"] is not None and counts["peak_memory"] is not None
+
+def test_writes_are_none_for_sorts_returning_a_new_list():
+    for name in ["Merge Sort", "Quick Sort", "Selection Sort"]:
+        counts = count_operations(SORTING_ALGORITHMS[name], list(range(100, 0, -1)))
+        assert counts["writes"] is None  # Not a misleading 0
+        assert counts["allocations"] >= 1  # At least the new list
+
+def test_integer_sorts_run_on_plain_values():
+    counts = count_operations(SORTING_ALGORITHMS["Counting Sort"], [3, 1, 2])
+    assert counts["comparisons"] is None
+    assert counts["writes"] == 3
+
+def test_without_memory_measurement():
+    counts = count_operations(SORTING_ALGORITHMS["Heap Sort"], [3, 1, 2], measure_memory=False)
+    assert counts["allocations"] is None and counts["peak_memory"] is None
+    assert not tracemalloc.is_tracing()
+
+def test_timed_runs_are_not_instrumented(monkeypatch, tmp_path):
+    import datasets
+    from performance_test import run_multiple_tests
+    monkeypatch.setattr(datasets, "DEFAULT_CACHE_DIR", str(tmp_path))
+    seen = []
+    def probe(arr):
+        seen.append((type(arr), {type(x) for x in arr}, tracemalloc.is_tracing()))
+        return sorted(arr)
+    run_multiple_tests(1, 20, {"Probe": probe})
+    assert seen == [(list, {int}, False)]  # Plain list of plain ints, nothing traced
+    seen.clear()
+    run_multiple_tests(1, 20, {"Probe": probe}, counts={})
+    assert seen[0] == (list, {int}, False)  # The timed run stays plain
+    assert seen[1] == (CountingList, {CountingKey}, True)  # Only the extra run is wrapped
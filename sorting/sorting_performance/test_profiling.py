@@ -0,0 +1,45 @@
+import json
+import time
+import pytest
+from profiling import CellProfiler, cell_name
+from sorting.algorithms import SORTING_ALGORITHMS
+
+def test_profile_writes_one_flame_graph_per_cell(tmp_path):
+    calls = []
+    def counted_sort(arr):
+        calls.append(len(arr))
+        return SORTING_ALGORITHMS["Insertion Sort"](arr)
+
+    profiler = CellProfiler("deterministic")
+    array = [5, 3, 6, 2, 10] * 20
+    profiler.profile("Insertion Sort", "Random", 100, counted_sort, array)
+    profiler.profile("Insertion Sort", "Random", 100, counted_sort, array)  # Same cell, not profiled again
+    assert calls == [100]
+    assert array == [5, 3, 6, 2, 10] * 20  # A copy is sorted
+
+    profiler.save(str(tmp_path))
+    name = cell_name("Insertion Sort", "Random", 100)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "hot_functions.txt", f"{name}.collapsed.txt", f"{name}.speedscope.json"]
+    collapsed = (tmp_path / f"{name}.collapsed.txt").read_text().splitlines()
+    assert all(line.startswith("counted_sort (test_profiling.py:") for line in collapsed)  # Stacks start at the sort
+    assert any(";insertion_sort (insertion_sort.py:" in line for line in collapsed)  # And name the sort function
+    assert all(int(line.rsplit(" ", 1)[1]) >= 0 for line in collapsed)
+    speedscope = json.loads((tmp_path / f"{name}.speedscope.json").read_text())
+    assert speedscope["name"] == "Insertion Sort, Random, n=100"
+    assert "insertion_sort" in (tmp_path / "hot_functions.txt").read_text()
+
+def test_sampling_profile_names_the_sort(tmp_path):
+    def sleepy_sort(arr):
+        time.sleep(0.05)
+        return sorted(arr)
+
+    profiler = CellProfiler("sampling", interval=0.001)
+    profiler.profile("Sleepy Sort", "Random", 3, sleepy_sort, [3, 1, 2])
+    profiler.save(str(tmp_path))
+    collapsed = (tmp_path / f"{cell_name('Sleepy Sort', 'Random', 3)}.collapsed.txt").read_text()
+    assert collapsed.startswith("sleepy_sort (test_profiling.py:")
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        CellProfiler("tracing")
@@ -0,0 +1,52 @@
+import pytest
+import platform
+import results_store
+from results_store import connect, save_times, load_samples, compare_commits, mann_whitney_greater, trend
+
+def save_commit(monkeypatch, db_path, commit, times, created="2024-01-01T00:00:00"):
+    monkeypatch.setattr(results_store, "git_commit", lambda: (commit, False))
+    monkeypatch.setattr(results_store.time, "strftime", lambda format: created)
+    return save_times({("Random", 1000): {"Tim Sort": times}}, "test", str(db_path))
+
+def test_samples_round_trip(tmp_path, monkeypatch):
+    save_commit(monkeypatch, tmp_path / "results.db", "aaaa", [0.5, 0.25, 0.75])
+    samples = load_samples(connect(str(tmp_path / "results.db")), "aaaa")
+    key = ("Tim Sort", 1000, "Random", platform.python_version(), platform.node())
+    assert samples == {key: [0.5, 0.25, 0.75]}  # Every time, in trial order
+
+def test_clearly_slower_commit_is_flagged(tmp_path, monkeypatch):
+    base = [1.0 + i / 100 for i in range(10)]
+    save_commit(monkeypatch, tmp_path / "results.db", "aaaa", base)
+    save_commit(monkeypatch, tmp_path / "results.db", "bbbb", [t * 1.2 for t in base])
+    [comparison] = compare_commits(connect(str(tmp_path / "results.db")), "aaaa", "bbbb")
+    assert comparison["status"] == "slower"
+    assert comparison["ratio"] == pytest.approx(1.2)
+    [comparison] = compare_commits(connect(str(tmp_path / "results.db")), "bbbb", "aaaa")
+    assert comparison["status"] == "faster"  # The same samples the other way round
+
+def test_identical_samples_are_not_flagged(tmp_path, monkeypatch):
+    times = [1.0, 1.1, 0.9, 1.05, 0.95]
+    save_commit(monkeypatch, tmp_path / "results.db", "aaaa", times)
+    save_commit(monkeypatch, tmp_path / "results.db", "bbbb", times)
+    [comparison] = compare_commits(connect(str(tmp_path / "results.db")), "aaaa", "bbbb")
+    assert comparison["status"] == "unchanged"
+    assert comparison["p_slower"] > 0.5 and comparison["p_faster"] > 0.5
+
+def test_mann_whitney_small_samples():
+    assert mann_whitney_greater([2], [1]) == pytest.approx(0.5)  # One pair can never be significant
+    assert mann_whitney_greater([4, 5, 6], [1, 2, 3]) == pytest.approx(0.0404, abs=1e-4)  # Exact test gives 0.05
+    assert mann_whitney_greater([1, 2, 3], [4, 5, 6]) > 0.95
+
+def test_mann_whitney_ties():
+    assert mann_whitney_greater([1, 1, 1], [1, 1, 1]) == 1.0  # All tied, no variance
+    # average ranks 2, 5.5 and 9 for the tied values 1, 2 and 3
+    assert mann_whitney_greater([1, 2, 2, 3, 3], [1, 1, 2, 2, 3]) == pytest.approx(0.2534, abs=1e-4)
+
+def test_trend(tmp_path, monkeypatch):
+    save_commit(monkeypatch, tmp_path / "results.db", "bbbb", [3.0, 3.0, 3.0], "2024-01-02T00:00:00")
+    save_commit(monkeypatch, tmp_path / "results.db", "aaaa", [1.0, 2.0, 3.0], "2024-01-01T00:00:00")
+    connection = connect(str(tmp_path / "results.db"))
+    rows = trend(connection, algorithm="Tim Sort")
+    # in the order the commits were measured, not the order they were saved
+    assert [(row["commit"], row["median"], row["change"]) for row in rows] == [("aaaa", 2.0, None), ("bbbb", 3.0, 0.5)]
+    assert trend(connection, algorithm="Merge Sort") == []
@@ -0,0 +1,14 @@
+import pytest
+from scheduler import can_sort, time_cell
+
+def test_can_sort():
+    assert can_sort("Counting Sort", "Random")
+    assert not can_sort("Counting Sort", "Floats with Infinities")  # Integer-only sort, float elements
+    assert not can_sort("LSD Radix Sort", "Antiqsort Adversary")  # No comparisons to build the adversary from
+    assert can_sort("Merge Sort", "Long Prefix Strings")
+
+def test_time_cell_raises_errors_of_the_sort():
+    seconds, _ = time_cell("Merge Sort", [3, 1, 2], True)
+    assert seconds >= 0
+    with pytest.raises(TypeError):
+        time_cell("Counting Sort", [0.5, 1.5], True)  # Not hidden as a skipped cell
@@ -0,0 +1,79 @@
+import pytest
+from sorting.algorithms import SORTING_ALGORITHMS
+
+# the cases every sort shares, see "Key Functions and Stability" in README.md; the test
+# file of each algorithm only covers what is specific to it
+
+RECORDS = [("b", 2), ("a", 2), ("c", 1), ("d", 3), ("e", 1)]
+
+# sorts that keep equal elements in input order without a key; the radix and counting
+# sorts are stable too, but only sort integers, whose order can't be told apart
+STABLE_WITHOUT_KEY = [name for name in SORTING_ALGORITHMS
+                      if name not in ("In-Place Quick Sort", "Heap Sort", "LSD Radix Sort", "MSD Radix Sort", "Counting Sort")]
+
+# sorts that rearrange the list they are given and return it
+IN_PLACE = ["Insertion Sort", "In-Place Quick Sort", "Bottom-Up Merge Sort", "Tim Sort", "Full Tim Sort", "Heap Sort",
+            "LSD Radix Sort", "MSD Radix Sort", "Counting Sort"]
+
+@pytest.mark.parametrize("name", SORTING_ALGORITHMS)
+def test_key_keeps_ties_in_input_order(name):
+    sort_func = SORTING_ALGORITHMS[name]
+    assert sort_func(RECORDS.copy(), key=lambda r: r[1]) == [("c", 1), ("e", 1), ("b", 2), ("a", 2), ("d", 3)]
+
+@pytest.mark.parametrize("name", SORTING_ALGORITHMS)
+def test_reverse(name):
+    sort_func = SORTING_ALGORITHMS[name]
+    assert sort_func(RECORDS.copy(), key=lambda r: r[1], reverse=True) == [("d", 3), ("b", 2), ("a", 2), ("c", 1), ("e", 1)]  # Stable in reverse too
+    assert sort_func([3, 1, 2], reverse=True) == [3, 2, 1]  # Reverse without a key
+
+@pytest.mark.parametrize("name", SORTING_ALGORITHMS)
+def test_key_computed_once(name):
+    calls = []
+    def key(x):
+        calls.append(x)
+        return -x
+    assert SORTING_ALGORITHMS[name]([3, 1, 2, 5, 4], key=key) == [5, 4, 3, 2, 1]
+    assert len(calls) == 5  # One key call per element
+
+@pytest.mark.parametrize("name", SORTING_ALGORITHMS)
+def test_key_random_large_array(name):
+    import random
+    random.seed(7)
+    sort_func = SORTING_ALGORITHMS[name]
+    array = [(random.randint(0, 20), i) for i in range(1000)]
+    assert sort_func(array.copy(), key=lambda r: r[0]) == sorted(array, key=lambda r: r[0])  # Same order as the stable built-in sort
+    assert sort_func(array.copy(), key=lambda r: r[0], reverse=True) == sorted(array, key=lambda r: r[0], reverse=True)
+
+@pytest.mark.parametrize("name", IN_PLACE)
+def test_key_sorts_in_place(name):
+    array = ["ccc", "a", "bb"]
+    assert SORTING_ALGORITHMS[name](array, key=len) is array
+    assert array == ["a", "bb", "ccc"]
+
+@pytest.mark.parametrize("name", STABLE_WITHOUT_KEY)
+def test_stable_without_key(name):
+    import functools
+    import random
+
+    @functools.total_ordering
+    class Record:
+        def __init__(self, key):
+            self.key = key
+
+        def __eq__(self, other):
+            return self.key == other.key
+
+        def __lt__(self, other):
+            return self.key < other.key
+
+    random.seed(3)
+    records = [Record(random.randint(0, 9)) for _ in range(200)]
+    result = SORTING_ALGORITHMS[name](records.copy())
+    assert [id(r) for r in result] == [id(r) for r in sorted(records, key=lambda r: r.key)]  # Equal elements keep their input order
+
+@pytest.mark.parametrize("name", SORTING_ALGORITHMS)
+def test_read_only_buffer_returns_new_list(name):
+    sort_func = SORTING_ALGORITHMS[name]
+    assert sort_func(b"hello") == sorted(b"hello")  # bytes can't be changed, so a new list comes back
+    with pytest.raises(TypeError):
+        sort_func(b"hello", inplace=True)  # Asking to sort it in place is an error
@@ -2,9 +2,11 @@
 Timsort implementation module.
 
 This module provides a simplified implementation of the Timsort algorithm,
-which is a hybrid sorting algorithm derived from merge sort and insertion sort.
+which is a hybrid sorting algorithm derived from merge sort and insertion sort,
+and a full implementation with natural-run detection and galloping merges.
 """
 
 from .simplified_timsort import simplified_timsort
+from .timsort import timsort
 
-__all__ = ["simplified_timsort"] 
\ No newline at end of file
+__all__ = ["simplified_timsort", "timsort"] 
\ No newline at end of file
@@ -1,3 +1,12 @@
+import os
+import sys
+
+# Add root directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.buffers import buffer_sort
+from sorting.decorate import sort_with_key
+
 # from ..insertion_sort.insertion_sort import insertion_sort
 
 
@@ -61,7 +70,18 @@ def merge(arr, left, mid, right):
 
     # return arr
 
-def simplified_timsort(arr):
+@buffer_sort()
+def simplified_timsort(arr, backend="python", key=None, reverse=False):
+    if key is not None or reverse:
+        if backend != "python":
+            raise ValueError("key and reverse are only supported by the python backend")
+        return sort_with_key(simplified_timsort, arr, key, reverse, in_place=True)
+    if backend == "numpy":
+        from sorting.numpy_backend.numpy_backend import numpy_timsort
+        return numpy_timsort(arr)
+    if backend != "python":
+        raise ValueError(f"Unknown backend {backend!r}, expected 'python' or 'numpy'")
+
     n = len(arr)
     min_run = find_min_run(n)
     # min_run = 32
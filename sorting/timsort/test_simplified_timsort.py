@@ -51,4 +51,10 @@ def test_simplified_timsort_random_large_array():
     random.seed(42)  # For reproducibility
     array = random.sample(range(1, 1000), 100)
     sorted_array = sorted(array.copy())
-    assert simplified_timsort(array.copy()) == sorted_array  # Random large array 
\ No newline at end of file
+    assert simplified_timsort(array.copy()) == sorted_array  # Random large array
+
+def test_simplified_timsort_array_key():
+    from array import array
+    values = array("q", [5, -3, 6, 2, -10])
+    simplified_timsort(values, key=abs)  # key works on buffers too
+    assert values.tolist() == [2, -3, 5, 6, -10]
@@ -0,0 +1,138 @@
+import pytest
+from timsort import timsort, compute_min_run, count_run_and_make_ascending, gallop_left, gallop_right
+
+class Counted:
+    """Wraps a value and counts every comparison made on it."""
+    comparisons = 0
+
+    def __init__(self, value, tag=None):
+        self.value = value
+        self.tag = tag
+
+    def __lt__(self, other):
+        Counted.comparisons += 1
+        return self.value < other.value
+
+def test_timsort_unsorted_array():
+    array = [5, 3, 6, 2, 10]
+    assert timsort(array.copy()) == [2, 3, 5, 6, 10]  # Should sort in ascending order
+
+def test_timsort_already_sorted():
+    array = [1, 2, 3, 4, 5]
+    assert timsort(array.copy()) == [1, 2, 3, 4, 5]  # Already sorted array
+
+def test_timsort_reverse_sorted():
+    array = [5, 4, 3, 2, 1]
+    assert timsort(array.copy()) == [1, 2, 3, 4, 5]  # Reverse sorted array
+
+def test_timsort_empty_array():
+    array = []
+    assert timsort(array.copy()) == []  # Empty array should return empty array
+
+def test_timsort_single_element():
+    array = [42]
+    assert timsort(array.copy()) == [42]  # Single element array
+
+def test_timsort_duplicate_elements():
+    array = [3, 1, 3, 2, 5, 1]
+    assert timsort(array.copy()) == [1, 1, 2, 3, 3, 5]  # Array with duplicate elements
+
+def test_timsort_negative_numbers():
+    array = [5, -1, 3, -7, 0, 10]
+    assert timsort(array.copy()) == [-7, -1, 0, 3, 5, 10]  # Array with negative numbers
+
+def test_timsort_same_elements():
+    array = [4, 4, 4, 4, 4]
+    assert timsort(array.copy()) == [4, 4, 4, 4, 4]  # Array with all same elements
+
+def test_timsort_sorts_in_place():
+    array = [3, 2, 1]
+    timsort(array)
+    assert array == [1, 2, 3]  # Input list is sorted in place
+
+def test_timsort_random_large_array():
+    import random
+    random.seed(42)  # For reproducibility
+    array = [random.randint(0, 1000) for _ in range(5000)]
+    assert timsort(array.copy()) == sorted(array)  # Random large array
+
+def test_timsort_interleaved_runs():
+    import random
+    random.seed(7)
+    array = []
+    for _ in range(40):
+        run = sorted(random.randint(0, 10000) for _ in range(random.randint(1, 300)))
+        if random.random() < 0.5:
+            run.reverse()
+        array.extend(run)
+    assert timsort(array.copy()) == sorted(array)  # Many ascending and descending runs
+
+def test_timsort_galloping_merge():
+    # two long runs where one side wins many comparisons in a row
+    array = list(range(0, 2000, 2)) + list(range(500, 700)) + list(range(1, 2000, 2))
+    assert timsort(array.copy()) == sorted(array)
+
+def test_timsort_is_stable():
+    import random
+    random.seed(3)
+    items = [Counted(random.randint(0, 20), tag=i) for i in range(3000)]
+    result = timsort(items.copy())
+    assert [(x.value, x.tag) for x in result] == sorted((x.value, x.tag) for x in items)
+
+def test_timsort_sorted_input_is_linear():
+    items = [Counted(i) for i in range(10000)]
+    Counted.comparisons = 0
+    timsort(items)
+    assert Counted.comparisons == len(items) - 1  # One pass to detect a single run
+
+def test_timsort_reverse_sorted_input_is_linear():
+    items = [Counted(i) for i in range(10000, 0, -1)]
+    Counted.comparisons = 0
+    timsort(items)
+    assert [x.value for x in items] == list(range(1, 10001))
+    assert Counted.comparisons == len(items) - 1  # Strictly descending run is reversed in place
+
+def test_timsort_nearly_sorted_input_is_near_linear():
+    items = [Counted(i) for i in range(10000)]
+    items[5000], items[5001] = items[5001], items[5000]
+    Counted.comparisons = 0
+    timsort(items)
+    assert [x.value for x in items] == list(range(10000))
+    assert Counted.comparisons < 2 * len(items)
+
+def test_compute_min_run():
+    assert compute_min_run(63) == 63
+    assert compute_min_run(64) == 32
+    assert compute_min_run(65) == 33
+    for n in range(64, 5000):
+        assert 32 <= compute_min_run(n) <= 64
+
+def test_count_run_reverses_descending_run():
+    array = [5, 4, 3, 7, 8]
+    assert count_run_and_make_ascending(array, 0, len(array)) == 3
+    assert array == [3, 4, 5, 7, 8]
+
+def test_count_run_does_not_reverse_equal_elements():
+    array = [2, 2, 1]
+    assert count_run_and_make_ascending(array, 0, len(array)) == 2  # Descending runs must be strict
+
+def test_gallop_left_and_right():
+    array = [1, 2, 2, 2, 3, 5, 8]
+    for hint in range(len(array)):
+        assert gallop_left(2, array, 0, len(array), hint) == 1
+        assert gallop_right(2, array, 0, len(array), hint) == 4
+        assert gallop_left(0, array, 0, len(array), hint) == 0
+        assert gallop_right(9, array, 0, len(array), hint) == len(array)
+
+def test_timsort_memoryview_reverse():
+    from array import array
+    view = memoryview(bytearray(array("q", [5, -3, 6, 2, 10]))).cast("q")
+    assert timsort(view, reverse=True) is view  # Writable buffers are sorted in place
+    assert view.tolist() == [10, 6, 5, 2, -3]
+
+def test_timsort_out():
+    from array import array
+    values = array("q", [5, -3, 6, 2, 10])
+    out = [0] * 5
+    assert timsort(values, out=out) is out  # A buffer can be sorted into a list
+    assert out == [-3, 2, 5, 6, 10] and values.tolist() == [5, -3, 6, 2, 10]
@@ -0,0 +1,424 @@
+import os
+import sys
+
+# Add root directory to path to import sorting modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from sorting.buffers import buffer_sort
+from sorting.decorate import sort_with_key
+
+# Once one run has won this many comparisons in a row, merge switches to galloping mode
+MIN_GALLOP = 7
+
+
+def compute_min_run(n):
+    # same as find_min_run in simplified_timsort, but with the 32-64 range used by CPython
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def reverse_range(arr, lo, hi):
+    hi -= 1
+    while lo < hi:
+        arr[lo], arr[hi] = arr[hi], arr[lo]
+        lo += 1
+        hi -= 1
+
+
+def count_run_and_make_ascending(arr, lo, hi):
+    """Return the length of the run starting at arr[lo], reversing it in place if it is descending.
+
+    Descending runs must be strictly descending so that reversing them keeps the sort stable.
+    """
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+
+    if arr[run_hi] < arr[lo]:
+        run_hi += 1
+        while run_hi < hi and arr[run_hi] < arr[run_hi - 1]:
+            run_hi += 1
+        reverse_range(arr, lo, run_hi)
+    else:
+        run_hi += 1
+        while run_hi < hi and not arr[run_hi] < arr[run_hi - 1]:
+            run_hi += 1
+
+    return run_hi - lo
+
+
+def binary_insertion_sort(arr, lo, hi, start):
+    # arr[lo:start] is already sorted, insert arr[start:hi] one by one
+    for i in range(start, hi):
+        pivot = arr[i]
+        left = lo
+        right = i
+        while left < right:
+            mid = (left + right) // 2
+            if pivot < arr[mid]:
+                right = mid
+            else:
+                left = mid + 1
+
+        # shift arr[left:i] one slot to the right and drop the pivot in
+        arr[left + 1:i + 1] = arr[left:i]
+        arr[left] = pivot
+
+
+def gallop_left(key, arr, base, length, hint):
+    """Return k such that arr[base+k-1] < key <= arr[base+k], starting the search at base+hint."""
+    last_ofs = 0
+    ofs = 1
+    if arr[base + hint] < key:
+        # gallop right until arr[base+hint+last_ofs] < key <= arr[base+hint+ofs]
+        max_ofs = length - hint
+        while ofs < max_ofs and arr[base + hint + ofs] < key:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs += hint
+        ofs += hint
+    else:
+        # gallop left until arr[base+hint-ofs] < key <= arr[base+hint-last_ofs]
+        max_ofs = hint + 1
+        while ofs < max_ofs and not arr[base + hint - ofs] < key:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+
+    # binary search for the exact position inside (last_ofs, ofs]
+    last_ofs += 1
+    while last_ofs < ofs:
+        mid = last_ofs + ((ofs - last_ofs) >> 1)
+        if arr[base + mid] < key:
+            last_ofs = mid + 1
+        else:
+            ofs = mid
+    return ofs
+
+
+def gallop_right(key, arr, base, length, hint):
+    """Return k such that arr[base+k-1] <= key < arr[base+k], starting the search at base+hint."""
+    last_ofs = 0
+    ofs = 1
+    if key < arr[base + hint]:
+        # gallop left until arr[base+hint-ofs] <= key < arr[base+hint-last_ofs]
+        max_ofs = hint + 1
+        while ofs < max_ofs and key < arr[base + hint - ofs]:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs, ofs = hint - ofs, hint - last_ofs
+    else:
+        # gallop right until arr[base+hint+last_ofs] <= key < arr[base+hint+ofs]
+        max_ofs = length - hint
+        while ofs < max_ofs and not key < arr[base + hint + ofs]:
+            last_ofs = ofs
+            ofs = (ofs << 1) + 1
+        if ofs > max_ofs:
+            ofs = max_ofs
+        last_ofs += hint
+        ofs += hint
+
+    last_ofs += 1
+    while last_ofs < ofs:
+        mid = last_ofs + ((ofs - last_ofs) >> 1)
+        if key < arr[base + mid]:
+            ofs = mid
+        else:
+            last_ofs = mid + 1
+    return ofs
+
+
+class MergeState:
+    """Run stack and galloping threshold shared by all merges of a single timsort call."""
+
+    def __init__(self, arr):
+        self.arr = arr
+        self.min_gallop = MIN_GALLOP
+        self.run_base = []
+        self.run_len = []
+
+    def push_run(self, base, length):
+        self.run_base.append(base)
+        self.run_len.append(length)
+
+    def merge_collapse(self):
+        # Keep the invariants on the top of the stack:
+        #   run_len[n-1] > run_len[n] + run_len[n+1]
+        #   run_len[n] > run_len[n+1]
+        # (also checking one level deeper, see the 2015 fix to the original invariant)
+        run_len = self.run_len
+        while len(run_len) > 1:
+            n = len(run_len) - 2
+            if (n > 0 and run_len[n - 1] <= run_len[n] + run_len[n + 1]) or \
+                    (n > 1 and run_len[n - 2] <= run_len[n - 1] + run_len[n]):
+                if run_len[n - 1] < run_len[n + 1]:
+                    n -= 1
+            elif run_len[n] > run_len[n + 1]:
+                break
+            self.merge_at(n)
+
+    def merge_force_collapse(self):
+        run_len = self.run_len
+        while len(run_len) > 1:
+            n = len(run_len) - 2
+            if n > 0 and run_len[n - 1] < run_len[n + 1]:
+                n -= 1
+            self.merge_at(n)
+
+    def merge_at(self, i):
+        arr = self.arr
+        base1 = self.run_base[i]
+        len1 = self.run_len[i]
+        base2 = self.run_base[i + 1]
+        len2 = self.run_len[i + 1]
+
+        self.run_len[i] = len1 + len2
+        del self.run_base[i + 1]
+        del self.run_len[i + 1]
+
+        # elements of run 1 that are <= run 2's first element are already in place
+        k = gallop_right(arr[base2], arr, base1, len1, 0)
+        base1 += k
+        len1 -= k
+        if len1 == 0:
+            return
+
+        # elements of run 2 that are >= run 1's last element are already in place
+        len2 = gallop_left(arr[base1 + len1 - 1], arr, base2, len2, len2 - 1)
+        if len2 == 0:
+            return
+
+        if len1 <= len2:
+            self.merge_lo(base1, len1, base2, len2)
+        else:
+            self.merge_hi(base1, len1, base2, len2)
+
+    def merge_lo(self, base1, len1, base2, len2):
+        # Merge left to right, copying only the (shorter) first run into a temporary list.
+        # Precondition: arr[base2] < arr[base1] and arr[base1+len1-1] > every element of run 2.
+        arr = self.arr
+        tmp = arr[base1:base1 + len1]
+        cursor1 = 0
+        cursor2 = base2
+        dest = base1
+
+        arr[dest] = arr[cursor2]
+        dest += 1
+        cursor2 += 1
+        len2 -= 1
+
+        if len2 > 0 and len1 > 1:
+            min_gallop = self.min_gallop
+            while True:
+                count1 = count2 = 0
+
+                # one element at a time until one run starts winning consistently
+                while True:
+                    if arr[cursor2] < tmp[cursor1]:
+                        arr[dest] = arr[cursor2]
+                        dest += 1
+                        cursor2 += 1
+                        len2 -= 1
+                        count2 += 1
+                        count1 = 0
+                        if len2 == 0 or count2 >= min_gallop:
+                            break
+                    else:
+                        arr[dest] = tmp[cursor1]
+                        dest += 1
+                        cursor1 += 1
+                        len1 -= 1
+                        count1 += 1
+                        count2 = 0
+                        if len1 == 1 or count1 >= min_gallop:
+                            break
+                if len2 == 0 or len1 == 1:
+                    break
+
+                # galloping mode: copy whole blocks found with exponential search
+                min_gallop += 1
+                while True:
+                    min_gallop -= min_gallop > 1
+
+                    count1 = gallop_right(arr[cursor2], tmp, cursor1, len1, 0)
+                    if count1:
+                        arr[dest:dest + count1] = tmp[cursor1:cursor1 + count1]
+                        dest += count1
+                        cursor1 += count1
+                        len1 -= count1
+                        if len1 <= 1:
+                            break
+                    arr[dest] = arr[cursor2]
+                    dest += 1
+                    cursor2 += 1
+                    len2 -= 1
+                    if len2 == 0:
+                        break
+
+                    count2 = gallop_left(tmp[cursor1], arr, cursor2, len2, 0)
+                    if count2:
+                        arr[dest:dest + count2] = arr[cursor2:cursor2 + count2]
+                        dest += count2
+                        cursor2 += count2
+                        len2 -= count2
+                        if len2 == 0:
+                            break
+                    arr[dest] = tmp[cursor1]
+                    dest += 1
+                    cursor1 += 1
+                    len1 -= 1
+                    if len1 == 1:
+                        break
+
+                    if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                        break
+                if len2 == 0 or len1 <= 1:
+                    break
+
+                # penalize leaving galloping mode
+                min_gallop += 1
+
+            self.min_gallop = max(min_gallop, 1)
+
+        if len1 == 1 and len2 > 0:
+            # the last element of run 1 belongs after everything left in run 2
+            arr[dest:dest + len2] = arr[cursor2:cursor2 + len2]
+            arr[dest + len2] = tmp[cursor1]
+        elif len1:
+            arr[dest:dest + len1] = tmp[cursor1:cursor1 + len1]
+
+    def merge_hi(self, base1, len1, base2, len2):
+        # Merge right to left, copying only the (shorter) second run into a temporary list.
+        # Precondition: arr[base2] < arr[base1] and arr[base1+len1-1] > every element of run 2.
+        arr = self.arr
+        tmp = arr[base2:base2 + len2]
+        cursor1 = base1 + len1 - 1
+        cursor2 = len2 - 1
+        dest = base2 + len2 - 1
+
+        arr[dest] = arr[cursor1]
+        dest -= 1
+        cursor1 -= 1
+        len1 -= 1
+
+        if len1 > 0 and len2 > 1:
+            min_gallop = self.min_gallop
+            while True:
+                count1 = count2 = 0
+
+                while True:
+                    if tmp[cursor2] < arr[cursor1]:
+                        arr[dest] = arr[cursor1]
+                        dest -= 1
+                        cursor1 -= 1
+                        len1 -= 1
+                        count1 += 1
+                        count2 = 0
+                        if len1 == 0 or count1 >= min_gallop:
+                            break
+                    else:
+                        arr[dest] = tmp[cursor2]
+                        dest -= 1
+                        cursor2 -= 1
+                        len2 -= 1
+                        count2 += 1
+                        count1 = 0
+                        if len2 == 1 or count2 >= min_gallop:
+                            break
+                if len1 == 0 or len2 == 1:
+                    break
+
+                min_gallop += 1
+                while True:
+                    min_gallop -= min_gallop > 1
+
+                    count1 = len1 - gallop_right(tmp[cursor2], arr, base1, len1, len1 - 1)
+                    if count1:
+                        dest -= count1
+                        cursor1 -= count1
+                        len1 -= count1
+                        arr[dest + 1:dest + 1 + count1] = arr[cursor1 + 1:cursor1 + 1 + count1]
+                        if len1 == 0:
+                            break
+                    arr[dest] = tmp[cursor2]
+                    dest -= 1
+                    cursor2 -= 1
+                    len2 -= 1
+                    if len2 <= 1:
+                        break
+
+                    count2 = len2 - gallop_left(arr[cursor1], tmp, 0, len2, len2 - 1)
+                    if count2:
+                        dest -= count2
+                        cursor2 -= count2
+                        len2 -= count2
+                        arr[dest + 1:dest + 1 + count2] = tmp[cursor2 + 1:cursor2 + 1 + count2]
+                        if len2 <= 1:
+                            break
+                    arr[dest] = arr[cursor1]
+                    dest -= 1
+                    cursor1 -= 1
+                    len1 -= 1
+                    if len1 == 0:
+                        break
+
+                    if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                        break
+                if len1 == 0 or len2 <= 1:
+                    break
+
+                min_gallop += 1
+
+            self.min_gallop = max(min_gallop, 1)
+
+        if len2 == 1 and len1 > 0:
+            # the first element of run 2 belongs before everything left in run 1
+            dest -= len1
+            cursor1 -= len1
+            arr[dest + 1:dest + 1 + len1] = arr[cursor1 + 1:cursor1 + 1 + len1]
+            arr[dest] = tmp[cursor2]
+        elif len2:
+            arr[dest - len2 + 1:dest + 1] = tmp[0:len2]
+
+
+@buffer_sort()
+def timsort(arr, key=None, reverse=False):
+    """Sort arr in place with natural-run detection, a balanced run stack and galloping merges."""
+    if key is not None or reverse:
+        return sort_with_key(timsort, arr, key, reverse, in_place=True)
+
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    state = MergeState(arr)
+    min_run = compute_min_run(n)
+
+    lo = 0
+    remaining = n
+    while remaining:
+        run_len = count_run_and_make_ascending(arr, lo, lo + remaining)
+
+        # extend short runs to min_run with binary insertion sort
+        if run_len < min_run:
+            force = min(remaining, min_run)
+            binary_insertion_sort(arr, lo, lo + force, lo + run_len)
+            run_len = force
+
+        state.push_run(lo, run_len)
+        state.merge_collapse()
+
+        lo += run_len
+        remaining -= run_len
+
+    state.merge_force_collapse()
+    return arr